@@ -0,0 +1,91 @@
+# scripts/migrate.py
+"""
+Migrate Database
+================
+Applies schema changes to an existing PostgreSQL database
+
+init_db.py only creates missing tables, so columns/indexes added to
+models.py later must be applied to existing databases here.
+Every statement is idempotent - safe to run more than once.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from src.db.session import engine
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# ============================================
+# MIGRATIONS (applied in order)
+# ============================================
+
+MIGRATIONS = [
+    (
+        "JSONB + GIN indexes for meetings.key_topics / meetings.participants",
+        [
+            "ALTER TABLE meetings ALTER COLUMN key_topics TYPE jsonb USING key_topics::jsonb",
+            "ALTER TABLE meetings ALTER COLUMN participants TYPE jsonb USING participants::jsonb",
+            "CREATE INDEX IF NOT EXISTS idx_meetings_key_topics_gin ON meetings USING gin (key_topics)",
+            "CREATE INDEX IF NOT EXISTS idx_meetings_participants_gin ON meetings USING gin (participants)",
+        ],
+    ),
+    (
+        "meetings.step_status for the resumable processing workflow",
+        [
+            "ALTER TABLE meetings ADD COLUMN IF NOT EXISTS step_status jsonb",
+        ],
+    ),
+    (
+        "meetings.word_count (stored instead of splitting the transcript per request)",
+        [
+            "ALTER TABLE meetings ADD COLUMN IF NOT EXISTS word_count integer",
+            "UPDATE meetings SET word_count = array_length(regexp_split_to_array(btrim(transcript), '\\s+'), 1) "
+            "WHERE btrim(transcript) <> '' AND word_count IS NULL",
+        ],
+    ),
+    (
+        "meetings.audio_bucket / meetings.audio_object_name (instead of parsing audio_file_path)",
+        [
+            "ALTER TABLE meetings ADD COLUMN IF NOT EXISTS audio_bucket varchar(63)",
+            "ALTER TABLE meetings ADD COLUMN IF NOT EXISTS audio_object_name varchar(512)",
+            "UPDATE meetings SET audio_bucket = split_part(audio_file_path, '/', 1), "
+            "audio_object_name = substr(audio_file_path, strpos(audio_file_path, '/') + 1) "
+            "WHERE audio_file_path LIKE '%/%' AND audio_object_name IS NULL",
+        ],
+    ),
+    (
+        "meetings.audio_hash for skipping duplicate uploads",
+        [
+            "ALTER TABLE meetings ADD COLUMN IF NOT EXISTS audio_hash varchar(80)",
+            "CREATE INDEX IF NOT EXISTS ix_meetings_audio_hash ON meetings (audio_hash)",
+        ],
+    ),
+]
+
+def main():
+    """Apply all migrations"""
+    logger.info("=" * 50)
+    logger.info("Migrating Database")
+    logger.info("=" * 50)
+    
+    try:
+        with engine.begin() as conn:
+            for name, statements in MIGRATIONS:
+                logger.info(f"→ {name}")
+                for statement in statements:
+                    conn.execute(text(statement))
+        logger.info("✅ Database migrated successfully!")
+    except Exception as e:
+        logger.error(f"❌ Database migration failed: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 @echo off
-echo Starting Celery Worker...
+echo Starting Celery Workers (gpu + io)...
 cd /d "%~dp0\.."
 call venv\Scripts\activate
-python scripts\start_celery.py
+start "Celery gpu" python scripts\start_celery.py gpu
+python scripts\start_celery.py io
 pause
\ No newline at end of file
@@ -7,27 +7,82 @@ Starts the Celery worker to process background tasks
 
 import sys
 from pathlib import Path
+import subprocess
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.tasks.celery_app import celery_app
+from src.config import get_settings
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# ============================================
+# WORKER FLEETS
+# ============================================
+# gpu: Whisper transcription (one model per process, CPU/GPU-bound)
+# io:  LLM API calls, DB, MinIO (mostly waiting on the network)
+
+FLEETS = {
+    "gpu": {
+        "queues": "gpu",
+        "pool": "solo" if sys.platform == 'win32' else "prefork",
+        "concurrency": 1,  # Match available GPU slots
+    },
+    "io": {
+        "queues": "io,notifications",
+        "pool": "threads",
+        "concurrency": 16,
+    },
+}
+
+def start_all_fleets():
+    """Run every fleet as its own worker process (no argument given)"""
+    logger.info(f"Starting all worker fleets: {', '.join(FLEETS)}")
+    processes = [
+        subprocess.Popen([sys.executable, __file__, name])
+        for name in FLEETS
+    ]
+    try:
+        for process in processes:
+            process.wait()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
 
 if __name__ == "__main__":
+    # Usage: python scripts/start_celery.py [gpu|io]  (no argument: both)
+    if len(sys.argv) == 1:
+        start_all_fleets()
+        sys.exit(0)
+    
+    fleet_name = sys.argv[1]
+    if fleet_name not in FLEETS:
+        sys.exit(f"Unknown worker fleet '{fleet_name}' (choose: {', '.join(FLEETS)})")
+    
+    fleet = FLEETS[fleet_name]
+    # The override only applies to the I/O fleet: the gpu fleet's
+    # concurrency is sized to the available GPU slots
+    concurrency = fleet["concurrency"]
+    if fleet_name == "io" and settings.CELERY_WORKER_CONCURRENCY:
+        concurrency = settings.CELERY_WORKER_CONCURRENCY
+    
     logger.info("=" * 60)
-    logger.info("Starting Celery Worker")
+    logger.info(f"Starting Celery Worker ({fleet_name})")
+    logger.info(f"   Queues: {fleet['queues']}")
+    logger.info(f"   Pool: {fleet['pool']} x {concurrency}")
     logger.info("=" * 60)
     
     # Start worker
     celery_app.worker_main([
         'worker',
         '--loglevel=info',
-        '--concurrency=2',  # Number of worker processes
-        '--queues=processing,notifications',
-        '--pool=solo' if sys.platform == 'win32' else '--pool=prefork'  # Windows uses solo
-    ])
\ No newline at end of file
+        f'--concurrency={concurrency}',
+        f'--queues={fleet["queues"]}',
+        f'--pool={fleet["pool"]}',
+        f'--hostname={fleet_name}@%h'
+    ])
@@ -15,6 +15,6 @@ echo.
 echo Access the app at: http://localhost:8501
 echo.
 
-streamlit run ui/app.py
+streamlit run ui/app.py --server.maxUploadSize=500
 
 pause
\ No newline at end of file
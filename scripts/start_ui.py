@@ -20,5 +20,7 @@ if __name__ == "__main__":
         sys.executable, "-m", "streamlit", "run",
         str(project_root / "ui" / "app.py"),
         "--server.port=8501",
-        "--server.address=localhost"
+        "--server.address=localhost",
+        # Uploads are capped at 200MB by default; the API accepts 500MB
+        "--server.maxUploadSize=500"
     ])
\ No newline at end of file
@@ -25,8 +25,8 @@ def test_storage():
     logger.info("\n1. Testing upload...")
     test_data = b"Hello, this is a test file!"
     file_obj = io.BytesIO(test_data)
-    path = storage.upload_file(file_obj, "test/hello.txt", "text/plain")
-    logger.info(f"   ✅ Uploaded: {path}")
+    bucket, object_name = storage.upload_file(file_obj, "test/hello.txt", "text/plain")
+    logger.info(f"   ✅ Uploaded: {bucket}/{object_name}")
     
     # Test 2: Download
     logger.info("\n2. Testing download...")
@@ -36,7 +36,7 @@ def test_storage():
     
     # Test 3: List files
     logger.info("\n3. Testing list files...")
-    files = storage.list_files("test/")
+    files = storage.list_files_all("test/")
     logger.info(f"   ✅ Found {len(files)} files: {files}")
     
     # Test 4: Presigned URL
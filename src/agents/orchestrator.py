@@ -64,7 +64,7 @@ class AgentOrchestrator:
         logger.info("🎬 FULL MEETING PROCESSING PIPELINE")
         logger.info("=" * 70)
         
-        pipeline_start = time.time()
+        pipeline_start = time.perf_counter()
         results = {}
         
         try:
@@ -107,7 +107,7 @@ class AgentOrchestrator:
             results['summary'] = summary
             
             # Calculate totals
-            total_time = time.time() - pipeline_start
+            total_time = time.perf_counter() - pipeline_start
             
             results['metadata'] = {
                 'total_processing_time': total_time,
@@ -0,0 +1,26 @@
+# src/api/responses.py
+"""
+API Response Classes
+====================
+Shared response classes for the FastAPI app and routers
+"""
+
+from fastapi.responses import ORJSONResponse
+import orjson
+
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+
+def utc_orjson_dumps(content) -> bytes:
+    """Serialize like UTCORJSONResponse (e.g. for WebSocket messages)"""
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+class UTCORJSONResponse(ORJSONResponse):
+    """
+    orjson-backed JSON response (faster than stdlib json)
+    
+    Naive datetimes (we store UTC everywhere) serialize natively
+    as ISO 8601 with a "Z" suffix - no .isoformat() needed.
+    """
+    
+    def render(self, content) -> bytes:
+        return utc_orjson_dumps(content)
@@ -5,12 +5,14 @@ Meeting Management API Routes
 CRUD operations for meetings
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
-from src.db.session import get_db_session
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, WebSocket, WebSocketDisconnect
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.db.session import get_db_session, get_async_db
 from src.db.models import MeetingStatus
 from src.db.repositories.meeting_repo import MeetingRepository, ActionItemRepository
+from src.api.responses import UTCORJSONResponse, utc_orjson_dumps
 from src.schemas.meeting import (
+    fast_from_orm,
     MeetingResponse,
     MeetingDetailResponse,
     MeetingListResponse,
@@ -19,46 +21,67 @@ from src.schemas.meeting import (
     ActionItemUpdateRequest
 )
 from typing import Optional
+import asyncio
+import hashlib
 import logging
 
 router = APIRouter(prefix="/api/v1/meetings", tags=["Meetings"])
 logger = logging.getLogger(__name__)
 
-@router.get("", response_model=MeetingListResponse)
+@router.get("", response_model=None, responses={200: {"model": MeetingListResponse}})
 async def list_meetings(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
     status: Optional[MeetingStatus] = Query(None, description="Filter by status"),
-    db: Session = Depends(get_db_session)
+    search: Optional[str] = Query(None, max_length=255, description="Search title or description"),
+    sort_by: str = Query(
+        "-created_at",
+        pattern="^-?(created_at|title)$",
+        description="Sort key, '-' prefix for descending"
+    ),
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
-    Get list of meetings with pagination
+    Get list of meetings with pagination, search and sorting
     
     Example:
-        GET /api/v1/meetings?skip=0&limit=10&status=completed
+        GET /api/v1/meetings?skip=0&limit=10&status=completed&search=sprint&sort_by=title
+    
+    Responses carry an ETag built from the query plus the list's count
+    and newest updated_at. A matching If-None-Match gets 304 Not
+    Modified after one aggregate query, without loading any rows.
+    
+    Rows come straight from our database, so the response is built
+    with model_construct() (no per-field validation) and serialized
+    directly with orjson.
     """
-    meetings = MeetingRepository.get_all(db, skip=skip, limit=limit, status=status)
-    total = MeetingRepository.count(db, status=status)
+    total, last_updated_at = await MeetingRepository.list_version(db, status=status, search=search)
+    
+    version = repr((total, last_updated_at, skip, limit, status, search, sort_by))
+    etag = f'"{hashlib.blake2b(version.encode(), digest_size=8).hexdigest()}"'
     
-    # Calculate word count from transcript if available
-    meeting_responses = []
-    for meeting in meetings:
-        meeting_dict = MeetingResponse.from_orm(meeting).dict()
-        if meeting.transcript:
-            meeting_dict['word_count'] = len(meeting.transcript.split())
-        meeting_responses.append(MeetingResponse(**meeting_dict))
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    meetings = await MeetingRepository.get_all(
+        db, skip=skip, limit=limit, status=status, search=search, sort_by=sort_by
+    )
     
-    return MeetingListResponse(
+    meeting_responses = [fast_from_orm(MeetingResponse, meeting) for meeting in meetings]
+    
+    response = MeetingListResponse.model_construct(
         meetings=meeting_responses,
         total=total,
         page=skip // limit + 1,
         page_size=limit
     )
+    return UTCORJSONResponse(response.model_dump(), headers={"ETag": etag})
 
 @router.get("/{meeting_id}", response_model=MeetingDetailResponse)
 async def get_meeting(
     meeting_id: int,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get detailed meeting information
@@ -69,20 +92,14 @@ async def get_meeting(
     - Action items
     - All metadata
     """
-    meeting = MeetingRepository.get_by_id(db, meeting_id)
+    meeting = await MeetingRepository.get_by_id(db, meeting_id, with_action_items=True)
     
     if not meeting:
         raise HTTPException(404, f"Meeting {meeting_id} not found")
     
-    # Get action items
-    action_items = ActionItemRepository.get_by_meeting_id(db, meeting_id)
-    
-    # Build response
+    # Build response (action items were eager-loaded with the meeting)
     meeting_dict = MeetingDetailResponse.from_orm(meeting).dict()
-    meeting_dict['action_items'] = [ActionItemResponse.from_orm(ai) for ai in action_items]
-    
-    if meeting.transcript:
-        meeting_dict['word_count'] = len(meeting.transcript.split())
+    meeting_dict['action_items'] = [ActionItemResponse.from_orm(ai) for ai in meeting.action_items]
     
     return MeetingDetailResponse(**meeting_dict)
 
@@ -90,7 +107,7 @@ async def get_meeting(
 async def update_meeting(
     meeting_id: int,
     update_data: MeetingUpdateRequest,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Update meeting metadata
@@ -102,35 +119,35 @@ async def update_meeting(
     """
     update_dict = update_data.dict(exclude_unset=True)
     
-    meeting = MeetingRepository.update(db, meeting_id, update_dict)
+    meeting = await MeetingRepository.update(db, meeting_id, update_dict)
     
     if not meeting:
         raise HTTPException(404, f"Meeting {meeting_id} not found")
     
-    db.commit()
+    await db.commit()
     
     return MeetingResponse.from_orm(meeting)
 
 @router.delete("/{meeting_id}")
 async def delete_meeting(
     meeting_id: int,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session)
 ):
     """Delete meeting and all related data"""
-    success = MeetingRepository.delete(db, meeting_id)
+    success = await MeetingRepository.delete(db, meeting_id)
     
     if not success:
         raise HTTPException(404, f"Meeting {meeting_id} not found")
     
-    db.commit()
+    await db.commit()
     
     return {"message": f"Meeting {meeting_id} deleted successfully"}
 
-@router.get("/search", response_model=MeetingListResponse)
+@router.get("/search", response_model=None, responses={200: {"model": MeetingListResponse}})
 async def search_meetings(
     q: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(10, ge=1, le=50),
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Search meetings by title or description
@@ -138,20 +155,21 @@ async def search_meetings(
     Example:
         GET /api/v1/meetings/search?q=budget&limit=10
     """
-    meetings = MeetingRepository.search(db, q, limit=limit)
+    meetings = await MeetingRepository.search(db, q, limit=limit)
     
-    return MeetingListResponse(
-        meetings=[MeetingResponse.from_orm(m) for m in meetings],
+    response = MeetingListResponse.model_construct(
+        meetings=[fast_from_orm(MeetingResponse, m) for m in meetings],
         total=len(meetings),
         page=1,
         page_size=limit
     )
+    return UTCORJSONResponse(response.model_dump())
 
 @router.get("/{meeting_id}/transcript")
 async def get_transcript(
     meeting_id: int,
     format: str = Query("text", regex="^(text|json)$", description="Response format"),
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get meeting transcript
@@ -160,7 +178,7 @@ async def get_transcript(
     - text: Plain text
     - json: Structured with timestamps
     """
-    meeting = MeetingRepository.get_by_id(db, meeting_id)
+    meeting = await MeetingRepository.get_by_id(db, meeting_id)
     
     if not meeting:
         raise HTTPException(404, f"Meeting {meeting_id} not found")
@@ -182,7 +200,7 @@ async def update_action_item(
     meeting_id: int,
     action_item_id: int,
     update_data: ActionItemUpdateRequest,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Update action item status
@@ -194,13 +212,13 @@ async def update_action_item(
     - Priority
     """
     # Verify meeting exists
-    meeting = MeetingRepository.get_by_id(db, meeting_id)
+    meeting = await MeetingRepository.get_by_id(db, meeting_id)
     if not meeting:
         raise HTTPException(404, f"Meeting {meeting_id} not found")
     
     # Update action item
     update_dict = update_data.dict(exclude_unset=True)
-    action_item = ActionItemRepository.update(db, action_item_id, update_dict)
+    action_item = await ActionItemRepository.update(db, action_item_id, update_dict)
     
     if not action_item:
         raise HTTPException(404, f"Action item {action_item_id} not found")
@@ -208,14 +226,51 @@ async def update_action_item(
     if action_item.meeting_id != meeting_id:
         raise HTTPException(400, "Action item does not belong to this meeting")
     
-    db.commit()
+    await db.commit()
     
     return ActionItemResponse.from_orm(action_item)
 
+# Progress percentage reported for each processing status
+STATUS_PROGRESS = {
+    MeetingStatus.UPLOADING: 10,
+    MeetingStatus.PROCESSING: 50,
+    MeetingStatus.COMPLETED: 100,
+    MeetingStatus.FAILED: 0
+}
+
+# Seconds between status checks on the /progress WebSocket
+PROGRESS_CHECK_INTERVAL = 1.0
+
+async def _status_payload(db: AsyncSession, meeting_id: int, meeting) -> dict:
+    """
+    Status response body from a MeetingRepository.get_status() row
+    
+    Completed meetings also carry "result" (transcript, summary,
+    key_topics), so clients don't need a second request to show them.
+    """
+    payload = {
+        "meeting_id": meeting_id,
+        "status": meeting.status.value,
+        "progress": STATUS_PROGRESS.get(meeting.status, 0),
+        "data_available": {
+            "transcript": meeting.has_transcript,
+            "summary": meeting.has_summary,
+            "action_items": meeting.action_item_count
+        },
+        "processing_time": meeting.processing_time_seconds,
+        "created_at": meeting.created_at,
+        "updated_at": meeting.updated_at
+    }
+    
+    if meeting.status == MeetingStatus.COMPLETED:
+        payload["result"] = await MeetingRepository.get_result(db, meeting_id)
+    
+    return payload
+
 @router.get("/{meeting_id}/status")
 async def get_meeting_status(
     meeting_id: int,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get meeting processing status
@@ -224,30 +279,65 @@ async def get_meeting_status(
     - Current status (uploading/processing/completed/failed)
     - Progress percentage
     - Available data (transcript, summary, etc.)
+    - Result (transcript, summary, key_topics) once completed
     """
-    meeting = MeetingRepository.get_by_id(db, meeting_id)
+    # One narrow SELECT (no transcript/summary text, no action item rows)
+    meeting = await MeetingRepository.get_status(db, meeting_id)
     
     if not meeting:
         raise HTTPException(404, f"Meeting {meeting_id} not found")
     
-    # Calculate progress
-    progress_map = {
-        MeetingStatus.UPLOADING: 10,
-        MeetingStatus.PROCESSING: 50,
-        MeetingStatus.COMPLETED: 100,
-        MeetingStatus.FAILED: 0
-    }
+    return await _status_payload(db, meeting_id, meeting)
+
+@router.websocket("/{meeting_id}/progress")
+async def meeting_progress(websocket: WebSocket, meeting_id: int):
+    """
+    Push processing status until the meeting completes or fails
     
-    return {
-        "meeting_id": meeting_id,
-        "status": meeting.status.value,
-        "progress": progress_map.get(meeting.status, 0),
-        "data_available": {
-            "transcript": bool(meeting.transcript),
-            "summary": bool(meeting.summary),
-            "action_items": len(meeting.action_items) if meeting.action_items else 0
-        },
-        "processing_time": meeting.processing_time_seconds,
-        "created_at": meeting.created_at,
-        "updated_at": meeting.updated_at
-    }
\ No newline at end of file
+    Sends the same payload as GET /{meeting_id}/status, but only when
+    status/progress change, then closes. One connection replaces the
+    client's poll loop; the narrow status query runs server-side every
+    PROGRESS_CHECK_INTERVAL seconds.
+    
+    Example (client):
+        ws://localhost:8000/api/v1/meetings/42/progress
+        <- {"meeting_id": 42, "status": "processing", "progress": 50, ...}
+        <- {"meeting_id": 42, "status": "completed", "progress": 100, ...}
+    """
+    await websocket.accept()
+    last_state = None
+    
+    try:
+        while True:
+            async with get_async_db() as db:
+                meeting = await MeetingRepository.get_status(db, meeting_id)
+                payload = await _status_payload(db, meeting_id, meeting) if meeting else None
+            
+            if not meeting:
+                await websocket.close(code=4404, reason=f"Meeting {meeting_id} not found")
+                return
+            
+            state = (payload["status"], payload["progress"])
+            
+            if state != last_state:
+                last_state = state
+                await websocket.send_text(utc_orjson_dumps(payload).decode())
+            
+            if meeting.status in (MeetingStatus.COMPLETED, MeetingStatus.FAILED):
+                await websocket.close()
+                return
+            
+            # Doubles as the sleep; wakes up early if the client disconnects
+            try:
+                message = await asyncio.wait_for(
+                    websocket.receive(),
+                    timeout=PROGRESS_CHECK_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                continue
+            
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+    
+    except WebSocketDisconnect:
+        logger.debug(f"Progress watcher disconnected: meeting {meeting_id}")
\ No newline at end of file
@@ -5,8 +5,8 @@ Upload API Routes
 Handles meeting audio file uploads
 """
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, UploadFile, File, Form, Query, HTTPException, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.session import get_db_session
 from src.db.models import Meeting, MeetingStatus
 from src.db.repositories.meeting_repo import MeetingRepository
@@ -16,21 +16,54 @@ from src.core.audio_processor import AudioProcessor
 from src.monitoring.metrics import track_storage_upload
 from datetime import datetime
 from typing import Optional, List
+import asyncio
+import hashlib
 import uuid
 import logging
 from pathlib import Path
-import io
+
+# blake3 is optional: without it, blake3 digests from clients aren't
+# verified (and so not stored); blake2b always is
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
 router = APIRouter(prefix="/api/v1/upload", tags=["Upload"])
 logger = logging.getLogger(__name__)
 
-@router.post("", response_model=MeetingUploadResponse)
+# ============================================
+# CONTENT DIGESTS (duplicate upload detection)
+# ============================================
+
+# "<algorithm>:<hex>" digests as computed by the UI (ui/pages/upload.py)
+DIGEST_ALGORITHMS = {"blake2b": lambda: hashlib.blake2b(digest_size=32)}
+if blake3 is not None:
+    DIGEST_ALGORITHMS["blake3"] = blake3.blake3
+
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+def _file_digest(fileobj, algorithm: str) -> str:
+    """
+    Digest of a spooled upload, read in chunks (blocking, run in a thread)
+    
+    Leaves the file positioned at the start for the storage upload.
+    """
+    hasher = DIGEST_ALGORITHMS[algorithm]()
+    fileobj.seek(0)
+    while chunk := fileobj.read(DIGEST_CHUNK_SIZE):
+        hasher.update(chunk)
+    fileobj.seek(0)
+    return f"{algorithm}:{hasher.hexdigest()}"
+
+@router.post("", response_model=MeetingUploadResponse, status_code=202)
 async def upload_meeting(
     file: UploadFile = File(..., description="Audio file (WAV, MP3, M4A, etc.)"),
     title: str = Form(..., description="Meeting title"),
     description: Optional[str] = Form(None, description="Meeting description"),
     participants: Optional[str] = Form(None, description="Comma-separated participant names"),
-    db: Session = Depends(get_db_session)
+    audio_hash: Optional[str] = Form(None, max_length=80, description="Content digest (see GET /exists)"),
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Upload meeting audio file
@@ -40,7 +73,12 @@ async def upload_meeting(
     2. Upload to MinIO storage
     3. Create database record
     4. Trigger background processing (Celery)
-    5. Return meeting ID
+    5. Return meeting ID (202 Accepted: processing continues in the background)
+    
+    A client-supplied audio_hash is recomputed from the received file and
+    the upload is rejected (400) if they differ, so GET /exists can only
+    ever match genuinely identical audio. Hashes the server can't verify
+    (blake3 not installed) are not stored.
     
     Example:
         curl -X POST "http://localhost:8000/api/v1/upload" \
@@ -56,9 +94,13 @@ async def upload_meeting(
         if not file.content_type or not file.content_type.startswith("audio/"):
             raise HTTPException(400, "Only audio files are supported")
         
-        # Read file
-        content = await file.read()
-        file_size_mb = len(content) / (1024 * 1024)
+        # Size from the spooled upload (no need to read it into memory)
+        file_size = file.size
+        if file_size is None:
+            file.file.seek(0, 2)
+            file_size = file.file.tell()
+        await file.seek(0)
+        file_size_mb = file_size / (1024 * 1024)
         
         logger.info(f"   File size: {file_size_mb:.2f}MB")
         
@@ -69,6 +111,17 @@ async def upload_meeting(
                 f"File too large: {file_size_mb:.1f}MB (max: {AudioProcessor.MAX_FILE_SIZE_MB}MB)"
             )
         
+        # Verify the claimed digest before anything is persisted
+        if audio_hash is not None:
+            algorithm = audio_hash.partition(":")[0]
+            if algorithm in DIGEST_ALGORITHMS:
+                actual_hash = await asyncio.to_thread(_file_digest, file.file, algorithm)
+                if actual_hash != audio_hash:
+                    raise HTTPException(400, "audio_hash does not match the uploaded file")
+            else:
+                logger.warning(f"   Unverifiable audio_hash ({algorithm}), not stored")
+                audio_hash = None
+        
         # Step 2: Generate unique filename and upload to storage
         file_extension = Path(file.filename).suffix
         unique_filename = f"{uuid.uuid4()}{file_extension}"
@@ -77,16 +130,23 @@ async def upload_meeting(
         logger.info(f"   Uploading to storage: {object_name}")
         
         storage_client = get_storage_client()
-        file_io = io.BytesIO(content)
         
-        storage_path = storage_client.upload_file(
-            file_io,
+        # Stream the spooled temp file straight to storage, off the event
+        # loop: the copy can take seconds for large files and would
+        # otherwise stall every other request (status polls, progress
+        # sockets, health checks) while it runs
+        bucket, object_name = await asyncio.to_thread(
+            storage_client.upload_file,
+            file.file,
             object_name,
-            content_type=file.content_type
+            content_type=file.content_type,
+            file_size=file_size
         )
         
+        storage_path = f"{bucket}/{object_name}"
+        
         # Track metrics
-        track_storage_upload(len(content))
+        track_storage_upload(file_size)
         
         logger.info(f"   ✅ Uploaded: {storage_path}")
         
@@ -99,14 +159,17 @@ async def upload_meeting(
         meeting_data = {
             "title": title,
             "description": description,
+            "audio_bucket": bucket,
+            "audio_object_name": object_name,
             "audio_file_path": storage_path,
             "participants": participant_list,
+            "audio_hash": audio_hash,
             "status": MeetingStatus.UPLOADING,
             "meeting_date": datetime.utcnow()
         }
         
-        meeting = MeetingRepository.create(db, meeting_data)
-        db.commit()
+        meeting = await MeetingRepository.create(db, meeting_data)
+        await db.commit()
         
         logger.info(f"   ✅ Created meeting record: {meeting.id}")
         
@@ -116,15 +179,17 @@ async def upload_meeting(
         estimated_processing = estimated_duration * 0.2  # 20% of duration
         
         # Step 6: Trigger background processing
-        # We'll add Celery task in next step
-        # For now, just update status
-        meeting.status = MeetingStatus.PROCESSING
-        db.commit()
-        
-        # TODO: Trigger Celery task
+        # The task claims the meeting (UPLOADING → PROCESSING) atomically
         from src.tasks.processing import process_meeting_task
         
-        task = process_meeting_task.delay(meeting.id)
+        try:
+            task = process_meeting_task.delay(meeting.id)
+        except Exception:
+            # Broker unreachable: don't leave an UPLOADING row behind that
+            # /exists would keep matching for this file
+            await MeetingRepository.update(db, meeting.id, {"status": MeetingStatus.FAILED})
+            await db.commit()
+            raise
         
         logger.info(f"   ✅ Queued for processing: {meeting.id} (Task: {task.id})")
         
@@ -141,6 +206,57 @@ async def upload_meeting(
         logger.error(f"   ❌ Upload failed: {e}", exc_info=True)
         raise HTTPException(500, f"Failed to upload meeting: {str(e)}")
 
+@router.get("/exists", response_model=MeetingUploadResponse)
+async def find_existing_upload(
+    hash: str = Query(..., max_length=80, description="Content digest of the audio file"),
+    db: AsyncSession = Depends(get_db_session)
+):
+    """
+    Look up a previous upload of the same audio file
+    
+    Clients send the file's digest before the file itself; a hit returns
+    the existing meeting, so the (possibly hundreds of MB) upload is
+    skipped. Failed meetings don't count.
+    
+    A hit is the existing meeting as it was uploaded: its title,
+    description and participants are kept, and the caller's new form
+    fields are NOT applied (edit them with PUT /meetings/{id}).
+    Digests are only stored after the server verified them on upload.
+    
+    A hit still UPLOADING (its processing task may never have been
+    queued) is queued again; the task's atomic claim makes a duplicate
+    queue entry a no-op.
+    
+    Example:
+        GET /api/v1/upload/exists?hash=blake3:9f86d0...
+    
+    Returns:
+        The existing meeting, or 404 if the file hasn't been uploaded
+    """
+    existing = await MeetingRepository.get_by_audio_hash(db, hash)
+    if existing is None:
+        raise HTTPException(404, "No upload with this hash")
+    
+    logger.info(f"♻️ Duplicate upload skipped: meeting {existing.id}")
+    
+    if existing.status == MeetingStatus.UPLOADING:
+        from src.tasks.processing import process_meeting_task
+        
+        try:
+            process_meeting_task.delay(existing.id)
+        except Exception as e:
+            logger.error(f"   ❌ Re-queue failed for meeting {existing.id}: {e}")
+            raise HTTPException(503, "Processing queue unavailable, try again later")
+        
+        logger.info(f"   ✅ Re-queued for processing: {existing.id}")
+    
+    return MeetingUploadResponse(
+        meeting_id=existing.id,
+        message="Meeting already uploaded.",
+        status=existing.status.value,
+        estimated_processing_time=None
+    )
+
 @router.get("/formats")
 async def get_supported_formats():
     """Get supported audio formats"""
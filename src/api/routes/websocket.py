@@ -6,11 +6,14 @@ Real-time audio streaming and transcription
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
-from sqlalchemy.orm import Session
-from src.db.session import get_db_session
+from src.db.session import get_async_db
 from src.db.models import Meeting, MeetingStatus
 from src.db.repositories.meeting_repo import MeetingRepository
-from src.core.live_transcription import LiveTranscriptionService
+from src.core.live_transcription import (
+    LiveTranscriptionService,
+    AUDIO_FORMAT_PCM,
+    SUPPORTED_AUDIO_FORMATS
+)
 from datetime import datetime
 import logging
 import json
@@ -23,6 +26,51 @@ logger = logging.getLogger(__name__)
 # Active sessions
 active_sessions = {}
 
+# Audio windows (~3s each) waiting for Whisper per session. When full the
+# oldest window is dropped, so a slow model bounds transcript delay
+# (~4 windows) instead of letting it grow without limit
+TRANSCRIBE_QUEUE_SIZE = 4
+
+def _enqueue_window(queue: asyncio.Queue, window, stats: dict, session_id: str):
+    """Queue a window for transcription, evicting the oldest one if full"""
+    try:
+        queue.put_nowait(window)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(window)
+        stats["dropped"] += 1
+        logger.warning(f"⚠️ Transcription falling behind, dropped a window: {session_id}")
+
+async def _transcribe_worker(
+    websocket: WebSocket,
+    service: LiveTranscriptionService,
+    queue: asyncio.Queue,
+    stats: dict
+):
+    """
+    Consumer: run Whisper on queued windows until a None sentinel
+    
+    Transcript messages carry the current backlog and the number of
+    dropped windows, so the client can show a "falling behind" notice.
+    """
+    while True:
+        window = await queue.get()
+        if window is None:
+            return
+        
+        result = await service.transcribe_window(window)
+        
+        if result:
+            await websocket.send_json({
+                "type": "transcript",
+                "text": result["text"],
+                "is_final": result["is_final"],
+                "timestamp": result["timestamp"],
+                "confidence": result.get("confidence", 1.0),
+                "backlog": queue.qsize(),
+                "dropped": stats["dropped"]
+            })
+
 @router.websocket("/transcribe")
 async def websocket_transcribe(websocket: WebSocket):
     """
@@ -30,18 +78,28 @@ async def websocket_transcribe(websocket: WebSocket):
     
     Protocol:
     1. Client connects
-    2. Client sends: {"type": "start", "meeting_title": "...", "language": "en"}
+    2. Client sends: {"type": "start", "meeting_title": "...", "language": "en",
+       "audio_format": "pcm16" | "webm-opus"}
     3. Server responds: {"type": "session_started", "session_id": "..."}
-    4. Client sends audio chunks: {"type": "audio", "data": base64_audio}
-    5. Server sends transcripts: {"type": "transcript", "text": "...", "is_final": true}
+    4. Client sends audio chunks as binary frames (raw PCM bytes or one
+       complete WebM/Opus recording per frame), or
+       legacy JSON: {"type": "audio", "data": base64_audio}
+    5. Server sends transcripts: {"type": "transcript", "text": "...", "is_final": true,
+       "backlog": 0, "dropped": 0}
     6. Client sends: {"type": "stop"}
     7. Server responds: {"type": "session_ended", "meeting_id": 123}
     
-    Audio format:
+    Audio format ("pcm16", the default):
     - Sample rate: 16000 Hz
     - Channels: Mono
     - Format: PCM 16-bit
     - Chunk size: 1 second (16000 samples)
+    
+    "webm-opus" (~24 kbps vs 256 kbps for PCM) is only offered when PyAV
+    is installed; the "connected" message lists the supported formats.
+    
+    Binary frames skip base64 (+33% bytes) and JSON on both ends;
+    control messages stay JSON text frames.
     """
     await websocket.accept()
     
@@ -51,18 +109,42 @@ async def websocket_transcribe(websocket: WebSocket):
     transcription_service = None
     meeting_id = None
     
+    # Receiving only buffers audio; Whisper runs in a separate task
+    transcribe_queue = asyncio.Queue(maxsize=TRANSCRIBE_QUEUE_SIZE)
+    queue_stats = {"dropped": 0}
+    worker_task = None
+    
     try:
         # Send welcome message
         await websocket.send_json({
             "type": "connected",
             "session_id": session_id,
+            "audio_formats": SUPPORTED_AUDIO_FORMATS,
             "message": "WebSocket connected. Send 'start' to begin."
         })
         
         while True:
-            # Receive message from client
-            message = await websocket.receive_text()
-            data = json.loads(message)
+            # Receive message from client (binary = audio, text = JSON control)
+            message = await websocket.receive()
+            
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            
+            if message.get("bytes") is not None:
+                if not transcription_service:
+                    await websocket.send_json({
+                        "type": "error",
+                        "message": "Session not started. Send 'start' first."
+                    })
+                    continue
+                
+                window = transcription_service.buffer_audio(message["bytes"])
+                
+                if window is not None:
+                    _enqueue_window(transcribe_queue, window, queue_stats, session_id)
+                continue
+            
+            data = json.loads(message["text"])
             
             message_type = data.get("type")
             
@@ -74,26 +156,38 @@ async def websocket_transcribe(websocket: WebSocket):
                 meeting_title = data.get("meeting_title", f"Live Meeting {datetime.now().strftime('%Y-%m-%d %H:%M')}")
                 language = data.get("language", "en")
                 participants = data.get("participants", [])
+                audio_format = data.get("audio_format", AUDIO_FORMAT_PCM)
+                
+                if audio_format not in SUPPORTED_AUDIO_FORMATS:
+                    await websocket.send_json({
+                        "type": "error",
+                        "message": f"Unsupported audio format: {audio_format}"
+                    })
+                    continue
                 
                 # Create meeting record
-                from src.db.session import get_db
-                with get_db() as db:
+                async with get_async_db() as db:
                     meeting_data = {
                         "title": meeting_title,
                         "status": MeetingStatus.PROCESSING,
                         "participants": participants,
                         "meeting_date": datetime.utcnow()
                     }
-                    meeting = MeetingRepository.create(db, meeting_data)
+                    meeting = await MeetingRepository.create(db, meeting_data)
                     meeting_id = meeting.id
                 
                 # Initialize live transcription service
                 transcription_service = LiveTranscriptionService(
                     session_id=session_id,
                     language=language,
-                    meeting_id=meeting_id
+                    meeting_id=meeting_id,
+                    audio_format=audio_format
                 )
                 
+                worker_task = asyncio.create_task(_transcribe_worker(
+                    websocket, transcription_service, transcribe_queue, queue_stats
+                ))
+                
                 active_sessions[session_id] = {
                     "service": transcription_service,
                     "meeting_id": meeting_id,
@@ -121,33 +215,30 @@ async def websocket_transcribe(websocket: WebSocket):
                 audio_data = data.get("data")
                 
                 if audio_data:
-                    # Process audio chunk
-                    result = await transcription_service.process_audio_chunk(audio_data)
+                    # Buffer audio chunk (transcribed by the worker task)
+                    window = transcription_service.buffer_audio_base64(audio_data)
                     
-                    if result:
-                        # Send transcript back to client
-                        await websocket.send_json({
-                            "type": "transcript",
-                            "text": result["text"],
-                            "is_final": result["is_final"],
-                            "timestamp": result["timestamp"],
-                            "confidence": result.get("confidence", 1.0)
-                        })
+                    if window is not None:
+                        _enqueue_window(transcribe_queue, window, queue_stats, session_id)
             
             # Handle stop command
             elif message_type == "stop":
                 logger.info(f"⏹️ Stopping transcription session: {session_id}")
                 
                 if transcription_service:
+                    # Let the worker finish what's queued, then finalize
+                    await transcribe_queue.put(None)
+                    await worker_task
+                    
                     # Finalize transcription
                     final_transcript = await transcription_service.finalize()
                     
                     # Save to database
-                    from src.db.session import get_db
-                    with get_db() as db:
-                        meeting = MeetingRepository.get_by_id(db, meeting_id)
+                    async with get_async_db() as db:
+                        meeting = await MeetingRepository.get_by_id(db, meeting_id)
                         if meeting:
                             meeting.transcript = final_transcript["full_transcript"]
+                            meeting.word_count = final_transcript["word_count"]
                             meeting.duration_seconds = final_transcript["duration"]
                             meeting.status = MeetingStatus.COMPLETED
                     
@@ -162,7 +253,7 @@ async def websocket_transcribe(websocket: WebSocket):
                         "meeting_id": meeting_id,
                         "final_transcript": final_transcript["full_transcript"],
                         "duration": final_transcript["duration"],
-                        "word_count": len(final_transcript["full_transcript"].split())
+                        "word_count": final_transcript["word_count"]
                     })
                     
                     logger.info(f"✅ Session completed: {session_id}")
@@ -194,6 +285,9 @@ async def websocket_transcribe(websocket: WebSocket):
     
     finally:
         # Cleanup
+        if worker_task and not worker_task.done():
+            worker_task.cancel()
+        
         if session_id in active_sessions:
             del active_sessions[session_id]
         
@@ -8,15 +8,33 @@ Real-time audio transcription using Whisper
 import whisper
 import torch
 import numpy as np
-import base64
 import logging
 from typing import Optional, Dict
 from datetime import datetime
 import asyncio
+import time
 from collections import deque
 import io
 from pydub import AudioSegment
 
+# pybase64 is a SIMD-accelerated drop-in for base64 (falls back to stdlib)
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# PyAV decodes Opus (WebM) segments from the browser's MediaRecorder;
+# without it clients fall back to raw PCM
+try:
+    import av
+except ImportError:
+    av = None
+
+# Binary frame formats: raw PCM is always accepted, Opus needs PyAV
+AUDIO_FORMAT_PCM = "pcm16"
+AUDIO_FORMAT_OPUS = "webm-opus"
+SUPPORTED_AUDIO_FORMATS = [AUDIO_FORMAT_PCM] + ([AUDIO_FORMAT_OPUS] if av else [])
+
 logger = logging.getLogger(__name__)
 
 class LiveTranscriptionService:
@@ -31,7 +49,13 @@ class LiveTranscriptionService:
     5. Maintains full transcript in memory
     """
     
-    def __init__(self, session_id: str, language: str = "en", meeting_id: Optional[int] = None):
+    def __init__(
+        self,
+        session_id: str,
+        language: str = "en",
+        meeting_id: Optional[int] = None,
+        audio_format: str = AUDIO_FORMAT_PCM
+    ):
         """
         Initialize live transcription service
         
@@ -39,10 +63,15 @@ class LiveTranscriptionService:
             session_id: Unique session identifier
             language: Language code (en, es, fr, etc.)
             meeting_id: Associated meeting ID
+            audio_format: Format of binary audio frames (see SUPPORTED_AUDIO_FORMATS)
         """
+        if audio_format not in SUPPORTED_AUDIO_FORMATS:
+            raise ValueError(f"Unsupported audio format: {audio_format}")
+        
         self.session_id = session_id
         self.language = language
         self.meeting_id = meeting_id
+        self.audio_format = audio_format
         
         # Load Whisper model (use 'base' for speed)
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -53,17 +82,18 @@ class LiveTranscriptionService:
         self.audio_buffer = deque(maxlen=100)  # Store last 100 chunks
         self.buffer_duration = 0.0  # seconds
         self.min_buffer_duration = 3.0  # Process every 3 seconds
+        self.silence_rms_threshold = 0.01  # ~ -40 dBFS, skip Whisper below this
         
         # Transcription state
         self.full_transcript = []
-        self.last_transcript_time = datetime.utcnow()
         self.start_time = datetime.utcnow()
+        self._start_perf = time.perf_counter()  # Monotonic base for offsets
         
         logger.info(f"✅ Live transcription service initialized: {session_id}")
     
     async def process_audio_chunk(self, audio_data_base64: str) -> Optional[Dict]:
         """
-        Process incoming audio chunk
+        Process incoming base64 audio chunk (JSON "audio" messages)
         
         Args:
             audio_data_base64: Base64 encoded audio data (PCM 16-bit, 16kHz, mono)
@@ -71,12 +101,47 @@ class LiveTranscriptionService:
         Returns:
             Transcript dict if ready, None if buffering
         """
+        window = self.buffer_audio_base64(audio_data_base64)
+        if window is None:
+            return None
+        return await self.transcribe_window(window)
+    
+    def buffer_audio_base64(self, audio_data_base64: str) -> Optional[np.ndarray]:
+        """
+        Decode a base64 chunk and buffer it (see buffer_audio)
+        
+        Args:
+            audio_data_base64: Base64 encoded audio data (PCM 16-bit, 16kHz, mono)
+        
+        Returns:
+            A full window of samples once enough audio is buffered, else None
+        """
+        try:
+            audio_bytes = base64.b64decode(audio_data_base64, validate=False)
+        except Exception as e:
+            logger.error(f"Error decoding audio chunk: {e}")
+            return None
+        
+        return self.buffer_audio(audio_bytes)
+    
+    def buffer_audio(self, audio_bytes: bytes) -> Optional[np.ndarray]:
+        """
+        Add an audio chunk to the buffer (cheap, no transcription)
+        
+        Args:
+            audio_bytes: Raw PCM 16-bit, 16kHz, mono audio, or a complete
+                WebM/Opus segment when the session uses AUDIO_FORMAT_OPUS
+        
+        Returns:
+            A full window of samples (min_buffer_duration or more) to pass
+            to transcribe_window(), or None while still buffering
+        """
         try:
-            # Decode base64 audio
-            audio_bytes = base64.b64decode(audio_data_base64)
-            
             # Convert to numpy array
-            audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+            if self.audio_format == AUDIO_FORMAT_OPUS:
+                audio_array = self._decode_opus(audio_bytes)
+            else:
+                audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
             
             # Add to buffer
             self.audio_buffer.append(audio_array)
@@ -90,14 +155,11 @@ class LiveTranscriptionService:
                 # Concatenate buffer
                 audio_full = np.concatenate(list(self.audio_buffer))
                 
-                # Transcribe
-                result = await self._transcribe_audio(audio_full)
-                
                 # Clear buffer
                 self.audio_buffer.clear()
                 self.buffer_duration = 0.0
                 
-                return result
+                return audio_full
             
             return None
         
@@ -105,7 +167,34 @@ class LiveTranscriptionService:
             logger.error(f"Error processing audio chunk: {e}")
             return None
     
-    async def _transcribe_audio(self, audio: np.ndarray) -> Dict:
+    @staticmethod
+    def _decode_opus(audio_bytes: bytes) -> np.ndarray:
+        """
+        Decode a self-contained WebM/Opus segment to 16kHz mono float32
+        
+        Args:
+            audio_bytes: One complete MediaRecorder recording (with header)
+        
+        Returns:
+            NumPy array of audio samples
+        """
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=16000)
+        frames = []
+        
+        with av.open(io.BytesIO(audio_bytes)) as container:
+            for frame in container.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    frames.append(resampled.to_ndarray().reshape(-1))
+        
+        # Flush samples still held by the resampler
+        for resampled in resampler.resample(None):
+            frames.append(resampled.to_ndarray().reshape(-1))
+        
+        if not frames:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(frames)
+    
+    async def transcribe_window(self, audio: np.ndarray) -> Optional[Dict]:
         """
         Transcribe audio array with Whisper
         
@@ -113,9 +202,18 @@ class LiveTranscriptionService:
             audio: NumPy array of audio samples
         
         Returns:
-            Transcript result
+            Transcript result, or None for silent/empty audio
         """
         try:
+            # Skip near-silent windows (Whisper hallucinates text on silence)
+            if audio.size == 0:
+                return None
+            
+            rms = float(np.sqrt(np.mean(np.square(audio, dtype=np.float32))))
+            if rms < self.silence_rms_threshold:
+                logger.debug(f"Skipping silent window (RMS {rms:.4f})")
+                return None
+            
             # Run Whisper in thread pool (blocking operation)
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
@@ -127,11 +225,15 @@ class LiveTranscriptionService:
             text = result["text"].strip()
             
             if text:
+                # Only materialize a timestamp for segments we emit
+                offset = time.perf_counter() - self._start_perf
+                timestamp = datetime.utcnow().isoformat()
+                
                 # Add to full transcript
                 self.full_transcript.append({
                     "text": text,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "offset": (datetime.utcnow() - self.start_time).total_seconds()
+                    "timestamp": timestamp,
+                    "offset": offset
                 })
                 
                 logger.info(f"📝 Transcribed: {text[:50]}...")
@@ -139,7 +241,7 @@ class LiveTranscriptionService:
                 return {
                     "text": text,
                     "is_final": True,
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "confidence": 1.0
                 }
             
@@ -178,12 +280,12 @@ class LiveTranscriptionService:
         # Process any remaining buffer
         if self.audio_buffer and self.buffer_duration > 0:
             audio_full = np.concatenate(list(self.audio_buffer))
-            result = await self._transcribe_audio(audio_full)
+            result = await self.transcribe_window(audio_full)
         
         # Combine all transcript segments
         full_text = " ".join([segment["text"] for segment in self.full_transcript])
         
-        duration = (datetime.utcnow() - self.start_time).total_seconds()
+        duration = time.perf_counter() - self._start_perf
         
         logger.info(f"✅ Finalized session {self.session_id}: {len(full_text)} chars, {duration:.1f}s")
         
@@ -21,6 +21,7 @@ import time
 import logging
 import os
 from pathlib import Path
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
@@ -51,12 +52,12 @@ class TranscriptionService:
             torch.set_num_threads(4)
         
         logger.info(f"Loading Whisper '{model_size}' model...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Load model
         self.model = whisper.load_model(model_size, device=self.device)
         
-        load_time = time.time() - start_time
+        load_time = time.perf_counter() - start_time
         logger.info(f"✅ Model loaded in {load_time:.2f}s")
         
         self.model_size = model_size
@@ -71,7 +72,7 @@ class TranscriptionService:
         Transcribe audio file to text
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file or http(s) URL (read by ffmpeg)
             language: Language code ("en", "es", "fr", etc.) or None for auto-detect
             task: "transcribe" or "translate" (translate to English)
         
@@ -90,8 +91,8 @@ class TranscriptionService:
             result = service.transcribe("meeting.wav")
             print(result["text"])
         """
-        logger.info(f"🎙️ Transcribing: {Path(audio_path).name}")
-        start_time = time.time()
+        logger.info(f"🎙️ Transcribing: {Path(urlparse(audio_path).path).name}")
+        start_time = time.perf_counter()
         
         try:
             # Transcribe
@@ -104,7 +105,7 @@ class TranscriptionService:
                 word_timestamps=False  # Set True for word-level timestamps (slower)
             )
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Calculate duration from segments
             duration = 0
@@ -14,7 +14,8 @@ Instead of writing SQL:
 We write Python classes and SQLAlchemy generates the SQL!
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Float, JSON, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, ForeignKey, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -88,8 +89,19 @@ class Meeting(Base):
     # ============================================
     # FILE INFORMATION
     # ============================================
+    audio_bucket = Column(String(63), nullable=True)
+    # Example: "meeting-audio"
+    
+    audio_object_name = Column(String(512), nullable=True)
+    # Example: "meetings/abc-123.wav" (key inside the bucket)
+    
     audio_file_path = Column(String(512), nullable=True)
     # Example: "meeting-audio/meetings/abc-123.wav"
+    # Display only - use audio_bucket/audio_object_name to access storage
+    
+    audio_hash = Column(String(80), nullable=True, index=True)
+    # Example: "blake3:9f86d0..." (content digest sent by the client,
+    # used to skip re-uploading a file that is already stored)
     
     duration_seconds = Column(Float, nullable=True)
     # Example: 3600.5 (1 hour meeting)
@@ -104,17 +116,25 @@ class Meeting(Base):
         index=True
     )
     
+    step_status = Column(JSONB, nullable=True)
+    # Pipeline steps already saved, so resumed workflows skip them
+    # Example: {"transcribe": "processed", "analyze": "processed"}
+    
     # ============================================
     # AI-GENERATED CONTENT
     # ============================================
     transcript = Column(Text, nullable=True)
     # Full meeting transcript
     
+    word_count = Column(Integer, nullable=True)
+    # Words in transcript, stored at save time (not re-split per request)
+    
     summary = Column(Text, nullable=True)
     # AI-generated summary
     
-    key_topics = Column(JSON, nullable=True)
+    key_topics = Column(JSONB, nullable=True)
     # Example: ["budget planning", "Q4 goals", "hiring"]
+    # JSONB + GIN index: filter with key_topics.contains(["hiring"]) (@>)
     
     sentiment_score = Column(Float, nullable=True)
     # Range: -1.0 (very negative) to 1.0 (very positive)
@@ -123,7 +143,7 @@ class Meeting(Base):
     # ============================================
     # METADATA
     # ============================================
-    participants = Column(JSON, nullable=True)
+    participants = Column(JSONB, nullable=True)
     # Example: ["Alice", "Bob", "Charlie"]
     
     meeting_date = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -158,7 +178,16 @@ class Meeting(Base):
     action_items = relationship(
         "ActionItem",
         back_populates="meeting",
-        cascade="all, delete-orphan"  # Delete action items when meeting is deleted
+        cascade="all, delete-orphan",  # Delete action items when meeting is deleted
+        order_by="ActionItem.created_at"
+    )
+    
+    # ============================================
+    # INDEXES
+    # ============================================
+    __table_args__ = (
+        Index("idx_meetings_key_topics_gin", "key_topics", postgresql_using="gin"),
+        Index("idx_meetings_participants_gin", "participants", postgresql_using="gin"),
     )
     
     def __repr__(self):
@@ -5,20 +5,48 @@ Meeting Repository
 Database operations for meetings
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy import select, desc, func, update, or_
+from sqlalchemy.sql.dml import Update
 from src.db.models import Meeting, ActionItem, MeetingStatus
-from typing import Optional, List, Dict
-from datetime import datetime
+from typing import Optional, List, Dict, Tuple
+from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+# A PROCESSING meeting untouched for this long lost its worker (e.g. the
+# claim committed but the workflow was never published); matches the
+# Celery task_time_limit, and every pipeline step bumps updated_at
+STALE_CLAIM_AFTER = timedelta(seconds=3600)
+
+# Allowed list sort keys ("-" prefix = descending)
+MEETING_SORT_COLUMNS = {
+    "created_at": Meeting.created_at,
+    "title": Meeting.title,
+}
+
+def _meeting_filters(status: Optional[MeetingStatus] = None, search: Optional[str] = None) -> List:
+    """WHERE clauses shared by get_all() and count()"""
+    filters = []
+    
+    if status:
+        filters.append(Meeting.status == status)
+    
+    if search:
+        search_pattern = f"%{search}%"
+        filters.append(
+            Meeting.title.ilike(search_pattern) | Meeting.description.ilike(search_pattern)
+        )
+    
+    return filters
+
 class MeetingRepository:
     """Repository for meeting database operations"""
     
     @staticmethod
-    def create(db: Session, meeting_data: Dict) -> Meeting:
+    async def create(db: AsyncSession, meeting_data: Dict) -> Meeting:
         """
         Create a new meeting
         
@@ -31,21 +59,143 @@ class MeetingRepository:
         """
         meeting = Meeting(**meeting_data)
         db.add(meeting)
-        db.flush()  # Get ID without committing
+        await db.flush()  # Get ID without committing
         logger.info(f"Created meeting: {meeting.id}")
         return meeting
     
     @staticmethod
-    def get_by_id(db: Session, meeting_id: int) -> Optional[Meeting]:
-        """Get meeting by ID"""
-        return db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    def claim_statement(meeting_id: int) -> Update:
+        """
+        Atomic claim: UPDATE ... SET status=processing WHERE status IN
+        (uploading, failed) - or processing but stale - RETURNING id
+        
+        Row-level locking makes concurrent claims safe: only one caller
+        gets a row back. Executed by the sync Celery worker on its own
+        session. A redelivered task can take over a PROCESSING row whose
+        updated_at is older than STALE_CLAIM_AFTER (worker lost after
+        the claim committed), instead of leaving it stuck.
+        """
+        return (
+            update(Meeting)
+            .where(
+                Meeting.id == meeting_id,
+                or_(
+                    Meeting.status.in_([MeetingStatus.UPLOADING, MeetingStatus.FAILED]),
+                    (Meeting.status == MeetingStatus.PROCESSING)
+                    & (Meeting.updated_at < datetime.utcnow() - STALE_CLAIM_AFTER)
+                )
+            )
+            .values(status=MeetingStatus.PROCESSING)
+            .returning(Meeting.id)
+        )
+    
+    @staticmethod
+    async def get_by_id(
+        db: AsyncSession,
+        meeting_id: int,
+        with_action_items: bool = False
+    ) -> Optional[Meeting]:
+        """
+        Get meeting by ID
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting ID
+            with_action_items: Eagerly load action items (lazy loading
+                is not available on an AsyncSession)
+        """
+        query = select(Meeting).where(Meeting.id == meeting_id)
+        
+        if with_action_items:
+            query = query.options(selectinload(Meeting.action_items))
+        
+        result = await db.execute(query)
+        return result.scalars().first()
+    
+    @staticmethod
+    async def get_by_audio_hash(db: AsyncSession, audio_hash: str):
+        """
+        Find the latest meeting uploaded with the same audio content
+        
+        Failed meetings are ignored, so retrying after a failure uploads
+        the file again.
+        
+        Returns:
+            Row with id and status - or None if the file is new
+        """
+        result = await db.execute(
+            select(Meeting.id, Meeting.status)
+            .where(
+                Meeting.audio_hash == audio_hash,
+                Meeting.status != MeetingStatus.FAILED
+            )
+            .order_by(desc(Meeting.created_at))
+            .limit(1)
+        )
+        return result.first()
+    
+    @staticmethod
+    async def get_status(db: AsyncSession, meeting_id: int):
+        """
+        Get the fields needed for status polling, in one narrow query
+        
+        Large text columns are only checked for presence and action
+        items are counted in SQL, so polling stays cheap.
+        
+        Returns:
+            Row with id, status, has_transcript, has_summary,
+            action_item_count, processing_time_seconds, created_at,
+            updated_at - or None if not found
+        """
+        action_item_count = (
+            select(func.count(ActionItem.id))
+            .where(ActionItem.meeting_id == Meeting.id)
+            .scalar_subquery()
+        )
+        
+        result = await db.execute(
+            select(
+                Meeting.id,
+                Meeting.status,
+                (func.coalesce(Meeting.transcript, "") != "").label("has_transcript"),
+                (func.coalesce(Meeting.summary, "") != "").label("has_summary"),
+                action_item_count.label("action_item_count"),
+                Meeting.processing_time_seconds,
+                Meeting.created_at,
+                Meeting.updated_at
+            ).where(Meeting.id == meeting_id)
+        )
+        return result.first()
     
     @staticmethod
-    def get_all(
-        db: Session,
+    async def get_result(db: AsyncSession, meeting_id: int) -> Optional[Dict]:
+        """
+        Get the processing output (transcript, summary, key topics)
+        
+        Only those three columns, for returning alongside a completed
+        status without loading the full meeting and its action items.
+        
+        Returns:
+            {"transcript": ..., "summary": ..., "key_topics": [...]} or None
+        """
+        result = await db.execute(
+            select(
+                Meeting.transcript,
+                Meeting.summary,
+                Meeting.key_topics
+            ).where(Meeting.id == meeting_id)
+        )
+        row = result.first()
+        return dict(row._mapping) if row else None
+    
+    @staticmethod
+    async def get_all(
+        db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
-        status: Optional[MeetingStatus] = None
+        status: Optional[MeetingStatus] = None,
+        search: Optional[str] = None,
+        sort_by: str = "-created_at"
     ) -> List[Meeting]:
         """
         Get all meetings with pagination
@@ -55,29 +205,60 @@ class MeetingRepository:
             skip: Number of records to skip
             limit: Maximum records to return
             status: Filter by status
+            search: Case-insensitive match on title or description
+            sort_by: Key from MEETING_SORT_COLUMNS, "-" prefix for descending
         
         Returns:
             List of meetings
         """
-        query = db.query(Meeting)
+        column = MEETING_SORT_COLUMNS[sort_by.lstrip("-")]
+        order = desc(column) if sort_by.startswith("-") else column
         
-        if status:
-            query = query.filter(Meeting.status == status)
+        result = await db.execute(
+            select(Meeting)
+            .where(*_meeting_filters(status, search))
+            .order_by(order, desc(Meeting.id))
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+    
+    @staticmethod
+    async def count(
+        db: AsyncSession,
+        status: Optional[MeetingStatus] = None,
+        search: Optional[str] = None
+    ) -> int:
+        """Count total meetings (same filters as get_all)"""
+        query = select(func.count(Meeting.id)).where(*_meeting_filters(status, search))
         
-        return query.order_by(desc(Meeting.created_at)).offset(skip).limit(limit).all()
+        result = await db.execute(query)
+        return result.scalar()
     
     @staticmethod
-    def count(db: Session, status: Optional[MeetingStatus] = None) -> int:
-        """Count total meetings"""
-        query = db.query(func.count(Meeting.id))
+    async def list_version(
+        db: AsyncSession,
+        status: Optional[MeetingStatus] = None,
+        search: Optional[str] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Count and newest updated_at for a filtered list (one aggregate query)
         
-        if status:
-            query = query.filter(Meeting.status == status)
+        Any insert, update or delete changes one of the two, so the pair
+        works as a cheap ETag source for list responses.
         
-        return query.scalar()
+        Returns:
+            (total, last_updated_at)
+        """
+        result = await db.execute(
+            select(func.count(Meeting.id), func.max(Meeting.updated_at))
+            .where(*_meeting_filters(status, search))
+        )
+        total, last_updated_at = result.one()
+        return total, last_updated_at
     
     @staticmethod
-    def update(db: Session, meeting_id: int, update_data: Dict) -> Optional[Meeting]:
+    async def update(db: AsyncSession, meeting_id: int, update_data: Dict) -> Optional[Meeting]:
         """
         Update meeting
         
@@ -89,7 +270,7 @@ class MeetingRepository:
         Returns:
             Updated meeting or None
         """
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+        meeting = await MeetingRepository.get_by_id(db, meeting_id)
         
         if not meeting:
             return None
@@ -99,27 +280,27 @@ class MeetingRepository:
                 setattr(meeting, key, value)
         
         meeting.updated_at = datetime.utcnow()
-        db.flush()
+        await db.flush()
         
         logger.info(f"Updated meeting: {meeting_id}")
         return meeting
     
     @staticmethod
-    def delete(db: Session, meeting_id: int) -> bool:
+    async def delete(db: AsyncSession, meeting_id: int) -> bool:
         """Delete meeting"""
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+        meeting = await MeetingRepository.get_by_id(db, meeting_id)
         
         if not meeting:
             return False
         
-        db.delete(meeting)
-        db.flush()
+        await db.delete(meeting)
+        await db.flush()
         
         logger.info(f"Deleted meeting: {meeting_id}")
         return True
     
     @staticmethod
-    def search(db: Session, query: str, limit: int = 10) -> List[Meeting]:
+    async def search(db: AsyncSession, query: str, limit: int = 10) -> List[Meeting]:
         """
         Search meetings by title or description
         
@@ -133,34 +314,40 @@ class MeetingRepository:
         """
         search_pattern = f"%{query}%"
         
-        return db.query(Meeting).filter(
-            (Meeting.title.ilike(search_pattern)) |
-            (Meeting.description.ilike(search_pattern))
-        ).order_by(desc(Meeting.created_at)).limit(limit).all()
+        result = await db.execute(
+            select(Meeting).where(
+                (Meeting.title.ilike(search_pattern)) |
+                (Meeting.description.ilike(search_pattern))
+            ).order_by(desc(Meeting.created_at)).limit(limit)
+        )
+        return list(result.scalars().all())
 
 class ActionItemRepository:
     """Repository for action item database operations"""
     
     @staticmethod
-    def create(db: Session, action_item_data: Dict) -> ActionItem:
+    async def create(db: AsyncSession, action_item_data: Dict) -> ActionItem:
         """Create action item"""
         action_item = ActionItem(**action_item_data)
         db.add(action_item)
-        db.flush()
+        await db.flush()
         logger.info(f"Created action item: {action_item.id}")
         return action_item
     
     @staticmethod
-    def get_by_meeting_id(db: Session, meeting_id: int) -> List[ActionItem]:
+    async def get_by_meeting_id(db: AsyncSession, meeting_id: int) -> List[ActionItem]:
         """Get all action items for a meeting"""
-        return db.query(ActionItem).filter(
-            ActionItem.meeting_id == meeting_id
-        ).order_by(ActionItem.created_at).all()
+        result = await db.execute(
+            select(ActionItem).where(
+                ActionItem.meeting_id == meeting_id
+            ).order_by(ActionItem.created_at)
+        )
+        return list(result.scalars().all())
     
     @staticmethod
-    def update(db: Session, action_item_id: int, update_data: Dict) -> Optional[ActionItem]:
+    async def update(db: AsyncSession, action_item_id: int, update_data: Dict) -> Optional[ActionItem]:
         """Update action item"""
-        action_item = db.query(ActionItem).filter(ActionItem.id == action_item_id).first()
+        action_item = await db.get(ActionItem, action_item_id)
         
         if not action_item:
             return None
@@ -169,6 +356,6 @@ class ActionItemRepository:
             if value is not None and hasattr(action_item, key):
                 setattr(action_item, key, value)
         
-        db.flush()
+        await db.flush()
         logger.info(f"Updated action item: {action_item_id}")
         return action_item
\ No newline at end of file
@@ -13,9 +13,11 @@ A "session" is like a conversation with the database:
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from src.config import get_settings
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import contextmanager, asynccontextmanager
+from typing import Generator, AsyncGenerator
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,21 +27,67 @@ settings = get_settings()
 # CREATE ENGINE
 # ============================================
 # This is the "factory" that creates database connections
+#
+# Pooling:
+# - Default: each process keeps its own pool of DB_POOL_SIZE connections
+#   (+ DB_MAX_OVERFLOW), so N processes hold up to N x (size + overflow).
+# - DB_USE_PGBOUNCER=true: DATABASE_URL points at PgBouncer running with
+#   pool_mode=transaction. SQLAlchemy's pool is disabled (NullPool) and
+#   PgBouncer shares a small set of backend connections between processes.
+#   asyncpg's prepared statement cache is turned off, since prepared
+#   statements don't survive across PgBouncer transactions.
+
+def _pool_kwargs() -> dict:
+    """Connection pool settings shared by the sync and async engines"""
+    if settings.DB_USE_PGBOUNCER:
+        return {"poolclass": NullPool}
+    
+    return {
+        "pool_pre_ping": True,                       # Test connections before using (detect dead connections)
+        "pool_size": settings.DB_POOL_SIZE,          # Keep N connections open
+        "max_overflow": settings.DB_MAX_OVERFLOW,    # Can create more if needed
+        "pool_timeout": settings.DB_POOL_TIMEOUT,    # Wait this long for a free connection
+        "pool_recycle": settings.DB_POOL_RECYCLE,    # Recycle old connections (default: 1 hour)
+        "pool_use_lifo": True,                       # Reuse hot connections, let idle overflow close
+    }
+
+# Celery workers run one task per thread/process; keep at least one
+# pooled connection per concurrent task so none waits on pool_timeout
+_sync_pool_kwargs = _pool_kwargs()
+if "pool_size" in _sync_pool_kwargs and settings.CELERY_WORKER_CONCURRENCY:
+    _sync_pool_kwargs["pool_size"] = max(settings.DB_POOL_SIZE, settings.CELERY_WORKER_CONCURRENCY)
 
 engine = create_engine(
     settings.DATABASE_URL,
-    
-    # Connection pool settings
-    pool_pre_ping=True,      # Test connections before using (detect dead connections)
-    pool_size=10,            # Keep 10 connections open
-    max_overflow=20,         # Can create 20 more if needed (total 30 max)
-    pool_recycle=3600,       # Recycle connections after 1 hour
+    **_sync_pool_kwargs,
     
     # Logging (set to True to see all SQL queries)
     echo=False,              # Set to True for debugging
 )
 
-logger.info("Database engine created")
+# Async engine for the API (asyncpg driver)
+# FastAPI endpoints await DB I/O on the event loop instead of borrowing
+# threads from the default executor, which stays free for Whisper.
+# The sync engine above is kept for Celery workers and scripts.
+
+def _async_database_url(url: str) -> str:
+    """Point a postgresql:// URL at the asyncpg driver"""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    **_pool_kwargs(),
+    connect_args=(
+        {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        if settings.DB_USE_PGBOUNCER else {}
+    ),
+    echo=False,
+)
+
+logger.info("Database engines created")
 
 # ============================================
 # SESSION FACTORY
@@ -52,6 +100,13 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,  # Keep loaded attributes usable after commit
+)
+
 # ============================================
 # CONTEXT MANAGER (Python's 'with' statement)
 # ============================================
@@ -85,25 +140,43 @@ def get_db() -> Generator[Session, None, None]:
         db.close()  # Always close connection
         logger.debug("Database session closed")
 
+@asynccontextmanager
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async version of get_db() for code running on the event loop
+    
+    Usage:
+        async with get_async_db() as db:
+            meeting = await MeetingRepository.get_by_id(db, 1)
+            meeting.title = "New Title"
+            # Automatically commits when exiting 'async with' block
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+            logger.debug("Database transaction committed")
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Database transaction failed: {e}")
+            raise
+
 # ============================================
 # FASTAPI DEPENDENCY
 # ============================================
 
-def get_db_session() -> Generator[Session, None, None]:
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
-    Database session for FastAPI dependency injection
+    Async database session for FastAPI dependency injection
     
     Usage in FastAPI:
         @app.get("/meetings")
-        def get_meetings(db: Session = Depends(get_db_session)):
-            meetings = db.query(Meeting).all()
-            return meetings
+        async def get_meetings(db: AsyncSession = Depends(get_db_session)):
+            result = await db.execute(select(Meeting))
+            return result.scalars().all()
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 # ============================================
 # UTILITY FUNCTIONS
@@ -11,24 +11,107 @@ This creates:
 - Metrics collection (Prometheus)
 """
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from sqlalchemy import text
 from src.config import get_settings
 from src.monitoring.metrics import setup_metrics, track_request
+from src.api.responses import UTCORJSONResponse
+from src.db.session import get_async_db, async_engine
+from src.utils.storage import get_storage_client
+from src.utils.redis_client import get_redis
 import time
+import queue
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
+from pathlib import Path
+from typing import Optional
 
 # Setup logging
+# Records are only enqueued on the request path; formatting and the
+# stdout write happen on the QueueListener's background thread
+# (started/stopped with the app).
+log_queue = queue.Queue(-1)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+log_listener = QueueListener(log_queue, _stream_handler, respect_handler_level=True)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# ============================================
+# STARTUP / SHUTDOWN (LIFESPAN)
+# ============================================
+
+async def _warm_db_pool():
+    """
+    Open the pool's connections before the first request arrives
+    
+    Runs DB_POOL_SIZE concurrent SELECT 1s so the pool fills up
+    (a single check would only open one connection).
+    With PgBouncer there is no local pool - one check is enough.
+    """
+    async def ping():
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    pool_size = 1 if settings.DB_USE_PGBOUNCER else settings.DB_POOL_SIZE
+    await asyncio.gather(*(ping() for _ in range(pool_size)))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run on application startup (before yield) and shutdown (after)"""
+    log_listener.start()
+    
+    # Derived from settings once (never re-parsed per request)
+    app.state.database_host = (
+        settings.DATABASE_URL.split('@', 1)[1] if '@' in settings.DATABASE_URL else 'Not configured'
+    )
+    
+    logger.info("=" * 50)
+    logger.info(f"🚀 Starting {settings.APP_NAME}")
+    logger.info(f"   Environment: {settings.ENV}")
+    logger.info(f"   Debug mode: {settings.DEBUG}")
+    logger.info(f"   Database: {app.state.database_host}")
+    logger.info("=" * 50)
+    
+    # Initialize metrics
+    setup_metrics(app)
+    logger.info("✅ Metrics initialized")
+    
+    # Test database connection (and warm up the pool)
+    try:
+        await _warm_db_pool()
+        logger.info("✅ Database connected")
+    except Exception as e:
+        logger.error(f"❌ Database connection failed: {e}")
+    
+    # Test storage connection
+    try:
+        storage = get_storage_client()
+        logger.info("✅ Storage connected")
+    except Exception as e:
+        logger.error(f"❌ Storage connection failed: {e}")
+    
+    logger.info("🎉 Application ready!")
+    
+    yield
+    
+    logger.info("Shutting down application...")
+    await async_engine.dispose()
+    logger.info("👋 Application stopped")
+    log_listener.stop()  # Flushes queued records
+
 # ============================================
 # CREATE FASTAPI APP
 # ============================================
@@ -39,7 +122,9 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",      # Swagger UI at /docs
     redoc_url="/redoc",    # ReDoc at /redoc
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=UTCORJSONResponse,
+    lifespan=lifespan
 )
 
 logger.info(f"Starting {settings.APP_NAME} in {settings.ENV} mode")
@@ -48,122 +133,115 @@ logger.info(f"Starting {settings.APP_NAME} in {settings.ENV} mode")
 # MIDDLEWARE
 # ============================================
 
-# CORS - Allow frontend to call API
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
 # Request logging and timing
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
+class TimingMetricsMiddleware:
     """
     Log all requests and track response time
     
+    Pure ASGI middleware (instead of @app.middleware("http"), which wraps
+    every request in BaseHTTPMiddleware's extra task and Request/Response
+    objects).
+    
     For every request:
-    - Log request details
+    - Log a single completion line (method, path, status, duration)
     - Measure response time
     - Track metrics (Prometheus)
+    - Add X-Response-Time header
     """
-    start_time = time.time()
-    
-    # Log request
-    logger.info(f"→ {request.method} {request.url.path}")
-    
-    # Process request
-    response = await call_next(request)
-    
-    # Calculate duration
-    duration = time.time() - start_time
-    
-    # Log response
-    logger.info(
-        f"← {request.method} {request.url.path} "
-        f"Status: {response.status_code} "
-        f"Duration: {duration:.3f}s"
-    )
-    
-    # Track metrics
-    track_request(
-        method=request.method,
-        endpoint=request.url.path,
-        status_code=response.status_code,
-        duration=duration
-    )
     
-    # Add response time header
-    response.headers["X-Response-Time"] = f"{duration:.3f}s"
+    def __init__(self, app):
+        self.app = app
     
-    return response
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        path = scope["path"]
+        start_time = time.perf_counter()
+        status_code = 500  # If the app fails before sending a response
+        
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration = time.perf_counter() - start_time
+                
+                # Add response time header (raw bytes, no str -> bytes encode)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-response-time", b"%.3fs" % duration)
+                ]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Calculate duration
+            duration = time.perf_counter() - start_time
+            
+            # One log line per request - there is no separate "request received"
+            # line. Args are formatted lazily, on the listener thread.
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "← %s %s Status: %d Duration: %.3fs",
+                    method, path, status_code, duration
+                )
+            
+            # Track metrics, labelled by route template (/api/v1/meetings/{meeting_id})
+            # rather than raw path, so label cardinality stays bounded; unmatched
+            # paths (404 scans) share one label
+            route = scope.get("route")
+            track_request(
+                method=method,
+                endpoint=route.path if route is not None else "<unmatched>",
+                status_code=status_code,
+                duration=duration
+            )
+
+app.add_middleware(TimingMetricsMiddleware)
+
+# CORS - Allow frontend to call API
+# Added last = outermost, so preflight requests are answered before timing.
+# Credentials are only allowed with an explicit origin list: "*" with
+# credentials is invalid per the CORS spec and forces Starlette to
+# reflect the request origin on every response.
+cors_origins = [o.strip() for o in settings.CORS_ORIGINS.split(",") if o.strip()]
+allow_any_origin = not cors_origins or "*" in cors_origins
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"] if allow_any_origin else cors_origins,
+    allow_credentials=not allow_any_origin,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 # ============================================
 # EXCEPTION HANDLERS
 # ============================================
 
+# Exception messages can be huge (SQLAlchemy errors include every bound
+# parameter), so cap what goes into logs and response bodies
+MAX_ERROR_MESSAGE_CHARS = 1000
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle all uncaught exceptions"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    message = str(exc)[:MAX_ERROR_MESSAGE_CHARS]
     
-    return JSONResponse(
+    logger.exception("Unhandled %s at %s: %s", type(exc).__name__, request.url.path, message)
+    
+    return UTCORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
-            "message": str(exc) if settings.DEBUG else "An error occurred",
+            "message": message if settings.DEBUG else "An error occurred",
             "path": request.url.path,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
     )
 
-# ============================================
-# STARTUP / SHUTDOWN EVENTS
-# ============================================
-
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup"""
-    logger.info("=" * 50)
-    logger.info(f"🚀 Starting {settings.APP_NAME}")
-    logger.info(f"   Environment: {settings.ENV}")
-    logger.info(f"   Debug mode: {settings.DEBUG}")
-    logger.info(f"   Database: {settings.DATABASE_URL.split('@')[1] if '@' in settings.DATABASE_URL else 'Not configured'}")
-    logger.info("=" * 50)
-    
-    # Initialize metrics
-    setup_metrics(app)
-    logger.info("✅ Metrics initialized")
-    
-    # Test database connection
-    try:
-        from src.db.session import get_db
-        from src.db.models import Meeting
-        
-        with get_db() as db:
-            count = db.query(Meeting).count()
-            logger.info(f"✅ Database connected ({count} meetings)")
-    except Exception as e:
-        logger.error(f"❌ Database connection failed: {e}")
-    
-    # Test storage connection
-    try:
-        from src.utils.storage import get_storage_client
-        storage = get_storage_client()
-        logger.info("✅ Storage connected")
-    except Exception as e:
-        logger.error(f"❌ Storage connection failed: {e}")
-    
-    logger.info("🎉 Application ready!")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown"""
-    logger.info("Shutting down application...")
-    # Cleanup code here
-    logger.info("👋 Application stopped")
-
 # ============================================
 # HEALTH CHECK ENDPOINTS
 # ============================================
@@ -181,54 +259,76 @@ async def root():
         "metrics": "/metrics"
     }
 
+# Probe results are cached briefly so load balancer / UI polling doesn't
+# turn into a DB + Redis + MinIO round trip per request
+HEALTH_CACHE_TTL_SECONDS = 2.0
+_health_cache = {"value": None, "expires": 0.0}
+_health_lock = asyncio.Lock()
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """
     Health check endpoint
     
     Returns system status and service health
+    (cached for HEALTH_CACHE_TTL_SECONDS)
     Used by:
     - Load balancers
     - Monitoring systems
     - Docker health checks
     """
+    if time.monotonic() < _health_cache["expires"]:
+        return _health_cache["value"]
+    
+    async with _health_lock:
+        # Another request may have refreshed the cache while we waited
+        if time.monotonic() < _health_cache["expires"]:
+            return _health_cache["value"]
+        
+        health_status = await _run_health_checks()
+        _health_cache["value"] = health_status
+        _health_cache["expires"] = time.monotonic() + HEALTH_CACHE_TTL_SECONDS
+    
+    return health_status
+
+async def _check_db():
+    """Database probe (async driver, runs on the event loop)"""
+    async with get_async_db() as db:
+        await db.execute(text("SELECT 1"))
+
+def _storage_probe():
+    get_storage_client().client.bucket_exists(settings.MINIO_BUCKET)
+
+async def _check_storage():
+    """Storage probe (sync MinIO client, runs in a thread)"""
+    await asyncio.to_thread(_storage_probe)
+
+async def _check_redis():
+    """Redis probe (sync client, runs in a thread)"""
+    await asyncio.to_thread(get_redis().ping)
+
+async def _run_health_checks() -> dict:
+    """Probe database, storage and Redis concurrently"""
     health_status = {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.utcnow(),
         "services": {}
     }
     
-    # Check database
-    try:
-        from src.db.session import get_db
-        from src.db.models import Meeting
-        
-        with get_db() as db:
-            db.query(Meeting).count()
-        health_status["services"]["database"] = "healthy"
-    except Exception as e:
-        health_status["services"]["database"] = f"unhealthy: {str(e)}"
-        health_status["status"] = "degraded"
-    
-    # Check storage
-    try:
-        from src.utils.storage import get_storage_client
-        storage = get_storage_client()
-        storage.client.bucket_exists(settings.MINIO_BUCKET)
-        health_status["services"]["storage"] = "healthy"
-    except Exception as e:
-        health_status["services"]["storage"] = f"unhealthy: {str(e)}"
-        health_status["status"] = "degraded"
+    services = ("database", "storage", "redis")
+    results = await asyncio.gather(
+        _check_db(),
+        _check_storage(),
+        _check_redis(),
+        return_exceptions=True
+    )
     
-    # Check Redis
-    try:
-        import redis
-        r = redis.from_url(settings.REDIS_URL)
-        r.ping()
-        health_status["services"]["redis"] = "healthy"
-    except Exception as e:
-        health_status["services"]["redis"] = f"unhealthy: {str(e)}"
-        health_status["status"] = "degraded"
+    for service, result in zip(services, results):
+        if isinstance(result, Exception):
+            health_status["services"][service] = f"unhealthy: {str(result)}"
+            health_status["status"] = "degraded"
+        else:
+            health_status["services"][service] = "healthy"
     
     return health_status
 
@@ -246,17 +346,20 @@ async def readiness_probe():
     Kubernetes readiness probe
     Is the app ready to serve traffic?
     """
-    # Check critical services
-    try:
-        from src.db.session import get_db
-        with get_db() as db:
-            db.execute("SELECT 1")
-        return {"status": "ready"}
-    except:
-        return JSONResponse(
+    # Check critical services (database + Redis broker) concurrently
+    results = await asyncio.gather(
+        _check_db(),
+        _check_redis(),
+        return_exceptions=True
+    )
+    
+    if any(isinstance(result, Exception) for result in results):
+        return UTCORJSONResponse(
             status_code=503,
             content={"status": "not ready"}
         )
+    
+    return {"status": "ready"}
 
 # ============================================
 # INFO ENDPOINTS
@@ -285,6 +388,59 @@ async def app_info():
         }
     }
 
+# ============================================
+# LOG ENDPOINTS
+# ============================================
+
+LOG_FILE = Path("data/logs/app.log")
+LOG_TAIL_MAX_BYTES = 64 * 1024
+
+@app.get("/logs/tail", tags=["Info"])
+def tail_logs(offset: Optional[int] = Query(None, ge=0)):
+    """
+    Log bytes written since `offset` (at most 64 KB per call)
+    
+    Clients keep `next_offset` and pass it back, so each poll only moves
+    the new bytes. Without an offset, starts at the last 64 KB. If the
+    file shrank (rotated/truncated) reading restarts from 0.
+    Only served in DEBUG mode (logs aren't public).
+    
+    Returns:
+        {"data": "...", "offset": 1024, "next_offset": 2048}
+    """
+    if not settings.DEBUG:
+        raise HTTPException(status_code=404, detail="Not Found")
+    
+    if not LOG_FILE.exists():
+        return {"data": "", "offset": 0, "next_offset": 0}
+    
+    size = LOG_FILE.stat().st_size
+    from_tail = offset is None
+    if from_tail:
+        offset = max(0, size - LOG_TAIL_MAX_BYTES)
+    elif offset > size:
+        offset = 0
+    
+    with open(LOG_FILE, "rb") as f:
+        f.seek(offset)
+        chunk = f.read(min(size - offset, LOG_TAIL_MAX_BYTES))
+    
+    # Tail reads usually start mid-line: skip to the next full line
+    if from_tail and offset > 0 and b"\n" in chunk:
+        skip = chunk.index(b"\n") + 1
+        chunk = chunk[skip:]
+        offset += skip
+    
+    # Only hand out whole lines when the read was capped
+    if len(chunk) == LOG_TAIL_MAX_BYTES and b"\n" in chunk:
+        chunk = chunk[:chunk.rindex(b"\n") + 1]
+    
+    return {
+        "data": chunk.decode("utf-8", errors="replace"),
+        "offset": offset,
+        "next_offset": offset + len(chunk)
+    }
+
 # ============================================
 # METRICS ENDPOINT (for Prometheus)
 # ============================================
@@ -318,12 +474,37 @@ logger.info("✅ API routes registered")
 # ============================================
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     
-    uvicorn.run(
-        "src.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,  # Auto-reload on code changes (development only)
-        log_level="info"
-    )
\ No newline at end of file
+    # No TCP_NODELAY option needed: both asyncio and uvloop transports set
+    # it on every accepted TCP socket, so small live-audio WebSocket frames
+    # (/api/v1/ws/transcribe) are never held back by Nagle's algorithm.
+    # Don't swap in a custom server/socket factory that loses this.
+    #
+    # permessage-deflate is refused (ws_per_message_deflate=False): PCM and
+    # Opus audio frames barely compress, so zlib would only cost CPU on
+    # both ends of every chunk.
+    
+    if settings.DEBUG:
+        uvicorn.run(
+            "src.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,  # Auto-reload on code changes (development only)
+            ws_per_message_deflate=False,
+            log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "src.main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=settings.WORKERS,
+            # uvloop + httptools (uvicorn[standard]); uvloop isn't available on Windows
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            ws_per_message_deflate=False,
+            log_level="info",
+            access_log=False  # TimingMetricsMiddleware already logs every request
+        )
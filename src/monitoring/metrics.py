@@ -34,7 +34,8 @@ http_requests_total = Counter(
 http_request_duration_seconds = Histogram(
     'http_request_duration_seconds',
     'HTTP request duration in seconds',
-    ['method', 'endpoint']
+    ['method', 'endpoint'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
 )
 
 http_requests_in_progress = Gauge(
@@ -109,26 +110,46 @@ storage_bytes_downloaded = Counter(
 # HELPER FUNCTIONS
 # ============================================
 
+# Labelled children per label tuple, so the hot path skips .labels()
+# (label validation + lock + dict lookup) after the first request.
+# Bounded because endpoints are route templates.
+_request_counter_cache = {}
+_request_duration_cache = {}
+
 def track_request(method: str, endpoint: str, status_code: int, duration: float):
     """
     Track HTTP request metrics
     
     Args:
         method: HTTP method (GET, POST, etc.)
-        endpoint: Request path
+        endpoint: Route template (e.g. /api/v1/meetings/{meeting_id})
         status_code: Response status code
         duration: Request duration in seconds
     """
-    http_requests_total.labels(
-        method=method,
-        endpoint=endpoint,
-        status_code=status_code
-    ).inc()
+    counter_key = (method, endpoint, status_code)
+    counter = _request_counter_cache.get(counter_key)
+    if counter is None:
+        counter = _request_counter_cache.setdefault(
+            counter_key,
+            http_requests_total.labels(
+                method=method,
+                endpoint=endpoint,
+                status_code=status_code
+            )
+        )
+    counter.inc()
     
-    http_request_duration_seconds.labels(
-        method=method,
-        endpoint=endpoint
-    ).observe(duration)
+    duration_key = (method, endpoint)
+    histogram = _request_duration_cache.get(duration_key)
+    if histogram is None:
+        histogram = _request_duration_cache.setdefault(
+            duration_key,
+            http_request_duration_seconds.labels(
+                method=method,
+                endpoint=endpoint
+            )
+        )
+    histogram.observe(duration)
 
 def track_meeting(status: str):
     """
@@ -234,17 +255,22 @@ class track_time:
         self.duration = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.duration = time.time() - self.start_time
+        self.duration = time.perf_counter() - self.start_time
         return False
 
 # ============================================
 # SETUP FUNCTION
 # ============================================
 
+# Rendered /metrics body, reused for METRICS_CACHE_TTL_SECONDS so that
+# several scrapers hitting at once only walk the registry once
+METRICS_CACHE_TTL_SECONDS = 1.0
+_metrics_cache = {"body": b"", "expires": 0.0}
+
 def setup_metrics(app: FastAPI):
     """
     Add metrics endpoint to FastAPI app
@@ -272,8 +298,13 @@ def setup_metrics(app: FastAPI):
             # TYPE http_request_duration_seconds histogram
             http_request_duration_seconds_bucket{method="GET",endpoint="/health",le="0.005"} 30.0
         """
+        now = time.monotonic()
+        if now >= _metrics_cache["expires"]:
+            _metrics_cache["body"] = generate_latest()
+            _metrics_cache["expires"] = now + METRICS_CACHE_TTL_SECONDS
+        
         return Response(
-            content=generate_latest(),
+            content=_metrics_cache["body"],
             media_type=CONTENT_TYPE_LATEST
         )
     
@@ -6,10 +6,12 @@ Request/response models for meeting endpoints
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Type, TypeVar
 from datetime import datetime
 from enum import Enum
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 # ============================================
 # ENUMS
 # ============================================
@@ -120,4 +122,28 @@ class MeetingListResponse(BaseModel):
     meetings: List[MeetingResponse]
     total: int
     page: int
-    page_size: int
\ No newline at end of file
+    page_size: int
+
+# ============================================
+# HELPERS
+# ============================================
+
+def fast_from_orm(cls: Type[ModelT], obj, **overrides) -> ModelT:
+    """
+    Build a response model from a trusted ORM object WITHOUT validation
+    
+    Uses model_construct(), so only pass objects loaded from our own
+    database (never user input). Fields are read with getattr(), so
+    pass relationship fields (e.g. action_items) as overrides instead of
+    triggering a lazy load.
+    
+    Example:
+        fast_from_orm(MeetingResponse, meeting, word_count=42)
+    """
+    data = {
+        name: getattr(obj, name, None)
+        for name in cls.model_fields
+        if name not in overrides
+    }
+    data.update(overrides)
+    return cls.model_construct(**data)
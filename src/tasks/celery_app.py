@@ -6,8 +6,10 @@ Sets up Celery for background task processing
 """
 
 from celery import Celery
+from celery.signals import worker_process_init
 from src.config import get_settings
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -19,7 +21,8 @@ settings = get_settings()
 celery_app = Celery(
     "meetingmind",
     broker=settings.CELERY_BROKER_URL,      # Redis for task queue
-    backend=settings.CELERY_RESULT_BACKEND  # Redis for results
+    backend=settings.CELERY_RESULT_BACKEND,  # Redis for results
+    include=["src.tasks.processing"]  # Register the pipeline tasks in workers
 )
 
 # ============================================
@@ -28,9 +31,12 @@ celery_app = Celery(
 
 celery_app.conf.update(
     # Task settings
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # msgpack: smaller and faster than JSON on the broker/result backend.
+    # Large binary data (audio) is never sent through the broker - tasks
+    # receive a meeting ID and fetch the audio from MinIO themselves.
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],  # json: tasks queued before the switch
+    result_serializer='msgpack',
     timezone='UTC',
     enable_utc=True,
     
@@ -43,8 +49,12 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,  # Process one task at a time
     worker_max_tasks_per_child=50,  # Restart worker after 50 tasks (prevent memory leaks)
     
+    # Broker connection pool: one connection per concurrently running
+    # task (default 10 would throttle the 16-thread io fleet)
+    broker_pool_limit=max(settings.CELERY_WORKER_CONCURRENCY or 0, 50),
+    
     # Result backend settings
-    result_expires=86400,  # Results expire after 24 hours
+    result_expires=3600,  # Results expire after 1 hour (only chord coordination uses them)
     
     # Retry settings
     task_acks_late=True,  # Acknowledge task after completion (not before)
@@ -55,9 +65,54 @@ celery_app.conf.update(
 # TASK ROUTES (organize tasks)
 # ============================================
 
+# Two worker fleets, so Whisper never competes with I/O-bound work:
+# - gpu: CPU/GPU-heavy transcription, prefork/solo pool, concurrency 1
+# - io:  LLM API calls, DB and MinIO, thread pool, high concurrency
+# See scripts/start_celery.py
+
 celery_app.conf.task_routes = {
-    'src.tasks.processing.*': {'queue': 'processing'},
+    'transcribe_meeting': {'queue': 'gpu'},
+    'process_meeting': {'queue': 'io'},
+    'analyze_meeting': {'queue': 'io'},
+    'extract_action_items': {'queue': 'io'},
+    'summarize_meeting': {'queue': 'io'},
+    'persist_meeting': {'queue': 'io'},
     'src.tasks.notifications.*': {'queue': 'notifications'},
 }
 
-logger.info("✅ Celery app configured")
\ No newline at end of file
+logger.info("✅ Celery app configured")
+
+# ============================================
+# WORKER WARM-UP
+# ============================================
+
+@worker_process_init.connect
+def warm_up_worker_process(**kwargs):
+    """
+    Load heavy singletons once per worker child, before it takes a task
+    
+    Without this, the first task on every prefork child pays the MinIO
+    handshake and the Whisper model load (10-30s). Fires for prefork
+    children only (the gpu fleet); solo/threads workers stay lazy.
+    """
+    # Imported here: the task modules import celery_app
+    from src.utils.storage import get_storage_client
+    from src.agents.orchestrator import get_orchestrator
+    from src.core.transcription import get_transcription_service
+    from src.db.session import engine
+    from sqlalchemy import text
+    
+    start_time = time.perf_counter()
+    
+    try:
+        # Open the first DB connection before the first task needs it
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        
+        get_storage_client()
+        get_orchestrator()  # All 4 agents
+        get_transcription_service()  # Whisper weights
+        logger.info(f"🔥 Worker process warmed up in {time.perf_counter() - start_time:.1f}s")
+    except Exception as e:
+        # Tasks retry the lazy init themselves; don't kill the child
+        logger.warning(f"⚠️  Worker warm-up failed: {e}")
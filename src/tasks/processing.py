@@ -3,15 +3,39 @@
 Meeting Processing Tasks
 ========================
 Background tasks for processing meeting audio with ALL AI agents
+
+The pipeline runs as a Celery canvas (DAG) instead of one long task:
+
+    transcribe ──┬── analyze ──────────┐
+                 ├── extract_actions ──┼── persist
+                 └── summarize ────────┘
+
+- Analyzer, Action Hunter and Summarizer run in parallel (a chord)
+- Each step saves its own output and marks itself in meeting.step_status,
+  so a re-run (retry, crash, re-dispatch) skips steps already processed
+- The meeting row is read once (when claimed) into a MeetingContext that
+  travels with the workflow; steps only write (UPDATE, no SELECT)
+- Chords need a result backend (CELERY_RESULT_BACKEND, Redis); only the
+  chord header steps store results, the rest use ignore_result
 """
 
+from celery import chain, chord, group
+from sqlalchemy import insert, update, select, func, literal, text
+from sqlalchemy.dialects.postgresql import JSONB
 from src.tasks.celery_app import celery_app
 from src.db.session import get_db
 from src.db.models import Meeting, ActionItem, MeetingStatus, ActionItemPriority
-from src.db.repositories.meeting_repo import MeetingRepository, ActionItemRepository
-from src.agents.orchestrator import get_orchestrator
+from src.db.repositories.meeting_repo import MeetingRepository, STALE_CLAIM_AFTER
+from src.agents.transcriber import get_transcriber_agent
+from src.agents.analyzer import get_content_analyzer_agent
+from src.agents.action_hunter import get_action_hunter_agent
+from src.agents.summarizer import get_summarizer_agent
 from src.utils.storage import get_storage_client
-from src.monitoring.metrics import track_meeting, track_meeting_processing_time
+from src.utils.redis_client import redis_semaphore
+from src.monitoring.metrics import track_meeting, track_meeting_processing_time, track_storage_download
+from src.config import get_settings
+from typing import Dict, List, Optional
+from dataclasses import dataclass, asdict
 import logging
 import time
 from pathlib import Path
@@ -19,197 +43,535 @@ import tempfile
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# NOTE: Celery tasks are synchronous, so they use the sync session from
+# get_db() and SQLAlchemy statements directly (the repositories are async,
+# for the API).
+
+# ============================================
+# STEP STATUS (resumable workflow)
+# ============================================
+
+STEP_TRANSCRIBE = "transcribe"
+STEP_ANALYZE = "analyze"
+STEP_EXTRACT_ACTIONS = "extract_actions"
+STEP_SUMMARIZE = "summarize"
+
+STEP_PROCESSED = "processed"
+
+MAX_RETRIES = 3
+
+# Log banner, built once (not per call)
+_BANNER = "=" * 70
+
+# ============================================
+# MEETING CONTEXT (threaded through the workflow)
+# ============================================
+
+@dataclass(frozen=True)
+class MeetingContext:
+    """
+    Meeting fields the pipeline needs, read once when the meeting is claimed
+
+    Passed between tasks as a plain dict (asdict), so steps never
+    re-query the meeting row just to read its metadata.
+    """
+    id: int
+    title: str
+    description: Optional[str]
+    participants: Optional[List[str]]
+    audio_object_name: str
+    meeting_date: Optional[str]  # ISO format
+    step_status: Dict  # Snapshot at claim time
+
+    def agent_context(self) -> Dict:
+        """Context dict the AI agents expect"""
+        return {
+            "title": self.title,
+            "description": self.description,
+            "participants": self.participants,
+            "meeting_date": self.meeting_date
+        }
+
+    def is_step_processed(self, step: str) -> bool:
+        """Had this pipeline step already been saved when the meeting was claimed?"""
+        return self.step_status.get(step) == STEP_PROCESSED
+
+def _save_step(db, meeting_id: int, step: str, **values):
+    """
+    Save a step's output and mark the step processed, in one UPDATE
+
+    step_status is merged server-side (jsonb ||), so parallel steps
+    finishing at the same time can't overwrite each other's marker.
+    """
+    db.execute(
+        update(Meeting)
+        .where(Meeting.id == meeting_id)
+        .values(
+            step_status=func.coalesce(Meeting.step_status, text("'{}'::jsonb")).op("||")(
+                literal({step: STEP_PROCESSED}, JSONB)
+            ),
+            **values
+        )
+    )
+
+# ============================================
+# ACTION ITEM PARSING
+# ============================================
+
+_PRIORITY_MAP = {
+    'low': ActionItemPriority.LOW,
+    'medium': ActionItemPriority.MEDIUM,
+    'high': ActionItemPriority.HIGH,
+    'critical': ActionItemPriority.CRITICAL
+}
+_DEFAULT_PRIORITY = ActionItemPriority.MEDIUM
+
+def _parse_due_date(value):
+    """Parse an agent's 'YYYY-MM-DD' due date (None if missing/invalid)"""
+    if not value:
+        return None
+    try:
+        # C-implemented ISO parser, much faster than strptime
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+# ============================================
+# AUDIO DOWNLOAD CACHE
+# ============================================
+
+AUDIO_CACHE_DIR = Path(tempfile.gettempdir()) / "mm_cache"
+
+# Safety net for files no task cleaned up (worker killed mid-step):
+# far longer than the whole retry schedule (60s + 120s + 240s)
+AUDIO_CACHE_MAX_AGE_SECONDS = 24 * 3600
+
+def _prune_audio_cache():
+    """Delete cached audio (and partial downloads) older than the max age"""
+    cutoff = time.time() - AUDIO_CACHE_MAX_AGE_SECONDS
+    for path in AUDIO_CACHE_DIR.glob("*"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass  # Removed concurrently by another worker
+
+def _download_audio_cached(storage_client, object_name: str) -> str:
+    """
+    Download audio to a local cache keyed by the object's ETag
+
+    A retry on the same worker reuses the file instead of downloading
+    it again (ETag + size match = same content). The caller deletes it
+    once transcription succeeds or finally fails; stale leftovers are
+    pruned here.
+
+    Returns:
+        Local file path
+    """
+    stat = storage_client.stat(object_name)
+    etag = stat.etag.strip('"')
+    cached_path = AUDIO_CACHE_DIR / f"{etag}{Path(object_name).suffix}"
+
+    if cached_path.exists() and cached_path.stat().st_size == stat.size:
+        logger.info("   ♻️  Using cached audio: %s", cached_path.name)
+        return str(cached_path)
+
+    AUDIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _prune_audio_cache()
+
+    # Download beside the target and rename, so a crash mid-download
+    # never leaves a truncated file under the cache key
+    partial_path = cached_path.with_name(cached_path.name + ".part")
+    downloaded_bytes = storage_client.download_to_file(object_name, str(partial_path))
+    partial_path.replace(cached_path)
+    track_storage_download(downloaded_bytes)
+
+    logger.info("   ✅ Downloaded: %d bytes", downloaded_bytes)
+    return str(cached_path)
+
+def _retry_or_fail(task, meeting_id: int, step: str, exc: Exception):
+    """
+    Retry a failed step with exponential backoff
 
-@celery_app.task(bind=True, name="process_meeting")
+    The meeting is only marked FAILED once retries are exhausted.
+    """
+    logger.error("❌ Step '%s' failed for meeting %d: %s", step, meeting_id, exc, exc_info=True)
+
+    if task.request.retries >= MAX_RETRIES:
+        try:
+            with get_db() as db:
+                db.execute(
+                    update(Meeting)
+                    .where(Meeting.id == meeting_id)
+                    .values(status=MeetingStatus.FAILED)
+                )
+
+            track_meeting("failed")
+        except:
+            pass
+
+    raise task.retry(exc=exc, countdown=60 * (2 ** task.request.retries), max_retries=MAX_RETRIES)
+
+# ============================================
+# ENTRY POINT
+# ============================================
+
+@celery_app.task(bind=True, name="process_meeting", ignore_result=True)
 def process_meeting_task(self, meeting_id: int):
     """
     Process meeting audio file with FULL AI PIPELINE
-    
-    Pipeline:
-    1. Download audio from storage
-    2. Transcribe with Whisper
-    3. Clean transcript with LLM
-    4. Analyze content (topics, sentiment, decisions)
-    5. Extract action items
-    6. Generate summary
-    7. Save all results to database
-    
+
+    Pipeline (Celery canvas):
+    1. Transcribe with Whisper + clean with LLM
+    2. In parallel: analyze content, extract action items, generate summary
+    3. Persist final status and metrics
+
+    This task only builds the workflow and replaces itself with it, so
+    the task ID returned to the API tracks the whole pipeline.
+
     Args:
         meeting_id: ID of meeting to process
-    
+
+    Returns:
+        Nothing on success (results are saved on the meeting row)
+    """
+    logger.info(_BANNER)
+    logger.info("🎬 FULL MEETING PROCESSING - Meeting %d", meeting_id)
+    logger.info("   Task ID: %s", self.request.id)
+    logger.info(_BANNER)
+
+    # Atomic claim instead of read-check-write: if the same meeting is
+    # queued twice, only one worker gets the row back
+    with get_db() as db:
+        claimed = db.execute(
+            MeetingRepository.claim_statement(meeting_id).returning(
+                Meeting.title,
+                Meeting.description,
+                Meeting.participants,
+                Meeting.audio_object_name,
+                Meeting.meeting_date,
+                Meeting.step_status
+            )
+        ).first()
+
+    if claimed is None:
+        with get_db() as db:
+            status = db.execute(
+                select(Meeting.status).where(Meeting.id == meeting_id)
+            ).scalar_one_or_none()
+
+        # In flight - or claimed by a worker that died before publishing the
+        # workflow (this may be that task, redelivered). Look again once such
+        # a claim would be stale; the claim then succeeds only if nothing
+        # touched the meeting in between.
+        if status == MeetingStatus.PROCESSING and self.request.retries == 0:
+            logger.warning("⚠️  Meeting %d in flight, re-checking once the claim is stale", meeting_id)
+            raise self.retry(countdown=STALE_CLAIM_AFTER.total_seconds() + 60, max_retries=1)
+
+        logger.warning("⚠️  Meeting %d not found, already processed or in flight", meeting_id)
+        return {"status": "already_processed_or_in_flight"}
+
+    logger.info("   Status: %s", MeetingStatus.PROCESSING.value)
+
+    ctx = MeetingContext(
+        id=meeting_id,
+        title=claimed.title,
+        description=claimed.description,
+        participants=claimed.participants,
+        audio_object_name=claimed.audio_object_name,
+        meeting_date=claimed.meeting_date.isoformat() if claimed.meeting_date else None,
+        step_status=claimed.step_status or {}
+    )
+
+    if ctx.step_status:
+        logger.info("   Resuming, steps done: %s", list(ctx.step_status))
+
+    # Wall-clock start (time.time, not perf_counter: compared across workers)
+    started_at = time.time()
+
+    workflow = chain(
+        transcribe_task.s(asdict(ctx)),
+        chord(
+            group(
+                analyze_task.s(),
+                extract_actions_task.s(),
+                summarize_task.s()
+            ),
+            persist_task.s(meeting_id, started_at)
+        )
+    )
+
+    logger.info("   Agents: Transcriber → (Analyzer | Action Hunter | Summarizer) → Persist")
+    raise self.replace(workflow)
+
+# ============================================
+# STEP 1: TRANSCRIPTION
+# ============================================
+
+@celery_app.task(bind=True, name="transcribe_meeting", ignore_result=True)
+def transcribe_task(self, context: Dict) -> Dict:
+    """
+    Transcribe meeting audio and save the cleaned transcript
+
+    Args:
+        context: MeetingContext as a dict
+
+    Returns:
+        Payload for the parallel steps:
+        {"context": {...}, "transcript": "..."}
+    """
+    ctx = MeetingContext(**context)
+    local_audio_path = None
+
+    try:
+        if ctx.is_step_processed(STEP_TRANSCRIBE):
+            logger.info("⏭️  Meeting %d: transcript already saved, skipping", ctx.id)
+            with get_db() as db:
+                transcript = db.execute(
+                    select(Meeting.transcript).where(Meeting.id == ctx.id)
+                ).scalar_one()
+            return {"context": context, "transcript": transcript}
+
+        object_name = ctx.audio_object_name
+
+        # Get audio from storage
+        storage_client = get_storage_client()
+
+        if settings.STREAM_AUDIO_FROM_STORAGE:
+            # Whisper's ffmpeg reads the presigned URL directly (no local copy)
+            logger.info("\n🔗 Streaming audio from storage...")
+            audio_source = storage_client.get_presigned_url(object_name, expires=3600)
+        else:
+            # Stream to disk (audio never held in memory), reused on retry
+            logger.info("\n📥 Downloading audio from storage...")
+            local_audio_path = _download_audio_cached(storage_client, object_name)
+            audio_source = local_audio_path
+
+        # Global cap so extra workers can't oversubscribe GPU memory
+        with redis_semaphore("whisper_slots", slots=settings.WHISPER_MAX_CONCURRENT):
+            transcription = get_transcriber_agent().transcribe_audio(audio_source, ctx.agent_context())
+
+        with get_db() as db:
+            _save_step(
+                db, ctx.id, STEP_TRANSCRIBE,
+                transcript=transcription['cleaned_transcript'],
+                word_count=transcription['word_count'],
+                duration_seconds=transcription['duration']
+            )
+
+        logger.info("   ✅ Transcript saved: %d words", transcription['word_count'])
+
+        # Only drop the cached audio on success (a retry reuses it)
+        if local_audio_path:
+            Path(local_audio_path).unlink(missing_ok=True)
+
+        return {"context": context, "transcript": transcription['cleaned_transcript']}
+
+    except Exception as e:
+        # Out of retries: nothing will reuse the cached audio
+        if local_audio_path and self.request.retries >= MAX_RETRIES:
+            Path(local_audio_path).unlink(missing_ok=True)
+        _retry_or_fail(self, ctx.id, STEP_TRANSCRIBE, e)
+
+# ============================================
+# STEP 2: PARALLEL AGENTS (chord header)
+# ============================================
+# These keep their (small) results: the chord collects them from the
+# result backend before calling persist_task.
+
+@celery_app.task(bind=True, name="analyze_meeting")
+def analyze_task(self, payload: Dict) -> Dict:
+    """
+    Analyze content (topics, sentiment) and save it
+
+    Args:
+        payload: Output of transcribe_task
+
     Returns:
-        dict: Processing results
-    """
-    logger.info(f"=" * 70)
-    logger.info(f"🎬 FULL MEETING PROCESSING - Meeting {meeting_id}")
-    logger.info(f"   Task ID: {self.request.id}")
-    logger.info(f"=" * 70)
-    
-    start_time = time.time()
-    
+        {"key_topics": 3, "sentiment_score": 0.7}
+    """
+    ctx = MeetingContext(**payload["context"])
+
     try:
-        # Step 1: Get meeting from database
+        if ctx.is_step_processed(STEP_ANALYZE):
+            logger.info("⏭️  Meeting %d: analysis already saved, skipping", ctx.id)
+            with get_db() as db:
+                row = db.execute(
+                    select(Meeting.key_topics, Meeting.sentiment_score).where(Meeting.id == ctx.id)
+                ).one()
+            return {
+                "key_topics": len(row.key_topics or []),
+                "sentiment_score": row.sentiment_score or 0.0
+            }
+
+        analysis = get_content_analyzer_agent().analyze(
+            payload["transcript"],
+            ctx.agent_context()
+        )
+
+        key_topics = analysis.get('key_topics', [])
+        sentiment_score = analysis.get('sentiment', {}).get('overall_score', 0.0)
+
         with get_db() as db:
-            meeting = MeetingRepository.get_by_id(db, meeting_id)
-            
-            if not meeting:
-                logger.error(f"❌ Meeting {meeting_id} not found")
-                return {"status": "error", "message": "Meeting not found"}
-            
-            if meeting.status == MeetingStatus.COMPLETED:
-                logger.warning(f"⚠️  Meeting {meeting_id} already processed")
-                return {"status": "already_processed"}
-            
-            # Update to processing
-            meeting.status = MeetingStatus.PROCESSING
-            logger.info(f"   Status: {meeting.status.value}")
-            
-            # Get meeting context
-            meeting_context = {
-                "title": meeting.title,
-                "description": meeting.description,
-                "participants": meeting.participants,
-                "meeting_date": meeting.meeting_date.isoformat() if meeting.meeting_date else None
+            _save_step(
+                db, ctx.id, STEP_ANALYZE,
+                key_topics=key_topics,
+                sentiment_score=sentiment_score
+            )
+
+        logger.info("   ✅ Analysis saved: %d topics", len(key_topics))
+        return {"key_topics": len(key_topics), "sentiment_score": sentiment_score}
+
+    except Exception as e:
+        _retry_or_fail(self, ctx.id, STEP_ANALYZE, e)
+
+@celery_app.task(bind=True, name="extract_action_items")
+def extract_actions_task(self, payload: Dict) -> Dict:
+    """
+    Extract action items and save them
+
+    Args:
+        payload: Output of transcribe_task
+
+    Returns:
+        {"action_items": 5}
+    """
+    ctx = MeetingContext(**payload["context"])
+
+    try:
+        if ctx.is_step_processed(STEP_EXTRACT_ACTIONS):
+            logger.info("⏭️  Meeting %d: action items already saved, skipping", ctx.id)
+            with get_db() as db:
+                count = db.execute(
+                    select(func.count(ActionItem.id)).where(ActionItem.meeting_id == ctx.id)
+                ).scalar_one()
+            return {"action_items": count}
+
+        action_items = get_action_hunter_agent().extract_action_items(
+            payload["transcript"],
+            ctx.agent_context()
+        )
+
+        logger.info("   💼 Saving %d action items...", len(action_items))
+
+        rows = [
+            {
+                'meeting_id': ctx.id,
+                'title': item['title'],
+                'description': item.get('description'),
+                'assigned_to': item.get('assigned_to'),
+                'due_date': _parse_due_date(item.get('due_date')),
+                'priority': _PRIORITY_MAP.get(item.get('priority'), _DEFAULT_PRIORITY),
+                'confidence_score': item.get('confidence', 0.5),
+                'transcript_snippet': item.get('snippet')
             }
-        
-        # Step 2: Download audio from storage
-        logger.info(f"\n📥 Downloading audio from storage...")
-        storage_client = get_storage_client()
-        
-        # Extract object name from path
-        object_name = meeting.audio_file_path.split("/", 1)[1]
-        audio_data = storage_client.download_file(object_name)
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-            temp_file.write(audio_data)
-            temp_audio_path = temp_file.name
-        
-        logger.info(f"   ✅ Downloaded: {len(audio_data)} bytes")
-        
-        # Step 3: Run FULL AI PIPELINE (all agents!)
-        logger.info(f"\n🤖 Running AI Agent Pipeline...")
-        logger.info(f"   Agents: Transcriber → Analyzer → Action Hunter → Summarizer")
-        
-        orchestrator = get_orchestrator()
-        results = orchestrator.process_meeting_full(
-            audio_path=temp_audio_path,
-            meeting_context=meeting_context
+            for item in action_items
+        ]
+
+        with get_db() as db:
+            # One multi-row INSERT instead of one INSERT per item
+            if rows:
+                db.execute(insert(ActionItem), rows)
+
+            _save_step(db, ctx.id, STEP_EXTRACT_ACTIONS)
+
+        logger.info("   ✅ Action items saved")
+        return {"action_items": len(action_items)}
+
+    except Exception as e:
+        _retry_or_fail(self, ctx.id, STEP_EXTRACT_ACTIONS, e)
+
+@celery_app.task(bind=True, name="summarize_meeting")
+def summarize_task(self, payload: Dict) -> Dict:
+    """
+    Generate the meeting summary and save it
+
+    Args:
+        payload: Output of transcribe_task
+
+    Returns:
+        {"summary_chars": 1200}
+    """
+    ctx = MeetingContext(**payload["context"])
+
+    try:
+        if ctx.is_step_processed(STEP_SUMMARIZE):
+            logger.info("⏭️  Meeting %d: summary already saved, skipping", ctx.id)
+            with get_db() as db:
+                summary = db.execute(
+                    select(Meeting.summary).where(Meeting.id == ctx.id)
+                ).scalar_one()
+            return {"summary_chars": len(summary or "")}
+
+        summary = get_summarizer_agent().generate_summary(
+            payload["transcript"],
+            ctx.agent_context(),
+            summary_type="standard"
         )
-        
-        # Step 4: Save ALL results to database
-        logger.info(f"\n💾 Saving results to database...")
-        
+
+        with get_db() as db:
+            _save_step(db, ctx.id, STEP_SUMMARIZE, summary=summary)
+
+        logger.info("   ✅ Summary saved")
+        return {"summary_chars": len(summary)}
+
+    except Exception as e:
+        _retry_or_fail(self, ctx.id, STEP_SUMMARIZE, e)
+
+# ============================================
+# STEP 3: PERSIST (chord callback)
+# ============================================
+
+@celery_app.task(bind=True, name="persist_meeting", ignore_result=True)
+def persist_task(self, step_results: List[Dict], meeting_id: int, started_at: float):
+    """
+    Finalize a meeting once all parallel steps are done
+
+    Args:
+        step_results: Results of analyze/extract_actions/summarize (chord)
+        meeting_id: ID of meeting
+        started_at: time.time() when the workflow was dispatched
+
+    Nothing is returned: results live on the meeting row (the API polls
+    the DB), so storing them in the result backend would only leak keys.
+    """
+    try:
+        results = {}
+        for step_result in step_results:
+            results.update(step_result)
+
+        total_time = time.time() - started_at
+
         with get_db() as db:
-            meeting = MeetingRepository.get_by_id(db, meeting_id)
-            
-            # 4.1: Save transcript
-            meeting.transcript = results['transcription']['cleaned_transcript']
-            meeting.duration_seconds = results['transcription']['duration']
-            
-            # 4.2: Save analysis results
-            analysis = results['analysis']
-            meeting.key_topics = analysis.get('key_topics', [])
-            meeting.sentiment_score = analysis.get('sentiment', {}).get('overall_score', 0.0)
-            
-            # 4.3: Save summary
-            meeting.summary = results['summary']
-            
-            # 4.4: Save processing metrics
-            meeting.processing_time_seconds = results['metadata']['total_processing_time']
-            meeting.status = MeetingStatus.COMPLETED
-            
-            logger.info(f"   ✅ Meeting data saved")
-            
-            # 4.5: Save action items
-            action_items = results['action_items']
-            logger.info(f"   💼 Saving {len(action_items)} action items...")
-            
-            for item in action_items:
-                # Parse due date
-                due_date = None
-                if item.get('due_date'):
-                    try:
-                        due_date = datetime.strptime(item['due_date'], '%Y-%m-%d')
-                    except:
-                        pass
-                
-                # Map priority
-                priority_map = {
-                    'low': ActionItemPriority.LOW,
-                    'medium': ActionItemPriority.MEDIUM,
-                    'high': ActionItemPriority.HIGH,
-                    'critical': ActionItemPriority.CRITICAL
-                }
-                priority = priority_map.get(item.get('priority', 'medium'), ActionItemPriority.MEDIUM)
-                
-                # Create action item
-                action_item_data = {
-                    'meeting_id': meeting_id,
-                    'title': item['title'],
-                    'description': item.get('description'),
-                    'assigned_to': item.get('assigned_to'),
-                    'due_date': due_date,
-                    'priority': priority,
-                    'confidence_score': item.get('confidence', 0.5),
-                    'transcript_snippet': item.get('snippet')
-                }
-                
-                ActionItemRepository.create(db, action_item_data)
-            
-            logger.info(f"   ✅ Action items saved")
-        
-        # Step 5: Cleanup
-        Path(temp_audio_path).unlink(missing_ok=True)
-        
+            row = db.execute(
+                update(Meeting)
+                .where(Meeting.id == meeting_id)
+                .values(
+                    processing_time_seconds=total_time,
+                    status=MeetingStatus.COMPLETED
+                )
+                .returning(Meeting.word_count, Meeting.duration_seconds)
+            ).one()
+
+        word_count = row.word_count or 0
+        duration = row.duration_seconds
+
         # Track metrics
-        total_time = time.time() - start_time
         track_meeting_processing_time(total_time)
         track_meeting("completed")
-        
-        # Build result summary
-        result_summary = {
-            "status": "success",
-            "meeting_id": meeting_id,
-            "results": {
-                "transcript_words": results['metadata']['word_count'],
-                "duration_seconds": results['metadata']['duration'],
-                "key_topics": len(analysis.get('key_topics', [])),
-                "action_items": len(action_items),
-                "sentiment_score": analysis.get('sentiment', {}).get('overall_score', 0.0)
-            },
-            "processing": {
-                "total_time": total_time,
-                "transcription_time": results['transcription']['transcription_time'],
-                "analysis_time": total_time - results['transcription']['processing_time']
-            }
-        }
-        
-        logger.info(f"\n" + "=" * 70)
-        logger.info(f"✅ MEETING {meeting_id} FULLY PROCESSED!")
-        logger.info(f"=" * 70)
-        logger.info(f"   📝 Transcript: {results['metadata']['word_count']} words")
-        logger.info(f"   🔍 Topics: {len(analysis.get('key_topics', []))}")
-        logger.info(f"   💼 Action Items: {len(action_items)}")
-        logger.info(f"   😊 Sentiment: {analysis.get('sentiment', {}).get('overall_score', 0.0):.2f}")
-        logger.info(f"   ⏱️  Total Time: {total_time:.1f}s")
-        logger.info(f"=" * 70)
-        
-        return result_summary
-    
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", _BANNER)
+            logger.info("✅ MEETING %d FULLY PROCESSED!", meeting_id)
+            logger.info(_BANNER)
+            logger.info("   📝 Transcript: %d words (%.1fs audio)", word_count, duration or 0.0)
+            logger.info("   🔍 Topics: %d", results.get('key_topics', 0))
+            logger.info("   💼 Action Items: %d", results.get('action_items', 0))
+            logger.info("   😊 Sentiment: %.2f", results.get('sentiment_score', 0.0))
+            logger.info("   ⏱️  Total Time: %.1fs", total_time)
+            logger.info(_BANNER)
+
     except Exception as e:
-        logger.error(f"❌ Processing failed for meeting {meeting_id}: {e}", exc_info=True)
-        
-        # Update status to failed
-        try:
-            with get_db() as db:
-                meeting = MeetingRepository.get_by_id(db, meeting_id)
-                if meeting:
-                    meeting.status = MeetingStatus.FAILED
-            
-            track_meeting("failed")
-        except:
-            pass
-        
-        # Retry task (max 3 retries, exponential backoff)
-        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries), max_retries=3)
\ No newline at end of file
+        _retry_or_fail(self, meeting_id, "persist", e)
@@ -0,0 +1,89 @@
+# src/utils/redis_client.py
+"""
+Redis Client
+============
+Shared Redis connection (API and workers)
+
+redis.from_url() opens a new connection pool on every call, so code in
+request handlers should use get_redis() and reuse pooled connections.
+"""
+
+import redis
+from src.config import get_settings
+from contextlib import contextmanager
+from functools import lru_cache
+import logging
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    """
+    Get Redis client (singleton pattern)
+    
+    Usage:
+        from src.utils.redis_client import get_redis
+        get_redis().ping()
+    """
+    pool = redis.ConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=20,
+        socket_keepalive=True
+    )
+    return redis.Redis(connection_pool=pool)
+
+# ============================================
+# DISTRIBUTED SEMAPHORE
+# ============================================
+
+@contextmanager
+def redis_semaphore(
+    name: str,
+    slots: int,
+    ttl: int = 3600,
+    poll_interval: float = 1.0
+):
+    """
+    Cap how many holders (across ALL workers/hosts) run a block at once
+    
+    Each slot is a Redis key claimed with SET NX EX. The TTL frees the
+    slot if a holder dies without releasing it, so it must exceed the
+    longest expected hold time.
+    
+    Args:
+        name: Semaphore name (key prefix)
+        slots: Maximum concurrent holders
+        ttl: Slot expiry in seconds (crash safety)
+        poll_interval: Seconds between attempts while all slots are taken
+    
+    Example:
+        with redis_semaphore("whisper_slots", slots=2):
+            transcribe(...)
+    """
+    client = get_redis()
+    token = uuid.uuid4().hex
+    key = None
+    wait_start = time.perf_counter()
+    
+    while key is None:
+        for i in range(slots):
+            slot_key = f"semaphore:{name}:{i}"
+            if client.set(slot_key, token, nx=True, ex=ttl):
+                key = slot_key
+                break
+        else:
+            time.sleep(poll_interval)
+    
+    waited = time.perf_counter() - wait_start
+    if waited > poll_interval:
+        logger.info(f"🚦 Acquired {name} slot after {waited:.1f}s")
+    
+    try:
+        yield
+    finally:
+        # Only release our own slot (it may have expired and been re-claimed)
+        if client.get(key) == token.encode():
+            client.delete(key)
@@ -13,9 +13,15 @@ Why not save files on disk?
 
 from minio import Minio
 from minio.error import S3Error
+import boto3
+import urllib3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from src.config import get_settings
+from functools import lru_cache
 import io
-from typing import BinaryIO, Optional, List
+from typing import BinaryIO, Optional, List, Iterator, Tuple
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -23,6 +29,15 @@ from datetime import datetime, timedelta
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Large transfers (audio) use parallel ranged GETs / multipart uploads
+# of 8MB parts instead of a single HTTP stream
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
 class StorageClient:
     """MinIO/S3 storage client for file management"""
     
@@ -37,11 +52,39 @@ class StorageClient:
         """
         logger.info(f"Connecting to MinIO at {settings.MINIO_ENDPOINT}")
         
+        # Connection pool sized for concurrent worker threads (minio's
+        # default of 10 makes extra threads wait or open throwaway sockets)
+        pool_size = max(settings.CELERY_WORKER_CONCURRENCY or 0, 10)
+        
         self.client = Minio(
             settings.MINIO_ENDPOINT,
             access_key=settings.MINIO_ACCESS_KEY,
             secret_key=settings.MINIO_SECRET_KEY,
-            secure=settings.MINIO_SECURE  # False = HTTP, True = HTTPS
+            secure=settings.MINIO_SECURE,  # False = HTTP, True = HTTPS
+            http_client=urllib3.PoolManager(
+                num_pools=2,
+                maxsize=pool_size,
+                block=False,
+                timeout=urllib3.Timeout(connect=10, read=300),
+                retries=urllib3.Retry(
+                    total=5,
+                    backoff_factor=0.2,
+                    status_forcelist=[500, 502, 503, 504]
+                )
+            )
+        )
+        
+        # S3 API client for multipart transfers (same credentials/endpoint)
+        scheme = "https" if settings.MINIO_SECURE else "http"
+        self.s3 = boto3.client(
+            "s3",
+            endpoint_url=f"{scheme}://{settings.MINIO_ENDPOINT}",
+            aws_access_key_id=settings.MINIO_ACCESS_KEY,
+            aws_secret_access_key=settings.MINIO_SECRET_KEY,
+            config=Config(
+                max_pool_connections=max(pool_size, 50),
+                s3={"addressing_style": "path"}  # MinIO: bucket in path, not hostname
+            )
         )
         
         self.bucket_name = settings.MINIO_BUCKET
@@ -65,46 +108,48 @@ class StorageClient:
         self,
         file_data: BinaryIO,
         object_name: str,
-        content_type: str = "application/octet-stream"
-    ) -> str:
+        content_type: str = "application/octet-stream",
+        file_size: Optional[int] = None
+    ) -> Tuple[str, str]:
         """
         Upload file to MinIO
         
+        The upload is streamed (multipart above 8MB), so the size is
+        only needed for logging - it's never probed by seeking to the end.
+        
         Args:
             file_data: File-like object (bytes)
             object_name: Path in bucket (e.g., "meetings/abc123.wav")
             content_type: MIME type (e.g., "audio/wav")
+            file_size: Size in bytes, if the caller already knows it
         
         Returns:
-            Full path: "meeting-audio/meetings/abc123.wav"
+            (bucket, object_name): ("meeting-audio", "meetings/abc123.wav")
         
         Example:
             with open("meeting.wav", "rb") as f:
-                path = storage.upload_file(f, "meetings/test.wav", "audio/wav")
+                bucket, object_name = storage.upload_file(f, "meetings/test.wav", "audio/wav")
         """
         try:
-            # Get file size
-            file_data.seek(0, 2)  # Seek to end
-            file_size = file_data.tell()
-            file_data.seek(0)  # Seek back to start
-            
-            logger.info(f"Uploading {object_name} ({file_size} bytes)")
+            if file_size is not None:
+                logger.info(f"Uploading {object_name} ({file_size} bytes)")
+            else:
+                logger.info(f"Uploading {object_name} (streaming, size unknown)")
             
-            # Upload to MinIO
-            self.client.put_object(
+            # Upload to MinIO (multipart + parallel above 8MB)
+            self.s3.upload_fileobj(
+                file_data,
                 self.bucket_name,
                 object_name,
-                file_data,
-                file_size,
-                content_type=content_type
+                ExtraArgs={"ContentType": content_type},
+                Config=TRANSFER_CONFIG
             )
             
-            full_path = f"{self.bucket_name}/{object_name}"
-            logger.info(f"✅ Uploaded: {full_path}")
+            logger.info(f"✅ Uploaded: {self.bucket_name}/{object_name}")
             
-            return full_path
+            return self.bucket_name, object_name
             
-        except S3Error as e:
+        except ClientError as e:
             logger.error(f"Upload failed: {e}")
             raise Exception(f"Failed to upload file: {e}")
     
@@ -138,6 +183,43 @@ class StorageClient:
             logger.error(f"Download failed: {e}")
             raise Exception(f"Failed to download file: {e}")
     
+    def download_to_file(self, object_name: str, dst_path: str) -> int:
+        """
+        Download file from MinIO straight to disk
+        
+        Unlike download_file(), the object is never held in memory. Large
+        objects are fetched as parallel 8MB ranged GETs (TRANSFER_CONFIG),
+        which is several times faster than one HTTP stream. Use this for
+        audio; keep download_file() for small objects.
+        
+        Args:
+            object_name: Path in bucket (e.g., "meetings/abc123.wav")
+            dst_path: Local file to write
+        
+        Returns:
+            Number of bytes written
+        
+        Example:
+            storage.download_to_file("meetings/test.wav", "/tmp/test.wav")
+        """
+        try:
+            logger.info(f"Downloading {object_name} -> {dst_path}")
+            
+            self.s3.download_file(
+                self.bucket_name,
+                object_name,
+                dst_path,
+                Config=TRANSFER_CONFIG
+            )
+            size = Path(dst_path).stat().st_size
+            
+            logger.info(f"✅ Downloaded: {object_name} ({size} bytes)")
+            return size
+            
+        except ClientError as e:
+            logger.error(f"Download failed: {e}")
+            raise Exception(f"Failed to download file: {e}")
+    
     def get_presigned_url(self, object_name: str, expires: int = 3600) -> str:
         """
         Generate presigned URL for temporary access to a file.
@@ -183,9 +265,38 @@ class StorageClient:
             logger.error(f"Delete failed: {e}")
             return False
     
-    def list_files(self, prefix: str = "") -> List[str]:
+    def iter_files(self, prefix: str = "") -> Iterator[str]:
+        """
+        Iterate over files in bucket (lazily, page by page)
+        
+        Names are yielded as MinIO returns each page, so callers that
+        only need the first few matches don't wait for the full listing
+        and nothing is held in memory. Errors surface while iterating.
+        
+        Args:
+            prefix: Filter by prefix (e.g., "meetings/" shows only meeting files)
+        
+        Yields:
+            File paths
+        
+        Example:
+            for name in storage.iter_files("meetings/"):
+                print(name)
+            
+            count = sum(1 for _ in storage.iter_files("meetings/"))
+        """
+        objects = self.client.list_objects(
+            self.bucket_name,
+            prefix=prefix,
+            recursive=True
+        )
+        yield from (obj.object_name for obj in objects)
+    
+    def list_files_all(self, prefix: str = "") -> List[str]:
         """
-        List files in bucket
+        List ALL files in bucket (materialized)
+        
+        Prefer iter_files() for large buckets.
         
         Args:
             prefix: Filter by prefix (e.g., "meetings/" shows only meeting files)
@@ -194,22 +305,29 @@ class StorageClient:
             List of file paths
         
         Example:
-            files = storage.list_files("meetings/")
+            files = storage.list_files_all("meetings/")
             # Returns: ["meetings/abc.wav", "meetings/def.wav", ...]
         """
         try:
-            objects = self.client.list_objects(
-                self.bucket_name,
-                prefix=prefix,
-                recursive=True
-            )
-            files = [obj.object_name for obj in objects]
+            files = list(self.iter_files(prefix))
             logger.info(f"Listed {len(files)} files with prefix '{prefix}'")
             return files
         except S3Error as e:
             logger.error(f"List failed: {e}")
             return []
     
+    def stat(self, object_name: str):
+        """
+        Get object metadata (size, etag, ...) without downloading it
+        
+        Args:
+            object_name: Path in bucket
+        
+        Returns:
+            minio.datatypes.Object (has .size, .etag, .last_modified)
+        """
+        return self.client.stat_object(self.bucket_name, object_name)
+    
     def file_exists(self, object_name: str) -> bool:
         """Check if file exists"""
         try:
@@ -222,8 +340,7 @@ class StorageClient:
 # SINGLETON INSTANCE
 # ============================================
 
-_storage_client: Optional[StorageClient] = None
-
+@lru_cache(maxsize=1)
 def get_storage_client() -> StorageClient:
     """
     Get storage client (singleton pattern)
@@ -233,7 +350,4 @@ def get_storage_client() -> StorageClient:
         storage = get_storage_client()
         storage.upload_file(...)
     """
-    global _storage_client
-    if _storage_client is None:
-        _storage_client = StorageClient()
-    return _storage_client
\ No newline at end of file
+    return StorageClient()
\ No newline at end of file
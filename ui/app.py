@@ -7,12 +7,16 @@ Beautiful web interface for meeting intelligence
 
 import streamlit as st
 import sys
+import threading
+import time
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from ui.components.api_client import get_session
+
 # Page config (MUST be first Streamlit command)
 st.set_page_config(
     page_title="MeetingMind AI",
@@ -26,6 +30,51 @@ st.set_page_config(
     }
 )
 
+API_URL = "http://localhost:8000"
+
+STATUS_REFRESH_SECONDS = 5
+
+@st.cache_resource
+def _system_status() -> dict:
+    """
+    Sidebar status, refreshed by ONE background thread per server
+    
+    Reruns only read this dict, so a slow or offline API never blocks
+    the page (previously up to 2s + 2s of timeouts per rerun).
+    
+    Keys:
+        api_online: True / False / None (not checked yet)
+        total_meetings: int or None
+    """
+    status = {"api_online": None, "total_meetings": None}
+    
+    def refresh(session):
+        while True:
+            try:
+                response = session.get(f"{API_URL}/health", timeout=1)
+                status["api_online"] = response.status_code == 200
+            except Exception:
+                status["api_online"] = False
+            
+            try:
+                # Only `total` is read: fetch one row, not a full page
+                response = session.get(
+                    f"{API_URL}/api/v1/meetings",
+                    params={"limit": 1},
+                    timeout=1
+                )
+                if response.status_code == 200:
+                    status["total_meetings"] = response.json().get('total', 0)
+            except Exception:
+                pass
+            
+            time.sleep(STATUS_REFRESH_SECONDS)
+    
+    threading.Thread(
+        target=refresh, args=(get_session(),), daemon=True, name="sidebar-status"
+    ).start()
+    return status
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -143,27 +192,20 @@ with st.sidebar:
     # API Status
     st.markdown("### 🔌 System Status")
     
-    # Check API connection
-    try:
-        import requests
-        response = requests.get("http://localhost:8000/health", timeout=2)
-        if response.status_code == 200:
-            st.success("✅ API Online")
-        else:
-            st.error("❌ API Error")
-    except:
+    # Check API connection (read from the background refresher)
+    status = _system_status()
+    if status["api_online"] is None:
+        st.info("⏳ Checking API...")
+    elif status["api_online"]:
+        st.success("✅ API Online")
+    else:
         st.error("❌ API Offline")
     
     st.markdown("---")
     
     # Quick stats
-    try:
-        response = requests.get("http://localhost:8000/api/v1/meetings", timeout=2)
-        if response.status_code == 200:
-            data = response.json()
-            st.metric("Total Meetings", data.get('total', 0))
-    except:
-        pass
+    if status["total_meetings"] is not None:
+        st.metric("Total Meetings", status["total_meetings"])
     
     st.markdown("---")
     st.markdown("### ℹ️ About")
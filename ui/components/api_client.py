@@ -0,0 +1,52 @@
+# ui/components/api_client.py
+"""
+API Client Resources
+====================
+HTTP session and thread pool shared by every UI page
+
+Both are st.cache_resource singletons: one keep-alive connection pool
+and one thread pool per Streamlit process, reused across reruns, pages
+and browser tabs (page-local copies meant one pool per page).
+
+The API is served by uvicorn, which speaks HTTP/1.1 only (no h2/h2c),
+so an HTTP/2 client would fall back to one request per connection
+anyway; concurrent calls share the keep-alive pool instead.
+
+Usage:
+    from ui.components.api_client import get_session, get_executor
+
+    response = get_session().get(f"{API_URL}/health", timeout=2)
+    future = get_executor().submit(fetch, get_session())
+"""
+
+import streamlit as st
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """
+    Process-wide HTTP session
+
+    Idempotent requests retry twice on connection errors (not on read
+    timeouts, so an unresponsive API still fails fast in health probes).
+    """
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, read=0, backoff_factor=0.2)
+    ))
+    return session
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Process-wide thread pool for short API calls (probes, overlapped fetches)
+
+    Cached functions must still be called on the script thread; pass
+    get_session() into the submitted function instead.
+    """
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="api")
@@ -8,16 +8,20 @@ Visualize meeting analytics and trends
 import streamlit as st
 import requests
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import orjson
+import numpy as np
+import itertools
 from datetime import datetime, timedelta
-from collections import Counter
+import io
 import sys
 from pathlib import Path
+from typing import Optional
 
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from ui.components.api_client import get_session, get_executor
+
 st.set_page_config(page_title="Analytics", page_icon="📈", layout="wide")
 
 st.title("📈 Meeting Analytics")
@@ -25,369 +29,575 @@ st.markdown("Insights and trends from your meetings.")
 
 API_URL = "http://localhost:8000"
 
-# Check API
+# ============================================
+# HTTP
+# ============================================
+
+def _api_online(session: requests.Session) -> bool:
+    """Health probe (plain HTTP, safe to run off the script thread)"""
+    try:
+        return session.get(f"{API_URL}/health", timeout=2).status_code == 200
+    except Exception:
+        return False
+
+@st.cache_resource
+def _etag_store() -> dict:
+    """Last (ETag, body) per meetings query, shared by all sessions"""
+    return {}
+
+ETAG_STORE_MAX = 32
+
+def _get_meetings(params: dict, timeout: float) -> dict:
+    """
+    Conditional GET of the meetings list
+    
+    Sends the stored ETag as If-None-Match; on 304 Not Modified the
+    stored body is reused, so unchanged data costs no download or JSON
+    parse when the 30s cache expires.
+    """
+    store = _etag_store()
+    key = tuple(sorted(params.items()))
+    cached = store.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    
+    response = get_session().get(f"{API_URL}/api/v1/meetings", params=params, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        return cached[1]
+    
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    etag = response.headers.get("ETag")
+    if etag:
+        store.pop(key, None)
+        if len(store) >= ETAG_STORE_MAX:
+            store.pop(next(iter(store)))  # oldest entry
+        store[key] = (etag, data)
+    
+    return data
+
+# The meetings endpoint caps `limit` at 100 (larger values are a 422)
+API_PAGE_SIZE = 100
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_meetings(max_meetings: int = 1000, status: Optional[str] = None) -> dict:
+    """
+    Fetch up to `max_meetings` meetings, page by page (cached for 30s)
+    
+    Reruns reuse the cached result instead of re-downloading every page.
+    Raises on non-200 responses so errors are never cached.
+    
+    Returns:
+        {"meetings": [...], "total": n} (total as reported by the API)
+    """
+    meetings = []
+    total = 0
+    
+    while len(meetings) < max_meetings:
+        params = {"skip": len(meetings), "limit": min(API_PAGE_SIZE, max_meetings - len(meetings))}
+        if status:
+            params["status"] = status
+        
+        page = _get_meetings(params, timeout=10)
+        total = page.get('total', 0)
+        meetings.extend(page.get('meetings', []))
+        
+        if not page.get('meetings') or len(meetings) >= total:
+            break
+    
+    return {"meetings": meetings, "total": total}
+
+# Compact dtypes for the meetings DataFrame (Int32 keeps missing values)
+DOWNCAST_DTYPES = {
+    'duration_seconds': 'float32',
+    'processing_time_seconds': 'float32',
+    'sentiment_score': 'float32',
+    'word_count': 'Int32',
+}
+
+def _top_values(df: pd.DataFrame, column: str, n: int) -> pd.Series:
+    """
+    Most common values across a list-valued column
+    
+    explode() + value_counts() count in pandas' C hashtable instead of
+    a Python Counter. Returns an empty Series if the API omitted the column.
+    """
+    if column not in df:
+        return pd.Series(dtype='int64')
+    return df[column].explode().dropna().astype('string').value_counts().head(n)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _csv_bytes(_df: pd.DataFrame, snapshot_key: tuple) -> bytes:
+    """
+    CSV export, encoded once per meetings snapshot
+    
+    _df is not hashed (leading underscore); snapshot_key identifies the
+    data, so reruns reuse the cached bytes instead of re-serializing.
+    """
+    buffer = io.BytesIO()
+    _df.to_csv(buffer, index=False, float_format='%.3f')
+    return buffer.getvalue()
+
+def _list_values(df: pd.DataFrame, column: str):
+    """Raw values of a list-valued column (all None if the API omitted it)"""
+    return df[column].values if column in df else itertools.repeat(None, len(df))
+
+STATUS_COLORS = {
+    'completed': '#4CAF50',
+    'processing': '#FFC107',
+    'failed': '#F44336',
+    'uploading': '#2196F3'
+}
+
+# Max points sent to the browser per time-series chart
+MAX_PLOT_POINTS = 2000
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling
+    
+    Picks n_out row indices that preserve the visual shape of the
+    series (peaks and dips survive), so the browser renders ~2k points
+    instead of every meeting.
+    
+    Args:
+        x: Sorted numeric x values
+        y: y values
+        n_out: Number of points to keep
+    
+    Returns:
+        Sorted row indices (all rows if len(x) <= n_out)
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    
+    return indices
+
+# Probe /health in the background while the meetings fetch runs, so
+# page load waits for the slower call instead of both in sequence
+health_future = get_executor().submit(_api_online, get_session())
+
 try:
-    health_response = requests.get(f"{API_URL}/health", timeout=2)
-    api_online = health_response.status_code == 200
-except:
-    api_online = False
+    data, fetch_error = fetch_meetings(), None
+except Exception as e:
+    data, fetch_error = None, e
 
-if not api_online:
+if not health_future.result():
     st.error("⚠️ **API is offline!**")
     st.stop()
 
+# Plotly is only needed once there is data to chart; importing it here
+# keeps the offline / error path from paying its cold-import cost
+import plotly.express as px
+import plotly.graph_objects as go
+
 # Fetch all meetings
 try:
-    response = requests.get(f"{API_URL}/api/v1/meetings", params={"skip": 0, "limit": 1000}, timeout=10)
+    if fetch_error:
+        raise fetch_error
+    meetings = data.get('meetings', [])
     
-    if response.status_code == 200:
-        data = response.json()
-        meetings = data.get('meetings', [])
-        
-        if not meetings:
-            st.info("📭 No meetings yet. Upload some meetings to see analytics!")
-            st.stop()
-        
-        # Convert to DataFrame for easier analysis
-        df = pd.DataFrame(meetings)
-        df['created_at'] = pd.to_datetime(df['created_at'])
-        df['duration_minutes'] = df['duration_seconds'] / 60
-        
-        # Overview metrics
-        st.markdown("### 📊 Overview")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            total_meetings = len(df)
-            st.metric("Total Meetings", total_meetings)
-        
-        with col2:
-            total_duration = df['duration_seconds'].sum() / 3600  # hours
-            st.metric("Total Hours", f"{total_duration:.1f}h")
-        
-        with col3:
-            completed = len(df[df['status'] == 'completed'])
-            st.metric("Completed", f"{completed} ({completed/total_meetings*100:.0f}%)")
-        
-        with col4:
-            avg_duration = df['duration_minutes'].mean()
-            st.metric("Avg Duration", f"{avg_duration:.1f} min")
-        
-        st.markdown("---")
-        
-        # Time series - Meetings over time
-        st.markdown("### 📅 Meeting Frequency Over Time")
-        
-        df['date'] = df['created_at'].dt.date
-        meetings_per_day = df.groupby('date').size().reset_index(name='count')
+    if not meetings:
+        st.info("📭 No meetings yet. Upload some meetings to see analytics!")
+        st.stop()
+    
+    # Convert to DataFrame for easier analysis
+    df = pd.DataFrame(meetings)
+    df['created_at'] = pd.to_datetime(df['created_at'], utc=True, format='ISO8601')
+    
+    # Downcast: halves the bytes Plotly and to_csv have to walk
+    for col, dtype in DOWNCAST_DTYPES.items():
+        if col in df:
+            df[col] = df[col].astype(dtype)
+    df['status'] = df['status'].astype('category')
+    
+    # One pass over status, reused by the metrics, pie chart and report
+    status_counts = df['status'].value_counts()
+    completed = int(status_counts.get('completed', 0))
+    
+    df['duration_minutes'] = df['duration_seconds'] / 60
+    
+    # Count action items per meeting
+    df['action_item_count'] = np.fromiter(
+        (len(items) if isinstance(items, list) else 0 for items in _list_values(df, 'action_items')),
+        dtype=np.int32,
+        count=len(df)
+    )
+    
+    # Every metric-card / report aggregate in a single agg() call
+    agg_spec = {
+        'duration_seconds': ['sum', 'mean'],
+        'action_item_count': ['sum', 'mean'],
+    }
+    if 'sentiment_score' in df:
+        agg_spec['sentiment_score'] = ['mean']
+    stats = df.agg(agg_spec)
+    
+    total_hours = stats.at['sum', 'duration_seconds'] / 3600
+    avg_duration = stats.at['mean', 'duration_seconds'] / 60  # minutes
+    total_action_items = int(stats.at['sum', 'action_item_count'])
+    avg_action_items = stats.at['mean', 'action_item_count']
+    avg_sentiment = stats.at['mean', 'sentiment_score'] if 'sentiment_score' in stats else float('nan')
+    
+    # Overview metrics
+    st.markdown("### 📊 Overview")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        total_meetings = len(df)
+        st.metric("Total Meetings", total_meetings)
+    
+    with col2:
+        st.metric("Total Hours", f"{total_hours:.1f}h")
+    
+    with col3:
+        st.metric("Completed", f"{completed} ({completed/total_meetings*100:.0f}%)")
+    
+    with col4:
+        st.metric("Avg Duration", f"{avg_duration:.1f} min")
+    
+    st.markdown("---")
+    
+    # Time series - Meetings over time
+    st.markdown("### 📅 Meeting Frequency Over Time")
+    
+    # Datetime binning in C (no per-row Python date keys); empty days count 0
+    meetings_per_day = (
+        df.set_index('created_at')
+        .resample('D')
+        .size()
+        .rename('count')
+        .rename_axis('date')
+        .reset_index()
+    )
+    
+    fig_timeline = px.line(
+        meetings_per_day,
+        x='date',
+        y='count',
+        title='Meetings Per Day',
+        labels={'date': 'Date', 'count': 'Number of Meetings'},
+        render_mode='webgl'
+    )
+    fig_timeline.update_traces(line_color='#667eea')
+    fig_timeline.update_layout(hovermode='x unified')
+    
+    st.plotly_chart(fig_timeline, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Duration analysis
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### ⏱️ Meeting Duration Distribution")
+        
+        fig_duration = px.histogram(
+            df[df['duration_minutes'] > 0],
+            x='duration_minutes',
+            nbins=20,
+            title='Distribution of Meeting Durations',
+            labels={'duration_minutes': 'Duration (minutes)', 'count': 'Number of Meetings'}
+        )
+        fig_duration.update_traces(marker_color='#4CAF50')
         
-        fig_timeline = px.line(
-            meetings_per_day,
-            x='date',
-            y='count',
-            title='Meetings Per Day',
-            labels={'date': 'Date', 'count': 'Number of Meetings'}
+        st.plotly_chart(fig_duration, use_container_width=True)
+    
+    with col2:
+        st.markdown("### 📊 Status Breakdown")
+        
+        fig_status = px.pie(
+            values=status_counts.values,
+            names=status_counts.index,
+            title='Meeting Status Distribution',
+            color=status_counts.index,
+            color_discrete_map=STATUS_COLORS
         )
-        fig_timeline.update_traces(line_color='#667eea')
-        fig_timeline.update_layout(hovermode='x unified')
         
-        st.plotly_chart(fig_timeline, use_container_width=True)
+        st.plotly_chart(fig_status, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Topics analysis
+    st.markdown("### 🏷️ Most Common Topics")
+    
+    # Top topics via pandas' C hashtable; topic_counts is also reused
+    # by the summary report below
+    topic_counts = _top_values(df, 'key_topics', 15)
+    
+    if not topic_counts.empty:
+        topic_df = topic_counts.rename_axis('Topic').reset_index(name='Count')
+        
+        fig_topics = px.bar(
+            topic_df,
+            x='Count',
+            y='Topic',
+            orientation='h',
+            title='Top 15 Discussion Topics',
+            color='Count',
+            color_continuous_scale='Viridis'
+        )
+        fig_topics.update_layout(showlegend=False, height=500)
         
-        st.markdown("---")
+        st.plotly_chart(fig_topics, use_container_width=True)
+    else:
+        st.info("No topic data available yet.")
+    
+    st.markdown("---")
+    
+    # Sentiment analysis
+    if 'sentiment_score' in df.columns and df['sentiment_score'].notna().any():
+        st.markdown("### 😊 Sentiment Trends")
         
-        # Duration analysis
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("### ⏱️ Meeting Duration Distribution")
-            
-            fig_duration = px.histogram(
-                df[df['duration_minutes'] > 0],
-                x='duration_minutes',
-                nbins=20,
-                title='Distribution of Meeting Durations',
-                labels={'duration_minutes': 'Duration (minutes)', 'count': 'Number of Meetings'}
-            )
-            fig_duration.update_traces(marker_color='#4CAF50')
+            # Gauge chart for average sentiment
+            fig_sentiment_gauge = go.Figure(go.Indicator(
+                mode="gauge+number+delta",
+                value=avg_sentiment,
+                domain={'x': [0, 1], 'y': [0, 1]},
+                title={'text': "Average Sentiment"},
+                delta={'reference': 0},
+                gauge={
+                    'axis': {'range': [-1, 1]},
+                    'bar': {'color': "darkblue"},
+                    'steps': [
+                        {'range': [-1, -0.3], 'color': "#ffcccc"},
+                        {'range': [-0.3, 0.3], 'color': "#ffffcc"},
+                        {'range': [0.3, 1], 'color': "#ccffcc"}
+                    ],
+                    'threshold': {
+                        'line': {'color': "red", 'width': 4},
+                        'thickness': 0.75,
+                        'value': 0
+                    }
+                }
+            ))
             
-            st.plotly_chart(fig_duration, use_container_width=True)
+            st.plotly_chart(fig_sentiment_gauge, use_container_width=True)
         
         with col2:
-            st.markdown("### 📊 Status Breakdown")
-            
-            status_counts = df['status'].value_counts()
-            
-            fig_status = px.pie(
-                values=status_counts.values,
-                names=status_counts.index,
-                title='Meeting Status Distribution',
-                color_discrete_map={
-                    'completed': '#4CAF50',
-                    'processing': '#FFC107',
-                    'failed': '#F44336',
-                    'uploading': '#2196F3'
-                }
-            )
+            # Sentiment over time
+            sentiment_time = df[df['sentiment_score'].notna()].copy()
+            sentiment_time = sentiment_time.sort_values('created_at')
             
-            st.plotly_chart(fig_status, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Topics analysis
-        st.markdown("### 🏷️ Most Common Topics")
-        
-        # Extract all topics
-        all_topics = []
-        for topics in df['key_topics'].dropna():
-            if isinstance(topics, list):
-                all_topics.extend(topics)
-        
-        if all_topics:
-            topic_counts = Counter(all_topics).most_common(15)
-            topic_df = pd.DataFrame(topic_counts, columns=['Topic', 'Count'])
+            # Downsample large histories before they go over the wire
+            if len(sentiment_time) > MAX_PLOT_POINTS:
+                created = sentiment_time['created_at']
+                keep = _lttb_indices(
+                    (created - created.min()).dt.total_seconds().to_numpy(),
+                    sentiment_time['sentiment_score'].to_numpy(dtype=np.float64),
+                    MAX_PLOT_POINTS
+                )
+                sentiment_time = sentiment_time.iloc[keep]
             
-            fig_topics = px.bar(
-                topic_df,
-                x='Count',
-                y='Topic',
-                orientation='h',
-                title='Top 15 Discussion Topics',
-                color='Count',
-                color_continuous_scale='Viridis'
+            fig_sentiment_time = px.scatter(
+                sentiment_time,
+                x='created_at',
+                y='sentiment_score',
+                title='Sentiment Over Time',
+                labels={'created_at': 'Date', 'sentiment_score': 'Sentiment Score'},
+                color='sentiment_score',
+                color_continuous_scale='RdYlGn',
+                hover_data=['title'],
+                render_mode='webgl'
             )
-            fig_topics.update_layout(showlegend=False, height=500)
-            
-            st.plotly_chart(fig_topics, use_container_width=True)
-        else:
-            st.info("No topic data available yet.")
-        
-        st.markdown("---")
-        
-        # Sentiment analysis
-        if 'sentiment_score' in df.columns and df['sentiment_score'].notna().any():
-            st.markdown("### 😊 Sentiment Trends")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                avg_sentiment = df['sentiment_score'].mean()
-                
-                # Gauge chart for average sentiment
-                fig_sentiment_gauge = go.Figure(go.Indicator(
-                    mode="gauge+number+delta",
-                    value=avg_sentiment,
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    title={'text': "Average Sentiment"},
-                    delta={'reference': 0},
-                    gauge={
-                        'axis': {'range': [-1, 1]},
-                        'bar': {'color': "darkblue"},
-                        'steps': [
-                            {'range': [-1, -0.3], 'color': "#ffcccc"},
-                            {'range': [-0.3, 0.3], 'color': "#ffffcc"},
-                            {'range': [0.3, 1], 'color': "#ccffcc"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 0
-                        }
-                    }
-                ))
-                
-                st.plotly_chart(fig_sentiment_gauge, use_container_width=True)
+            fig_sentiment_time.add_hline(y=0, line_dash="dash", line_color="gray")
+            fig_sentiment_time.update_layout(height=400)
             
-            with col2:
-                # Sentiment over time
-                sentiment_time = df[df['sentiment_score'].notna()].copy()
-                sentiment_time = sentiment_time.sort_values('created_at')
-                
-                fig_sentiment_time = px.scatter(
-                    sentiment_time,
-                    x='created_at',
-                    y='sentiment_score',
-                    title='Sentiment Over Time',
-                    labels={'created_at': 'Date', 'sentiment_score': 'Sentiment Score'},
-                    color='sentiment_score',
-                    color_continuous_scale='RdYlGn',
-                    hover_data=['title']
-                )
-                fig_sentiment_time.add_hline(y=0, line_dash="dash", line_color="gray")
-                fig_sentiment_time.update_layout(height=400)
-                
-                st.plotly_chart(fig_sentiment_time, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Action items analysis
-        st.markdown("### 💼 Action Items Overview")
-        
-        # Count action items per meeting
-        action_item_counts = []
-        for meeting in meetings:
-            if meeting.get('action_items'):
-                action_item_counts.append(len(meeting['action_items']))
-            else:
-                action_item_counts.append(0)
-        
-        df['action_item_count'] = action_item_counts
+            st.plotly_chart(fig_sentiment_time, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Action items analysis
+    st.markdown("### 💼 Action Items Overview")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Total Action Items", total_action_items)
+    
+    with col2:
+        st.metric("Avg per Meeting", f"{avg_action_items:.1f}")
+    
+    with col3:
+        meetings_with_actions = int((df['action_item_count'] > 0).sum())
+        st.metric("Meetings with Actions", f"{meetings_with_actions} ({meetings_with_actions/len(df)*100:.0f}%)")
+    
+    # Action items distribution
+    fig_actions = px.histogram(
+        df,
+        x='action_item_count',
+        title='Action Items per Meeting',
+        labels={'action_item_count': 'Number of Action Items', 'count': 'Number of Meetings'},
+        nbins=15
+    )
+    fig_actions.update_traces(marker_color='#764ba2')
+    
+    st.plotly_chart(fig_actions, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Processing efficiency
+    st.markdown("### ⚡ Processing Efficiency")
+    
+    processing_data = df[df['processing_time_seconds'].notna() & df['duration_seconds'].notna()].copy()
+    
+    if not processing_data.empty:
+        processing_data['efficiency_ratio'] = processing_data['processing_time_seconds'] / processing_data['duration_seconds']
         
-        col1, col2, col3 = st.columns(3)
+        col1, col2 = st.columns(2)
         
         with col1:
-            total_action_items = df['action_item_count'].sum()
-            st.metric("Total Action Items", int(total_action_items))
-        
-        with col2:
-            avg_action_items = df['action_item_count'].mean()
-            st.metric("Avg per Meeting", f"{avg_action_items:.1f}")
-        
-        with col3:
-            meetings_with_actions = len(df[df['action_item_count'] > 0])
-            st.metric("Meetings with Actions", f"{meetings_with_actions} ({meetings_with_actions/len(df)*100:.0f}%)")
-        
-        # Action items distribution
-        fig_actions = px.histogram(
-            df,
-            x='action_item_count',
-            title='Action Items per Meeting',
-            labels={'action_item_count': 'Number of Action Items', 'count': 'Number of Meetings'},
-            nbins=15
-        )
-        fig_actions.update_traces(marker_color='#764ba2')
-        
-        st.plotly_chart(fig_actions, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Processing efficiency
-        st.markdown("### ⚡ Processing Efficiency")
-        
-        processing_data = df[df['processing_time_seconds'].notna() & df['duration_seconds'].notna()].copy()
-        
-        if not processing_data.empty:
-            processing_data['efficiency_ratio'] = processing_data['processing_time_seconds'] / processing_data['duration_seconds']
+            avg_processing_time = processing_data['processing_time_seconds'].mean()
+            st.metric("Avg Processing Time", f"{avg_processing_time:.1f}s")
             
-            col1, col2 = st.columns(2)
+            avg_ratio = processing_data['efficiency_ratio'].mean()
+            st.metric("Avg Speed", f"{avg_ratio:.2f}x realtime")
             
-            with col1:
-                avg_processing_time = processing_data['processing_time_seconds'].mean()
-                st.metric("Avg Processing Time", f"{avg_processing_time:.1f}s")
-                
-                avg_ratio = processing_data['efficiency_ratio'].mean()
-                st.metric("Avg Speed", f"{avg_ratio:.2f}x realtime")
-                
-                st.caption("Lower is better (e.g., 0.5x = processes 2x faster than realtime)")
-            
-            with col2:
-                fig_efficiency = px.scatter(
-                    processing_data,
-                    x='duration_minutes',
-                    y='processing_time_seconds',
-                    title='Processing Time vs Meeting Duration',
-                    labels={
-                        'duration_minutes': 'Meeting Duration (minutes)',
-                        'processing_time_seconds': 'Processing Time (seconds)'
-                    },
-                    hover_data=['title'],
-                    trendline="ols"
-                )
-                fig_efficiency.update_traces(marker=dict(size=10, opacity=0.6))
-                
-                st.plotly_chart(fig_efficiency, use_container_width=True)
+            st.caption("Lower is better (e.g., 0.5x = processes 2x faster than realtime)")
         
-        st.markdown("---")
-        
-        # Participant analysis
-        st.markdown("### 👥 Participant Analysis")
-        
-        all_participants = []
-        for participants in df['participants'].dropna():
-            if isinstance(participants, list):
-                all_participants.extend(participants)
-        
-        if all_participants:
-            participant_counts = Counter(all_participants).most_common(10)
-            participant_df = pd.DataFrame(participant_counts, columns=['Participant', 'Meetings'])
-            
-            col1, col2 = st.columns(2)
+        with col2:
+            fig_efficiency = px.scatter(
+                processing_data,
+                x='duration_minutes',
+                y='processing_time_seconds',
+                title='Processing Time vs Meeting Duration',
+                labels={
+                    'duration_minutes': 'Meeting Duration (minutes)',
+                    'processing_time_seconds': 'Processing Time (seconds)'
+                },
+                hover_data=['title'],
+                render_mode='webgl'
+            )
+            fig_efficiency.update_traces(marker=dict(size=10, opacity=0.6))
             
-            with col1:
-                st.markdown("**Most Active Participants:**")
-                st.dataframe(
-                    participant_df,
-                    hide_index=True,
-                    use_container_width=True
+            # Least-squares trendline (replaces px's statsmodels "ols")
+            x = processing_data['duration_minutes'].to_numpy(dtype=np.float64)
+            if len(np.unique(x)) >= 2:
+                slope, intercept = np.polyfit(
+                    x, processing_data['processing_time_seconds'].to_numpy(dtype=np.float64), 1
                 )
+                x_line = np.array([x.min(), x.max()])
+                fig_efficiency.add_trace(go.Scattergl(
+                    x=x_line,
+                    y=slope * x_line + intercept,
+                    mode='lines',
+                    name='Trend',
+                    showlegend=False
+                ))
             
-            with col2:
-                fig_participants = px.bar(
-                    participant_df,
-                    x='Participant',
-                    y='Meetings',
-                    title='Top Participants by Meeting Count',
-                    color='Meetings',
-                    color_continuous_scale='Blues'
-                )
-                fig_participants.update_layout(showlegend=False)
-                
-                st.plotly_chart(fig_participants, use_container_width=True)
-        else:
-            st.info("No participant data available.")
-        
-        st.markdown("---")
-        
-        # Export data
-        st.markdown("### 📥 Export Data")
+            st.plotly_chart(fig_efficiency, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Participant analysis
+    st.markdown("### 👥 Participant Analysis")
+    
+    participant_counts = _top_values(df, 'participants', 10)
+    
+    if not participant_counts.empty:
+        participant_df = participant_counts.rename_axis('Participant').reset_index(name='Meetings')
         
         col1, col2 = st.columns(2)
         
         with col1:
-            csv = df.to_csv(index=False)
-            st.download_button(
-                "📊 Download CSV",
-                csv,
-                "meeting_analytics.csv",
-                "text/csv",
+            st.markdown("**Most Active Participants:**")
+            st.dataframe(
+                participant_df,
+                hide_index=True,
                 use_container_width=True
             )
         
         with col2:
-            # Create summary report
-            summary_report = f"""
+            fig_participants = px.bar(
+                participant_df,
+                x='Participant',
+                y='Meetings',
+                title='Top Participants by Meeting Count',
+                color='Meetings',
+                color_continuous_scale='Blues'
+            )
+            fig_participants.update_layout(showlegend=False)
+            
+            st.plotly_chart(fig_participants, use_container_width=True)
+    else:
+        st.info("No participant data available.")
+    
+    st.markdown("---")
+    
+    # Export data
+    st.markdown("### 📥 Export Data")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Row count + newest update identify the fetched snapshot
+        snapshot_key = (len(df), str(df['updated_at'].max()))
+        st.download_button(
+            "📊 Download CSV",
+            _csv_bytes(df, snapshot_key),
+            "meeting_analytics.csv",
+            "text/csv",
+            use_container_width=True
+        )
+    
+    with col2:
+        # Create summary report
+        summary_report = f"""
 MEETING ANALYTICS SUMMARY
 =========================
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
 OVERVIEW:
 - Total Meetings: {len(df)}
-- Completed: {len(df[df['status'] == 'completed'])}
-- Total Duration: {df['duration_seconds'].sum() / 3600:.2f} hours
-- Average Duration: {df['duration_minutes'].mean():.1f} minutes
+- Completed: {completed}
+- Total Duration: {total_hours:.2f} hours
+- Average Duration: {avg_duration:.1f} minutes
 
 ACTION ITEMS:
-- Total: {int(df['action_item_count'].sum())}
-- Average per Meeting: {df['action_item_count'].mean():.1f}
+- Total: {total_action_items}
+- Average per Meeting: {avg_action_items:.1f}
 
 SENTIMENT:
-- Average Score: {df['sentiment_score'].mean():.2f} (on scale of -1 to 1)
+- Average Score: {avg_sentiment:.2f} (on scale of -1 to 1)
 
 TOP TOPICS:
-{chr(10).join([f"- {topic}: {count}" for topic, count in topic_counts[:10]])}
+{chr(10).join([f"- {topic}: {count}" for topic, count in topic_counts.head(10).items()])}
 """
-            
-            st.download_button(
-                "📄 Download Report",
-                summary_report,
-                "meeting_report.txt",
-                "text/plain",
-                use_container_width=True
-            )
-    
-    else:
-        st.error(f"Failed to fetch meetings: {response.status_code}")
+        
+        st.download_button(
+            "📄 Download Report",
+            summary_report,
+            "meeting_report.txt",
+            "text/plain",
+            use_container_width=True
+        )
 
+except requests.exceptions.HTTPError as e:
+    st.error(f"Failed to fetch meetings: {e.response.status_code}")
 except requests.exceptions.Timeout:
     st.error("Request timeout. Please try again.")
 except Exception as e:
@@ -8,13 +8,17 @@ View all meetings and their details
 import streamlit as st
 import requests
 import pandas as pd
-from datetime import datetime
+import orjson
+from collections import Counter
 import sys
 from pathlib import Path
+from typing import Optional
 
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from ui.components.api_client import get_session, get_executor
+
 st.set_page_config(page_title="Dashboard", page_icon="📊", layout="wide")
 
 st.title("📊 Meeting Dashboard")
@@ -22,46 +26,151 @@ st.markdown("View and manage all your meetings.")
 
 API_URL = "http://localhost:8000"
 
-# Check API
-try:
-    health_response = requests.get(f"{API_URL}/health", timeout=2)
-    api_online = health_response.status_code == 200
-except:
-    api_online = False
-
-if not api_online:
-    st.error("⚠️ **API is offline!**")
-    st.stop()
+# ============================================
+# HTTP
+# ============================================
 
-# Filters
-col1, col2, col3 = st.columns([2, 1, 1])
+def _api_online(session: requests.Session) -> bool:
+    """Health probe (plain HTTP, safe to run off the script thread)"""
+    try:
+        return session.get(f"{API_URL}/health", timeout=2).status_code == 200
+    except Exception:
+        return False
 
-with col1:
-    search_query = st.text_input("🔍 Search meetings", placeholder="Search by title or description...")
+@st.cache_resource
+def _etag_store() -> dict:
+    """Last (ETag, body) per meetings query, shared by all sessions"""
+    return {}
 
-with col2:
-    status_filter = st.selectbox(
-        "Status",
-        ["All", "Completed", "Processing", "Failed"]
-    )
+ETAG_STORE_MAX = 32
 
-with col3:
-    sort_by = st.selectbox(
-        "Sort by",
-        ["Newest First", "Oldest First", "Title A-Z"]
-    )
+def _get_meetings(params: dict, timeout: float) -> dict:
+    """
+    Conditional GET of the meetings list
+    
+    Sends the stored ETag as If-None-Match; on 304 Not Modified the
+    stored body is reused, so unchanged data costs no download or JSON
+    parse when the 30s cache expires.
+    """
+    store = _etag_store()
+    key = tuple(sorted(params.items()))
+    cached = store.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    
+    response = get_session().get(f"{API_URL}/api/v1/meetings", params=params, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        return cached[1]
+    
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    etag = response.headers.get("ETag")
+    if etag:
+        store.pop(key, None)
+        if len(store) >= ETAG_STORE_MAX:
+            store.pop(next(iter(store)))  # oldest entry
+        store[key] = (etag, data)
+    
+    return data
 
-# Fetch meetings
-try:
-    params = {"skip": 0, "limit": 100}
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_meetings(
+    skip: int,
+    limit: int,
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+    sort_by: str = "-created_at"
+) -> dict:
+    """
+    Fetch a page of meetings, filtered and sorted by the API (cached for 30s)
     
-    if status_filter != "All":
-        params["status"] = status_filter.lower()
+    Every widget interaction reruns the script; each filter combination
+    is cached separately instead of a new HTTP round-trip. Raises on
+    non-200 responses so errors are never cached.
+    """
+    params = {"skip": skip, "limit": limit, "sort_by": sort_by}
+    if status:
+        params["status"] = status
+    if search:
+        params["search"] = search
     
-    response = requests.get(f"{API_URL}/api/v1/meetings", params=params, timeout=5)
+    return _get_meetings(params, timeout=5)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_meeting(meeting_id: int) -> dict:
+    """Fetch one meeting with transcript and action items (cached for 60s)"""
+    response = get_session().get(f"{API_URL}/api/v1/meetings/{meeting_id}", timeout=5)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+SORT_OPTIONS = {
+    "Newest First": "-created_at",
+    "Oldest First": "created_at",
+    "Title A-Z": "title"
+}
+
+STATUS_EMOJI = {
+    'completed': '✅',
+    'processing': '🔄',
+    'failed': '❌',
+    'uploading': '📤'
+}
+
+PRIORITY_EMOJI = {'low': '🟢', 'medium': '🟡', 'high': '🟠', 'critical': '🔴'}
+
+def _close_details():
+    """Leave the detail view and clear the table row selection"""
+    st.session_state.pop('selected_meeting_id', None)
+    # A new widget key resets the selection (it can't be set directly)
+    st.session_state.table_version = st.session_state.get('table_version', 0) + 1
+
+# Probe /health in the background; it overlaps with the meetings fetch
+health_future = get_executor().submit(_api_online, get_session())
+
+@st.fragment
+def render_meetings_list():
+    """
+    Filters, stats and the meetings table
     
-    if response.status_code == 200:
-        data = response.json()
+    Runs as a fragment: changing search, status or sort reruns only
+    this function, not the whole page (health probe, detail view).
+    """
+    # Filters
+    col1, col2, col3 = st.columns([2, 1, 1])
+
+    with col1:
+        search_query = st.text_input("🔍 Search meetings", placeholder="Search by title or description...")
+
+    with col2:
+        status_filter = st.selectbox(
+            "Status",
+            ["All", "Completed", "Processing", "Failed"]
+        )
+
+    with col3:
+        sort_by = st.selectbox(
+            "Sort by",
+            list(SORT_OPTIONS)
+        )
+
+    status = None if status_filter == "All" else status_filter.lower()
+
+    try:
+        data, fetch_error = fetch_meetings(
+            0, 100, status, search_query.strip() or None, SORT_OPTIONS[sort_by]
+        ), None
+    except Exception as e:
+        data, fetch_error = None, e
+
+    if not health_future.result():
+        st.error("⚠️ **API is offline!**")
+        st.stop()
+
+    # Fetch meetings
+    try:
+        if fetch_error:
+            raise fetch_error
+        
         meetings = data.get('meetings', [])
         total = data.get('total', 0)
         
@@ -70,11 +179,9 @@ try:
         
         col1.metric("Total Meetings", total)
         
-        completed = len([m for m in meetings if m['status'] == 'completed'])
-        col2.metric("Completed", completed)
-        
-        processing = len([m for m in meetings if m['status'] == 'processing'])
-        col3.metric("Processing", processing)
+        status_counts = Counter(m['status'] for m in meetings)
+        col2.metric("Completed", status_counts['completed'])
+        col3.metric("Processing", status_counts['processing'])
         
         if meetings:
             avg_duration = sum([m.get('duration_seconds', 0) for m in meetings if m.get('duration_seconds')]) / len(meetings)
@@ -86,192 +193,159 @@ try:
         if not meetings:
             st.info("📭 No meetings found. Upload your first meeting to get started!")
         else:
-            # Apply search filter
-            if search_query:
-                meetings = [m for m in meetings if 
-                           search_query.lower() in m['title'].lower() or 
-                           (m.get('description') and search_query.lower() in m['description'].lower())]
+            # One table instead of a container + columns per meeting: a single
+            # frontend element no matter how many meetings are listed
+            df = pd.DataFrame(meetings)
             
-            # Apply sorting
-            if sort_by == "Oldest First":
-                meetings = sorted(meetings, key=lambda x: x['created_at'])
-            elif sort_by == "Title A-Z":
-                meetings = sorted(meetings, key=lambda x: x['title'])
-            else:  # Newest First (default)
-                meetings = sorted(meetings, key=lambda x: x['created_at'], reverse=True)
+            display_df = pd.DataFrame({
+                'Status': df['status'].map(STATUS_EMOJI).fillna('❓'),
+                'Title': df['title'],
+                'Description': df['description'].fillna(''),
+                'Date': pd.to_datetime(df['created_at'], utc=True, format='ISO8601').dt.strftime('%Y-%m-%d %H:%M'),
+                'Duration (min)': (df['duration_seconds'].astype(float) / 60).round(1),
+                'Participants': df['participants'].map(
+                    lambda p: ', '.join(p[:3]) if isinstance(p, list) else ''
+                ),
+            })
+            if 'key_topics' in df:
+                display_df['Topics'] = df['key_topics'].map(
+                    lambda t: ' • '.join(t[:5]) if isinstance(t, list) else ''
+                )
             
-            # Display each meeting as a card
-            for meeting in meetings:
-                with st.container():
-                    col1, col2 = st.columns([3, 1])
-                    
-                    with col1:
-                        # Title and status
-                        status_emoji = {
-                            'completed': '✅',
-                            'processing': '🔄',
-                            'failed': '❌',
-                            'uploading': '📤'
-                        }.get(meeting['status'], '❓')
-                        
-                        st.markdown(f"### {status_emoji} {meeting['title']}")
-                        
-                        if meeting.get('description'):
-                            st.markdown(f"*{meeting['description']}*")
-                        
-                        # Metadata
-                        meta_col1, meta_col2, meta_col3 = st.columns(3)
-                        
-                        with meta_col1:
-                            created_date = datetime.fromisoformat(meeting['created_at'].replace('Z', '+00:00'))
-                            st.caption(f"📅 {created_date.strftime('%Y-%m-%d %H:%M')}")
-                        
-                        with meta_col2:
-                            if meeting.get('duration_seconds'):
-                                duration_min = meeting['duration_seconds'] / 60
-                                st.caption(f"⏱️ {duration_min:.1f} min")
-                        
-                        with meta_col3:
-                            if meeting.get('participants'):
-                                participants = meeting['participants']
-                                if isinstance(participants, list):
-                                    st.caption(f"👥 {', '.join(participants[:3])}")
-                        
-                        # Topics
-                        if meeting.get('key_topics'):
-                            topics = meeting['key_topics']
-                            if isinstance(topics, list):
-                                st.markdown("🏷️ " + " • ".join(topics[:5]))
-                    
-                    with col2:
-                        st.markdown("<br>", unsafe_allow_html=True)
-                        
-                        if st.button("View Details", key=f"view_{meeting['id']}", use_container_width=True):
-                            st.session_state.selected_meeting_id = meeting['id']
-                            st.rerun()
-                    
-                    st.markdown("---")
+            st.caption("Select a row to view meeting details")
+            event = st.dataframe(
+                display_df,
+                hide_index=True,
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key=f"meetings_table_{st.session_state.get('table_version', 0)}"
+            )
             
+            if event.selection.rows:
+                selected_id = meetings[event.selection.rows[0]]['id']
+                if st.session_state.get('selected_meeting_id') != selected_id:
+                    st.session_state.selected_meeting_id = selected_id
+                    # The detail view lives outside this fragment
+                    st.rerun()
+        
             # Pagination info
             if len(meetings) < total:
                 st.info(f"Showing {len(meetings)} of {total} meetings")
-    
-    else:
-        st.error(f"Failed to fetch meetings: {response.status_code}")
 
-except requests.exceptions.Timeout:
-    st.error("Request timeout. Please try again.")
-except Exception as e:
-    st.error(f"Error: {str(e)}")
+    except requests.exceptions.HTTPError as e:
+        st.error(f"Failed to fetch meetings: {e.response.status_code}")
+    except requests.exceptions.Timeout:
+        st.error("Request timeout. Please try again.")
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
+render_meetings_list()
 
 # Meeting details modal
 if 'selected_meeting_id' in st.session_state:
     meeting_id = st.session_state.selected_meeting_id
     
     try:
-        response = requests.get(f"{API_URL}/api/v1/meetings/{meeting_id}", timeout=5)
+        meeting = fetch_meeting(meeting_id)
         
-        if response.status_code == 200:
-            meeting = response.json()
-            
-            # Show modal-style details
-            st.markdown("---")
-            st.markdown(f"## 📄 {meeting['title']}")
-            
-            # Back button
-            if st.button("← Back to Dashboard"):
-                del st.session_state.selected_meeting_id
-                st.rerun()
-            
-            # Tabs for different sections
-            tab1, tab2, tab3, tab4 = st.tabs(["📝 Transcript", "📋 Summary", "💼 Action Items", "📊 Analysis"])
+        # Show modal-style details
+        st.markdown("---")
+        st.markdown(f"## 📄 {meeting['title']}")
+        
+        # Back button
+        if st.button("← Back to Dashboard"):
+            _close_details()
+            st.rerun()
+        
+        # Tabs for different sections
+        tab1, tab2, tab3, tab4 = st.tabs(["📝 Transcript", "📋 Summary", "💼 Action Items", "📊 Analysis"])
+        
+        with tab1:
+            st.markdown("### Transcript")
+            if meeting.get('transcript'):
+                st.text_area("", meeting['transcript'], height=400, disabled=True)
+                
+                # Download button
+                st.download_button(
+                    "📥 Download Transcript",
+                    meeting['transcript'],
+                    file_name=f"{meeting['title']}_transcript.txt",
+                    mime="text/plain"
+                )
+            else:
+                st.info("Transcript not available yet.")
+        
+        with tab2:
+            st.markdown("### Summary")
+            if meeting.get('summary'):
+                st.write(meeting['summary'])
+            else:
+                st.info("Summary not available yet.")
+        
+        with tab3:
+            st.markdown("### Action Items")
+            action_items = meeting.get('action_items', [])
             
-            with tab1:
-                st.markdown("### Transcript")
-                if meeting.get('transcript'):
-                    st.text_area("", meeting['transcript'], height=400, disabled=True)
-                    
-                    # Download button
-                    st.download_button(
-                        "📥 Download Transcript",
-                        meeting['transcript'],
-                        file_name=f"{meeting['title']}_transcript.txt",
-                        mime="text/plain"
-                    )
-                else:
-                    st.info("Transcript not available yet.")
+            if action_items:
+                for i, item in enumerate(action_items, 1):
+                    with st.expander(f"{i}. {item['title']}", expanded=True):
+                        col1, col2, col3 = st.columns(3)
+                        
+                        with col1:
+                            st.markdown(f"**Assigned:** {item.get('assigned_to', 'Unassigned')}")
+                        
+                        with col2:
+                            priority = item.get('priority', 'medium')
+                            st.markdown(f"**Priority:** {PRIORITY_EMOJI.get(priority, '⚪')} {priority.title()}")
+                        
+                        with col3:
+                            due_date = item.get('due_date')
+                            st.markdown(f"**Due:** {due_date if due_date else 'Not specified'}")
+                        
+                        if item.get('description'):
+                            st.markdown(f"**Description:** {item['description']}")
+                        
+                        if item.get('transcript_snippet'):
+                            st.caption(f"💬 \"{item['transcript_snippet']}\"")
+            else:
+                st.info("No action items found.")
+        
+        with tab4:
+            st.markdown("### Content Analysis")
             
-            with tab2:
-                st.markdown("### Summary")
-                if meeting.get('summary'):
-                    st.write(meeting['summary'])
-                else:
-                    st.info("Summary not available yet.")
+            col1, col2 = st.columns(2)
             
-            with tab3:
-                st.markdown("### Action Items")
-                action_items = meeting.get('action_items', [])
+            with col1:
+                if meeting.get('key_topics'):
+                    st.markdown("**🏷️ Key Topics:**")
+                    for topic in meeting['key_topics']:
+                        st.markdown(f"- {topic}")
                 
-                if action_items:
-                    for i, item in enumerate(action_items, 1):
-                        with st.expander(f"{i}. {item['title']}", expanded=True):
-                            col1, col2, col3 = st.columns(3)
-                            
-                            with col1:
-                                st.markdown(f"**Assigned:** {item.get('assigned_to', 'Unassigned')}")
-                            
-                            with col2:
-                                priority = item.get('priority', 'medium')
-                                priority_emoji = {'low': '🟢', 'medium': '🟡', 'high': '🟠', 'critical': '🔴'}
-                                st.markdown(f"**Priority:** {priority_emoji.get(priority, '⚪')} {priority.title()}")
-                            
-                            with col3:
-                                due_date = item.get('due_date')
-                                st.markdown(f"**Due:** {due_date if due_date else 'Not specified'}")
-                            
-                            if item.get('description'):
-                                st.markdown(f"**Description:** {item['description']}")
-                            
-                            if item.get('transcript_snippet'):
-                                st.caption(f"💬 \"{item['transcript_snippet']}\"")
-                else:
-                    st.info("No action items found.")
+                if meeting.get('sentiment_score') is not None:
+                    sentiment = meeting['sentiment_score']
+                    st.markdown(f"**😊 Sentiment Score:** {sentiment:.2f}")
+                    
+                    if sentiment > 0.5:
+                        st.success("Overall positive sentiment")
+                    elif sentiment < -0.5:
+                        st.error("Overall negative sentiment")
+                    else:
+                        st.info("Neutral sentiment")
             
-            with tab4:
-                st.markdown("### Content Analysis")
-                
-                col1, col2 = st.columns(2)
+            with col2:
+                st.markdown("**📊 Metrics:**")
+                if meeting.get('duration_seconds'):
+                    st.metric("Duration", f"{meeting['duration_seconds']/60:.1f} min")
                 
-                with col1:
-                    if meeting.get('key_topics'):
-                        st.markdown("**🏷️ Key Topics:**")
-                        for topic in meeting['key_topics']:
-                            st.markdown(f"- {topic}")
-                    
-                    if meeting.get('sentiment_score') is not None:
-                        sentiment = meeting['sentiment_score']
-                        st.markdown(f"**😊 Sentiment Score:** {sentiment:.2f}")
-                        
-                        if sentiment > 0.5:
-                            st.success("Overall positive sentiment")
-                        elif sentiment < -0.5:
-                            st.error("Overall negative sentiment")
-                        else:
-                            st.info("Neutral sentiment")
+                if meeting.get('word_count'):
+                    st.metric("Word Count", meeting['word_count'])
                 
-                with col2:
-                    st.markdown("**📊 Metrics:**")
-                    if meeting.get('duration_seconds'):
-                        st.metric("Duration", f"{meeting['duration_seconds']/60:.1f} min")
-                    
-                    if meeting.get('word_count'):
-                        st.metric("Word Count", meeting['word_count'])
-                    
-                    if meeting.get('processing_time_seconds'):
-                        st.metric("Processing Time", f"{meeting['processing_time_seconds']:.1f}s")
-    
+                if meeting.get('processing_time_seconds'):
+                    st.metric("Processing Time", f"{meeting['processing_time_seconds']:.1f}s")
+
     except Exception as e:
         st.error(f"Error loading meeting details: {str(e)}")
         if st.button("← Back"):
-            del st.session_state.selected_meeting_id
+            _close_details()
             st.rerun()
\ No newline at end of file
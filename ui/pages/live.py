@@ -7,6 +7,7 @@ Real-time audio transcription with browser microphone access
 
 import streamlit as st
 import streamlit.components.v1 as components
+import json
 from datetime import datetime
 import sys
 from pathlib import Path
@@ -43,34 +44,63 @@ participants = st.text_input(
     key="participants"
 )
 
+# Audio upload batching: (flush at bytes, flush after ms)
+STREAMING_MODES = {
+    "Low latency": (64 * 1024, 250),
+    "High throughput": (1024 * 1024, 3000),
+}
+
+streaming_mode = st.selectbox(
+    "Streaming mode",
+    options=list(STREAMING_MODES),
+    index=0,
+    key="streaming_mode",
+    help="Raw PCM fallback only (Opus is sent as 3s recordings): low latency sends "
+         "audio every 250ms; high throughput batches up to 1 MB (or 3s) per "
+         "WebSocket message for fewer frames on slow links."
+)
+flush_bytes, flush_interval_ms = STREAMING_MODES[streaming_mode]
+
+vad_enabled = st.checkbox(
+    "Voice activity detection",
+    value=True,
+    key="vad_enabled",
+    help="Raw PCM fallback only: drop silent audio in the browser (below ~-40 dBFS, "
+         "with a 300ms hangover) so silence isn't uploaded. The server skips silent "
+         "windows either way."
+)
+
 st.markdown("---")
 
 # Embed custom HTML/JS component for audio capture
-html_code = f"""
+# Static page body: the per-rerun config is injected as JSON (see below),
+# so user input never gets interpolated into HTML/JS source
+_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
+    <script>window.__CFG = __CONFIG_JSON__;</script>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
             padding: 20px;
             margin: 0;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
+        }
         
-        .controls {{
+        .controls {
             display: flex;
             gap: 15px;
             margin-bottom: 20px;
             align-items: center;
-        }}
+        }
         
-        .btn {{
+        .btn {
             padding: 12px 24px;
             border: none;
             border-radius: 8px;
@@ -78,70 +108,70 @@ html_code = f"""
             font-weight: 600;
             cursor: pointer;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .btn-start {{
+        .btn-start {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
-        }}
+        }
         
-        .btn-start:hover {{
+        .btn-start:hover {
             transform: translateY(-2px);
             box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4);
-        }}
+        }
         
-        .btn-stop {{
+        .btn-stop {
             background-color: #dc3545;
             color: white;
-        }}
+        }
         
-        .btn-stop:hover {{
+        .btn-stop:hover {
             background-color: #c82333;
-        }}
+        }
         
-        .btn:disabled {{
+        .btn:disabled {
             opacity: 0.5;
             cursor: not-allowed;
-        }}
+        }
         
-        .status {{
+        .status {
             display: flex;
             align-items: center;
             gap: 10px;
             padding: 10px 20px;
             border-radius: 8px;
             font-weight: 600;
-        }}
+        }
         
-        .status-idle {{
+        .status-idle {
             background-color: #f8f9fa;
             color: #6c757d;
-        }}
+        }
         
-        .status-recording {{
+        .status-recording {
             background-color: #fff5f5;
             color: #dc3545;
-        }}
+        }
         
-        .status-connecting {{
+        .status-connecting {
             background-color: #fff9e6;
             color: #ff9800;
-        }}
+        }
         
-        .recording-dot {{
+        .recording-dot {
             width: 12px;
             height: 12px;
             background-color: #dc3545;
             border-radius: 50%;
             animation: pulse 1.5s infinite;
-        }}
+        }
         
-        @keyframes pulse {{
-            0%, 100% {{ opacity: 1; transform: scale(1); }}
-            50% {{ opacity: 0.5; transform: scale(1.1); }}
-        }}
+        @keyframes pulse {
+            0%, 100% { opacity: 1; transform: scale(1); }
+            50% { opacity: 0.5; transform: scale(1.1); }
+        }
         
-        .transcript-box {{
+        .transcript-box {
             background-color: #f8f9fa;
             border: 2px solid #dee2e6;
             border-radius: 10px;
@@ -154,74 +184,74 @@ html_code = f"""
             line-height: 1.8;
             white-space: pre-wrap;
             word-wrap: break-word;
-        }}
+        }
         
-        .transcript-box.empty {{
+        .transcript-box.empty {
             color: #adb5bd;
             font-style: italic;
-        }}
+        }
         
-        .transcript-entry {{
+        .transcript-entry {
             margin-bottom: 15px;
             padding: 10px;
             background-color: white;
             border-radius: 5px;
             border-left: 3px solid #667eea;
-        }}
+        }
         
-        .transcript-time {{
+        .transcript-time {
             font-size: 12px;
             color: #6c757d;
             margin-bottom: 5px;
-        }}
+        }
         
-        .transcript-text {{
+        .transcript-text {
             color: #212529;
-        }}
+        }
         
-        .stats {{
+        .stats {
             display: flex;
             gap: 20px;
             margin-top: 20px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             flex: 1;
             padding: 15px;
             background-color: white;
             border-radius: 8px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 12px;
             color: #6c757d;
             margin-bottom: 5px;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 24px;
             font-weight: 700;
             color: #212529;
-        }}
+        }
         
-        .error-message {{
+        .error-message {
             padding: 15px;
             background-color: #f8d7da;
             border: 1px solid #f5c6cb;
             border-radius: 8px;
             color: #721c24;
             margin-bottom: 20px;
-        }}
+        }
         
-        .info-message {{
+        .info-message {
             padding: 15px;
             background-color: #d1ecf1;
             border: 1px solid #bee5eb;
             border-radius: 8px;
             color: #0c5460;
             margin-bottom: 20px;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -237,6 +267,7 @@ html_code = f"""
         
         <!-- Error/Info messages -->
         <div id="messageBox"></div>
+        <div id="backlogNotice"></div>
         
         <!-- Transcript -->
         <h3>📝 Live Transcript</h3>
@@ -261,120 +292,302 @@ html_code = f"""
         </div>
     </div>
     
+    <!-- PCM capture, runs on the audio rendering thread (AudioWorklet) -->
+    <script type="text/plain" id="audioProcessorSource">
+        const TARGET_RATE = 16000;
+        
+        // RBJ low-pass biquad coefficients (normalized by a0)
+        function lowpassCoefficients(cutoff, q) {
+            const w0 = 2 * Math.PI * cutoff / sampleRate;
+            const cos = Math.cos(w0);
+            const alpha = Math.sin(w0) / (2 * q);
+            const a0 = 1 + alpha;
+            return {
+                b0: (1 - cos) / 2 / a0,
+                b1: (1 - cos) / a0,
+                b2: (1 - cos) / 2 / a0,
+                a1: -2 * cos / a0,
+                a2: (1 - alpha) / a0,
+                x1: 0, x2: 0, y1: 0, y2: 0
+            };
+        }
+        
+        class AudioProcessor extends AudioWorkletProcessor {
+            constructor(options) {
+                super();
+                // ~100ms of 16kHz output per message: posting every
+                // 128-sample quantum causes clicks/overhead
+                this.chunkSize = TARGET_RATE / 10;
+                this.offset = 0;
+                
+                // The context runs at the device rate (sampleRate is a
+                // worklet global, usually 44.1/48kHz): anti-alias at 7kHz
+                // (4th-order Butterworth as two biquads), then decimate to
+                // 16kHz here, once, with linear interpolation
+                this.ratio = sampleRate / TARGET_RATE;
+                this.filters = sampleRate > TARGET_RATE
+                    ? [lowpassCoefficients(7000, 0.5412), lowpassCoefficients(7000, 1.3066)]
+                    : [];
+                this.nextOutput = 0;  // Position of the next output sample, in input samples
+                this.previous = 0;
+                
+                // The main thread transfers each buffer back once copied,
+                // so steady state allocates nothing (no GC pauses)
+                this.spareBuffers = [];
+                this.port.onmessage = (event) => {
+                    this.spareBuffers.push(new Int16Array(event.data));
+                };
+                this.buffer = this.nextBuffer();
+                
+                // RMS voice activity gate: drop quanta below ~-40 dBFS once
+                // 300ms (hangover) have passed since the last loud quantum
+                const opts = (options && options.processorOptions) || {};
+                this.vadEnabled = !!opts.vadEnabled;
+                this.vadThreshold = 0.01;
+                this.hangoverSamples = Math.round(sampleRate * 0.3);
+                this.silentSamples = this.hangoverSamples + 1;
+            }
+            
+            nextBuffer() {
+                return this.spareBuffers.pop() || new Int16Array(this.chunkSize);
+            }
+            
+            post(samples) {
+                // Transfer (not copy) the buffer to the main thread
+                const buffer = this.buffer.buffer;
+                this.port.postMessage({ buffer, samples }, [buffer]);
+                this.buffer = this.nextBuffer();
+                this.offset = 0;
+            }
+            
+            lowpass(x) {
+                for (const f of this.filters) {
+                    const y = f.b0 * x + f.b1 * f.x1 + f.b2 * f.x2 - f.a1 * f.y1 - f.a2 * f.y2;
+                    f.x2 = f.x1;
+                    f.x1 = x;
+                    f.y2 = f.y1;
+                    f.y1 = y;
+                    x = y;
+                }
+                return x;
+            }
+            
+            emit(sample) {
+                // Float32 -> Int16
+                const s = Math.max(-1, Math.min(1, sample));
+                this.buffer[this.offset++] = (s < 0 ? s * 0x8000 : s * 0x7FFF) | 0;
+                
+                if (this.offset === this.chunkSize) {
+                    this.post(this.chunkSize);
+                }
+            }
+            
+            isVoiced(channel) {
+                let sum = 0;
+                for (let i = 0; i < channel.length; i++) {
+                    sum += channel[i] * channel[i];
+                }
+                
+                if (Math.sqrt(sum / channel.length) >= this.vadThreshold) {
+                    this.silentSamples = 0;
+                } else {
+                    this.silentSamples += channel.length;
+                }
+                return this.silentSamples <= this.hangoverSamples;
+            }
+            
+            process(inputs) {
+                const channel = inputs[0] && inputs[0][0];
+                
+                if (channel && this.vadEnabled && !this.isVoiced(channel)) {
+                    // Entering silence: send what we have instead of holding it
+                    if (this.offset > 0) {
+                        this.post(this.offset);
+                    }
+                    return true;
+                }
+                
+                if (channel && this.ratio === 1) {
+                    for (let i = 0; i < channel.length; i++) {
+                        this.emit(channel[i]);
+                    }
+                } else if (channel) {
+                    for (let i = 0; i < channel.length; i++) {
+                        const x = this.lowpass(channel[i]);
+                        
+                        // Outputs falling between the previous and this input
+                        while (this.nextOutput <= 1) {
+                            this.emit(this.previous + (x - this.previous) * this.nextOutput);
+                            this.nextOutput += this.ratio;
+                        }
+                        this.nextOutput -= 1;
+                        this.previous = x;
+                    }
+                }
+                return true;
+            }
+        }
+        
+        registerProcessor('audio-processor', AudioProcessor);
+    </script>
+    
     <script>
         let websocket = null;
+        let socketReady = null;  // Promise for the open (or opening) socket
         let mediaRecorder = null;
+        let mediaStream = null;
         let audioContext = null;
         let isRecording = false;
         let startTime = null;
-        let durationTimer = null;
-        let transcriptText = '';
+        let durationFrame = null;
+        let shownSeconds = -1;  // Last value written to durationDiv
         let wordCount = 0;
         let sessionId = null;
         let meetingId = null;
         
+        // Outgoing PCM batching (see flushAudio): one preallocated batch
+        // buffer, filled in place
+        const pcmBatch = new Int16Array(window.__CFG.flushBytes / 2);
+        let pcmBatchLength = 0;
+        let flushTimer = null;
+        
+        // Opus capture: MediaRecorder timeslice chunks are fragments of one
+        // WebM stream the server can't decode on their own, so record
+        // back-to-back self-contained segments instead (one frame each)
+        const OPUS_MIME = 'audio/webm;codecs=opus';
+        const OPUS_SEGMENT_MS = 3000;  // Matches the server's transcription window
+        let serverAudioFormats = [];
+        let segmentTimer = null;
+        let uploadChain = Promise.resolve();  // Keeps segment sends in order
+        
+        // Transcript entries waiting for the next animation frame
+        let pendingEntries = [];
+        let entryFrame = null;
+        
         const startBtn = document.getElementById('startBtn');
         const stopBtn = document.getElementById('stopBtn');
         const statusDiv = document.getElementById('status');
         const transcriptDiv = document.getElementById('transcript');
         const messageBox = document.getElementById('messageBox');
+        const backlogNotice = document.getElementById('backlogNotice');
         const durationDiv = document.getElementById('duration');
         const wordCountDiv = document.getElementById('wordCount');
         const meetingIdDiv = document.getElementById('meetingId');
         
         // Configuration from Streamlit
-        const config = {{
-            meetingTitle: "{meeting_title}",
-            language: "{language}",
-            participants: "{participants}".split(',').map(p => p.trim()).filter(p => p),
-            wsUrl: "ws://localhost:8000/api/v1/ws/transcribe"
-        }};
+        const config = window.__CFG;
         
         startBtn.addEventListener('click', startRecording);
         stopBtn.addEventListener('click', stopRecording);
         
-        async function startRecording() {{
-            try {{
+        function connectWebSocket() {
+            // Reuse an open (or still connecting) socket
+            if (socketReady && websocket && websocket.readyState <= WebSocket.OPEN) {
+                return socketReady;
+            }
+            
+            const ws = new WebSocket(config.wsUrl);
+            ws.binaryType = 'arraybuffer';
+            websocket = ws;
+            
+            socketReady = new Promise((resolve, reject) => {
+                ws.onopen = () => {
+                    console.log('WebSocket connected');
+                    ws.wasOpen = true;
+                    resolve(ws);
+                };
+                
+                ws.onerror = (error) => {
+                    console.error('WebSocket error:', error);
+                    reject(error);
+                    if (isRecording) {
+                        showMessage('WebSocket connection error. Is the API running?', 'error');
+                        stopRecording();
+                    }
+                };
+            });
+            
+            ws.onmessage = (event) => {
+                const data = JSON.parse(event.data);
+                handleWebSocketMessage(data);
+            };
+            
+            ws.onclose = () => {
+                console.log('WebSocket closed');
+                if (websocket === ws) {
+                    websocket = null;
+                    socketReady = null;
+                }
+                if (isRecording) {
+                    stopRecording();
+                } else if (ws.wasOpen) {
+                    // Idle timeout or session ended: warm a fresh socket
+                    // (never-opened sockets don't retry, so no reconnect loop)
+                    preconnect();
+                }
+            };
+            
+            return socketReady;
+        }
+        
+        function preconnect() {
+            // Handshake while the page is idle; 'start' is only sent on click.
+            // Failures are retried by startRecording()
+            connectWebSocket().catch(() => {});
+        }
+        
+        async function startRecording() {
+            try {
                 showMessage('Requesting microphone access...', 'info');
                 
+                // Usually already open from preconnect(); reopens if it was
+                // closed, overlapping with the microphone prompt
+                const socketPromise = connectWebSocket();
+                socketPromise.catch(() => {});
+                
                 // Request microphone access
-                const stream = await navigator.mediaDevices.getUserMedia({{
-                    audio: {{
+                // No sampleRate constraint: browsers treat it as a hint (and
+                // the worklet downsamples to 16kHz itself)
+                const stream = await navigator.mediaDevices.getUserMedia({
+                    audio: {
                         channelCount: 1,
-                        sampleRate: 16000,
                         echoCancellation: true,
                         noiseSuppression: true
-                    }}
-                }});
+                    }
+                });
                 
                 clearMessage();
                 
                 // Connect WebSocket
                 updateStatus('connecting', '🔄 Connecting...');
-                websocket = new WebSocket(config.wsUrl);
-                
-                websocket.onopen = () => {{
-                    console.log('WebSocket connected');
-                    
-                    // Send start command
-                    websocket.send(JSON.stringify({{
-                        type: 'start',
-                        meeting_title: config.meetingTitle,
-                        language: config.language,
-                        participants: config.participants
-                    }}));
-                }};
-                
-                websocket.onmessage = (event) => {{
-                    const data = JSON.parse(event.data);
-                    handleWebSocketMessage(data);
-                }};
-                
-                websocket.onerror = (error) => {{
-                    console.error('WebSocket error:', error);
+                let ws;
+                try {
+                    ws = await socketPromise;
+                } catch (error) {
+                    stream.getTracks().forEach(track => track.stop());
+                    updateStatus('idle', '⚪ Idle');
                     showMessage('WebSocket connection error. Is the API running?', 'error');
-                    stopRecording();
-                }};
-                
-                websocket.onclose = () => {{
-                    console.log('WebSocket closed');
-                    if (isRecording) {{
-                        stopRecording();
-                    }}
-                }};
-                
-                // Setup audio processing
-                audioContext = new (window.AudioContext || window.webkitAudioContext)({{
-                    sampleRate: 16000
-                }});
+                    return;
+                }
                 
-                const source = audioContext.createMediaStreamSource(stream);
-                const processor = audioContext.createScriptProcessor(4096, 1, 1);
+                mediaStream = stream;
+                const audioFormat = opusSupported() ? 'webm-opus' : 'pcm16';
                 
-                processor.onaudioprocess = (e) => {{
-                    if (websocket && websocket.readyState === WebSocket.OPEN && isRecording) {{
-                        const inputData = e.inputBuffer.getChannelData(0);
-                        
-                        // Convert Float32Array to Int16Array
-                        const pcmData = new Int16Array(inputData.length);
-                        for (let i = 0; i < inputData.length; i++) {{
-                            const s = Math.max(-1, Math.min(1, inputData[i]));
-                            pcmData[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
-                        }}
-                        
-                        // Convert to base64
-                        const base64Audio = btoa(String.fromCharCode.apply(null, new Uint8Array(pcmData.buffer)));
-                        
-                        // Send to server
-                        websocket.send(JSON.stringify({{
-                            type: 'audio',
-                            data: base64Audio
-                        }}));
-                    }}
-                }};
+                // Send start command
+                ws.send(JSON.stringify({
+                    type: 'start',
+                    meeting_title: config.meetingTitle,
+                    language: config.language,
+                    participants: config.participants,
+                    audio_format: audioFormat
+                }));
                 
-                source.connect(processor);
-                processor.connect(audioContext.destination);
+                if (audioFormat === 'webm-opus') {
+                    // Encoded natively by the browser, ~24 kbps vs 256 kbps PCM
+                    startOpusSegment(stream);
+                } else {
+                    await startPcmCapture(stream);
+                }
                 
                 // Update UI
                 isRecording = true;
@@ -384,40 +597,166 @@ html_code = f"""
                 
                 // Start duration timer
                 startTime = Date.now();
-                durationTimer = setInterval(updateDuration, 1000);
+                shownSeconds = -1;
+                durationFrame = requestAnimationFrame(updateDuration);
                 
-            }} catch (error) {{
+            } catch (error) {
                 console.error('Error starting recording:', error);
                 showMessage('Failed to access microphone. Please grant permission.', 'error');
-            }}
-        }}
-        
-        function stopRecording() {{
-            if (websocket && websocket.readyState === WebSocket.OPEN) {{
-                websocket.send(JSON.stringify({{ type: 'stop' }}));
-            }}
+            }
+        }
+        
+        function opusSupported() {
+            return serverAudioFormats.includes('webm-opus') &&
+                typeof MediaRecorder !== 'undefined' &&
+                MediaRecorder.isTypeSupported(OPUS_MIME);
+        }
+        
+        function startOpusSegment(stream) {
+            const recorder = new MediaRecorder(stream, {
+                mimeType: OPUS_MIME,
+                audioBitsPerSecond: 24000
+            });
+            
+            recorder.ondataavailable = (event) => {
+                if (!event.data.size) {
+                    return;
+                }
+                uploadChain = uploadChain
+                    .then(() => event.data.arrayBuffer())
+                    .then((buffer) => {
+                        if (websocket && websocket.readyState === WebSocket.OPEN) {
+                            websocket.send(buffer);
+                        }
+                    })
+                    .catch((error) => console.error('Audio upload failed:', error));
+            };
+            
+            recorder.start();
+            mediaRecorder = recorder;
+            
+            segmentTimer = setTimeout(() => {
+                // Start the next segment before closing this one so no audio is dropped
+                startOpusSegment(stream);
+                recorder.stop();
+            }, OPUS_SEGMENT_MS);
+        }
+        
+        async function startPcmCapture(stream) {
+            // Native rate: avoids the browser resampling every render
+            // quantum (and Firefox rejecting mismatched stream/context rates)
+            audioContext = new (window.AudioContext || window.webkitAudioContext)();
+            
+            // Load the worklet from the inline source (no separate file
+            // to serve from inside the Streamlit component iframe)
+            const workletSource = document.getElementById('audioProcessorSource').textContent;
+            const workletUrl = URL.createObjectURL(
+                new Blob([workletSource], { type: 'application/javascript' })
+            );
+            await audioContext.audioWorklet.addModule(workletUrl);
+            URL.revokeObjectURL(workletUrl);
+            
+            const source = audioContext.createMediaStreamSource(stream);
+            const processor = new AudioWorkletNode(audioContext, 'audio-processor', {
+                processorOptions: { vadEnabled: config.vadEnabled }
+            });
+            
+            // Int16 PCM chunks arrive already converted off the main thread
+            processor.port.onmessage = (event) => {
+                const { buffer, samples } = event.data;
+                if (websocket && websocket.readyState === WebSocket.OPEN && isRecording) {
+                    queueAudio(new Int16Array(buffer, 0, samples));
+                }
+                // Copied into the batch: hand the buffer back for reuse
+                processor.port.postMessage(buffer, [buffer]);
+            };
+            
+            source.connect(processor);
+            processor.connect(audioContext.destination);
+        }
+        
+        function queueAudio(samples) {
+            if (pcmBatchLength + samples.length > pcmBatch.length) {
+                flushAudio();
+            }
+            pcmBatch.set(samples, pcmBatchLength);
+            pcmBatchLength += samples.length;
+            
+            if (pcmBatchLength === pcmBatch.length) {
+                flushAudio();
+            } else if (!flushTimer) {
+                flushTimer = setTimeout(flushAudio, config.flushIntervalMs);
+            }
+        }
+        
+        function flushAudio() {
+            // One binary frame per batch: fewer frame headers/TLS records
+            if (flushTimer) {
+                clearTimeout(flushTimer);
+                flushTimer = null;
+            }
+            if (!pcmBatchLength) {
+                return;
+            }
+            
+            if (websocket && websocket.readyState === WebSocket.OPEN) {
+                // Raw PCM as a binary frame (no base64/JSON envelope).
+                // slice() snapshots the bytes since the batch is refilled
+                websocket.send(pcmBatch.buffer.slice(0, pcmBatchLength * 2));
+            }
+            pcmBatchLength = 0;
+        }
+        
+        function stopRecording() {
+            if (segmentTimer) {
+                clearTimeout(segmentTimer);
+                segmentTimer = null;
+            }
+            
+            if (mediaRecorder && mediaRecorder.state !== 'inactive') {
+                // 'stop' must follow the final segment's upload
+                mediaRecorder.onstop = () => uploadChain.then(sendStop);
+                mediaRecorder.stop();
+            } else {
+                flushAudio();
+                sendStop();
+            }
+            mediaRecorder = null;
             
-            if (audioContext) {{
+            if (mediaStream) {
+                mediaStream.getTracks().forEach(track => track.stop());
+                mediaStream = null;
+            }
+            
+            if (audioContext) {
                 audioContext.close();
                 audioContext = null;
-            }}
+            }
             
-            if (durationTimer) {{
-                clearInterval(durationTimer);
-            }}
+            if (durationFrame) {
+                cancelAnimationFrame(durationFrame);
+                durationFrame = null;
+            }
             
             isRecording = false;
             startBtn.disabled = false;
             stopBtn.disabled = true;
             updateStatus('idle', '⚪ Idle');
-        }}
+        }
+        
+        function sendStop() {
+            if (websocket && websocket.readyState === WebSocket.OPEN) {
+                websocket.send(JSON.stringify({ type: 'stop' }));
+            }
+        }
         
-        function handleWebSocketMessage(data) {{
+        function handleWebSocketMessage(data) {
             console.log('Received:', data.type, data);
             
-            switch (data.type) {{
+            switch (data.type) {
                 case 'connected':
                     console.log('Session connected:', data.session_id);
+                    serverAudioFormats = data.audio_formats || [];
                     break;
                 
                 case 'session_started':
@@ -429,85 +768,173 @@ html_code = f"""
                     break;
                 
                 case 'transcript':
-                    if (data.text && data.text.trim()) {{
+                    if (data.text && data.text.trim()) {
                         addTranscriptEntry(data.text, data.timestamp);
-                    }}
+                    }
+                    updateBacklog(data.backlog || 0, data.dropped || 0);
                     break;
                 
                 case 'session_ended':
-                    showMessage(`Recording saved! Meeting ID: ${{data.meeting_id}}`, 'info');
+                    showMessage(`Recording saved! Meeting ID: ${data.meeting_id}`, 'info');
                     stopRecording();
                     break;
                 
                 case 'error':
-                    showMessage(`Error: ${{data.message}}`, 'error');
+                    showMessage(`Error: ${data.message}`, 'error');
                     break;
-            }}
-        }}
+            }
+        }
         
-        function addTranscriptEntry(text, timestamp) {{
-            if (transcriptDiv.classList.contains('empty')) {{
-                transcriptDiv.classList.remove('empty');
-                transcriptDiv.innerHTML = '';
-            }}
-            
+        function addTranscriptEntry(text, timestamp) {
+            // Built with textContent (no HTML parsing, no injection) and
+            // appended in batches on the next animation frame
             const entry = document.createElement('div');
             entry.className = 'transcript-entry';
             
-            const time = new Date(timestamp).toLocaleTimeString();
+            const timeDiv = document.createElement('div');
+            timeDiv.className = 'transcript-time';
+            timeDiv.textContent = new Date(timestamp).toLocaleTimeString();
+            
+            const textDiv = document.createElement('div');
+            textDiv.className = 'transcript-text';
+            textDiv.textContent = text;
             
-            entry.innerHTML = `
-                <div class="transcript-time">${{time}}</div>
-                <div class="transcript-text">${{text}}</div>
-            `;
+            entry.appendChild(timeDiv);
+            entry.appendChild(textDiv);
+            pendingEntries.push(entry);
             
-            transcriptDiv.appendChild(entry);
-            transcriptDiv.scrollTop = transcriptDiv.scrollHeight;
+            if (!entryFrame) {
+                entryFrame = requestAnimationFrame(flushTranscriptEntries);
+            }
             
-            // Update stats
-            transcriptText += ' ' + text;
-            wordCount = transcriptText.trim().split(/\s+/).length;
+            // Update stats (count only the new text, not the whole transcript)
+            wordCount += text.trim().split(/\s+/).filter(Boolean).length;
             wordCountDiv.textContent = wordCount;
-        }}
+        }
         
-        function updateDuration() {{
-            if (startTime) {{
-                const elapsed = Math.floor((Date.now() - startTime) / 1000);
-                const minutes = Math.floor(elapsed / 60);
-                const seconds = elapsed % 60;
-                durationDiv.textContent = `${{minutes}}:${{seconds.toString().padStart(2, '0')}}`;
-            }}
-        }}
+        function flushTranscriptEntries() {
+            entryFrame = null;
+            
+            if (transcriptDiv.classList.contains('empty')) {
+                transcriptDiv.classList.remove('empty');
+                transcriptDiv.textContent = '';
+            }
+            
+            // Measure before appending; only follow if the user hasn't scrolled up
+            const isNearBottom = transcriptDiv.scrollHeight - transcriptDiv.scrollTop
+                - transcriptDiv.clientHeight < 50;
+            
+            const fragment = document.createDocumentFragment();
+            for (const entry of pendingEntries) {
+                fragment.appendChild(entry);
+            }
+            pendingEntries = [];
+            transcriptDiv.appendChild(fragment);
+            
+            if (isNearBottom) {
+                transcriptDiv.scrollTop = transcriptDiv.scrollHeight;
+            }
+        }
+        
+        function updateBacklog(backlog, dropped) {
+            // Server-side Whisper queue: it drops the oldest audio when full
+            if (backlog < 2) {
+                backlogNotice.className = '';
+                backlogNotice.textContent = '';
+                return;
+            }
+            
+            backlogNotice.className = 'info-message';
+            backlogNotice.textContent = `⏳ Transcription is falling behind (${backlog} chunks queued` +
+                (dropped ? `, ${dropped} skipped)` : ')');
+        }
+        
+        function updateDuration() {
+            // Runs per animation frame (paused in background tabs, no timer
+            // drift); the DOM is only touched when the second changes
+            durationFrame = isRecording ? requestAnimationFrame(updateDuration) : null;
+            
+            const elapsed = Math.floor((Date.now() - startTime) / 1000);
+            if (elapsed === shownSeconds) {
+                return;
+            }
+            shownSeconds = elapsed;
+            
+            const minutes = Math.floor(elapsed / 60);
+            const seconds = elapsed % 60;
+            durationDiv.textContent = `${minutes}:${seconds.toString().padStart(2, '0')}`;
+        }
         
-        function updateStatus(type, text) {{
-            statusDiv.className = `status status-${{type}}`;
+        function updateStatus(type, text) {
+            statusDiv.className = `status status-${type}`;
             
-            if (type === 'recording') {{
+            if (type === 'recording') {
                 statusDiv.innerHTML = '<div class="recording-dot"></div> ' + text;
-            }} else {{
+            } else {
                 statusDiv.textContent = text;
-            }}
-        }}
+            }
+        }
         
-        function showMessage(text, type) {{
+        function showMessage(text, type) {
             const className = type === 'error' ? 'error-message' : 'info-message';
-            messageBox.innerHTML = `<div class="${{className}}">${{text}}</div>`;
-        }}
+            messageBox.innerHTML = `<div class="${className}">${text}</div>`;
+        }
         
-        function clearMessage() {{
+        function clearMessage() {
             messageBox.innerHTML = '';
-        }}
+        }
         
         // Check browser support
-        if (!navigator.mediaDevices || !navigator.mediaDevices.getUserMedia) {{
+        if (!navigator.mediaDevices || !navigator.mediaDevices.getUserMedia) {
             showMessage('Your browser does not support audio recording. Please use Chrome, Firefox, or Edge.', 'error');
             startBtn.disabled = true;
-        }}
+        } else {
+            preconnect();
+        }
     </script>
 </body>
 </html>
 """
 
+WS_URL = "ws://localhost:8000/api/v1/ws/transcribe"
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def build_html(
+    meeting_title: str,
+    language: str,
+    participants: tuple,
+    flush_bytes: int,
+    flush_interval_ms: int,
+    vad_enabled: bool
+) -> str:
+    """
+    Page HTML for one config (cached: reruns with unchanged inputs reuse it)
+    
+    Only the config changes between reruns. json.dumps escapes quotes and
+    (ensure_ascii) U+2028/2029; "<" is escaped too so a value can't close
+    the <script> tag or open an HTML comment ("</script>", "<!--")
+    """
+    config_json = json.dumps({
+        "meetingTitle": meeting_title,
+        "language": language,
+        "participants": list(participants),
+        "wsUrl": WS_URL,
+        "flushBytes": flush_bytes,
+        "flushIntervalMs": flush_interval_ms,
+        "vadEnabled": vad_enabled,
+    }).replace("<", "\\u003c")
+    
+    return _HTML_TEMPLATE.replace("__CONFIG_JSON__", config_json)
+
+html_code = build_html(
+    meeting_title,
+    language,
+    tuple(p.strip() for p in participants.split(",") if p.strip()),
+    flush_bytes,
+    flush_interval_ms,
+    vad_enabled
+)
+
 # Render the HTML component
 components.html(html_code, height=800, scrolling=True)
 
@@ -544,6 +971,8 @@ with st.expander("📖 How to Use Live Transcription"):
     - **"WebSocket connection error"**: Start FastAPI server
     - **No transcript appearing**: Check microphone is working, try speaking louder
     - **Slow transcription**: Normal - processes every ~3 seconds
+    - **"Transcription is falling behind"**: Whisper is slower than real time on this
+      server; the oldest queued audio is skipped so the delay stays bounded
     """)
 
 # Sidebar info
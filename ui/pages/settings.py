@@ -13,6 +13,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from ui.components.api_client import get_session, get_executor
+
 st.set_page_config(page_title="Settings", page_icon="⚙️", layout="wide")
 
 st.title("⚙️ Settings")
@@ -20,14 +22,104 @@ st.markdown("Configure your MeetingMind AI application.")
 
 API_URL = "http://localhost:8000"
 
+# ============================================
+# API PROBES (cached across reruns)
+# ============================================
+
+PROBE_PATHS = {
+    "health": "/health",
+    "info": "/info",
+    "formats": "/api/v1/upload/formats",
+}
+
+def _probe(session: requests.Session, path: str) -> dict:
+    """GET one API path (plain HTTP, safe to run on the pool)"""
+    response = session.get(f"{API_URL}{path}", timeout=2)
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data(ttl=10, show_spinner=False)
+def fetch_status() -> dict:
+    """
+    Probe /health, /info and /upload/formats concurrently (cached for 10s)
+    
+    Page latency is the slowest probe instead of the sum of all three.
+    Raises if /health fails, so an offline API is never cached; "Clear
+    Cache" (st.cache_data.clear) drops it too.
+    
+    Returns:
+        {"health": {...}, "info": {...} or None, "formats": {...} or None}
+    """
+    session = get_session()
+    futures = {
+        name: get_executor().submit(_probe, session, path)
+        for name, path in PROBE_PATHS.items()
+    }
+    
+    status = {"health": futures.pop("health").result()}
+    for name, future in futures.items():
+        try:
+            status[name] = future.result()
+        except Exception:
+            status[name] = None
+    return status
+
 # Check API
 try:
-    health_response = requests.get(f"{API_URL}/health", timeout=2)
-    api_online = health_response.status_code == 200
-    health_data = health_response.json() if api_online else {}
-except:
+    api_status = fetch_status()
+    api_online = True
+except Exception:
+    api_status = {"health": {}, "info": None, "formats": None}
     api_online = False
-    health_data = {}
+health_data = api_status["health"]
+
+def _tail_lines(path: Path, n: int = 50, window: int = 8192) -> str:
+    """
+    Last n lines of a file, reading backwards from the end
+    
+    Memory is bounded by the size of those lines, not the whole log:
+    the read window doubles until it holds n newlines (or the file start).
+    """
+    size = path.stat().st_size
+    
+    with open(path, 'rb') as f:
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            data = f.read(size - start)
+            if start == 0 or data.count(b"\n") > n:
+                break
+            window *= 2
+    
+    lines = data.splitlines(keepends=True)[-n:]
+    return b"".join(lines).decode("utf-8", errors="replace")
+
+LOG_VIEW_LINES = 200
+
+def _refresh_logs() -> str:
+    """
+    Append new log bytes from /logs/tail to the text kept in session_state
+    
+    The byte offset is remembered per session, so each refresh transfers
+    only the delta. Keeps the last LOG_VIEW_LINES lines for display.
+    """
+    params = {}
+    if "log_offset" in st.session_state:
+        params["offset"] = st.session_state["log_offset"]
+    
+    response = get_session().get(f"{API_URL}/logs/tail", params=params, timeout=5)
+    response.raise_for_status()
+    tail = response.json()
+    
+    # Server restarted from an earlier offset (file rotated): drop old text
+    text = st.session_state.get("log_text", "")
+    if tail["offset"] != params.get("offset", tail["offset"]):
+        text = ""
+    
+    lines = (text + tail["data"]).splitlines(keepends=True)[-LOG_VIEW_LINES:]
+    st.session_state["log_text"] = "".join(lines)
+    st.session_state["log_offset"] = tail["next_offset"]
+    return st.session_state["log_text"]
 
 # System Status
 st.markdown("### 🔌 System Status")
@@ -65,32 +157,24 @@ with col1:
     st.text_input("API Base URL", value=API_URL, disabled=True)
 
 with col2:
-    if api_online:
-        try:
-            info_response = requests.get(f"{API_URL}/info", timeout=2)
-            if info_response.status_code == 200:
-                info_data = info_response.json()
-                st.text_input("API Version", value=info_data.get('version', 'Unknown'), disabled=True)
-        except:
-            pass
+    info_data = api_status["info"]
+    if info_data:
+        st.text_input("API Version", value=info_data.get('version', 'Unknown'), disabled=True)
 
 # View supported formats
 if st.button("📋 View Supported Audio Formats"):
-    try:
-        formats_response = requests.get(f"{API_URL}/api/v1/upload/formats", timeout=2)
-        if formats_response.status_code == 200:
-            formats_data = formats_response.json()
-            
-            st.markdown("**Supported Formats:**")
-            st.write(", ".join(formats_data.get('supported_formats', [])))
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("Max File Size", f"{formats_data.get('max_file_size_mb', 0)} MB")
-            with col2:
-                st.metric("Max Duration", f"{formats_data.get('max_duration_hours', 0)} hours")
-    except Exception as e:
-        st.error(f"Error: {str(e)}")
+    formats_data = api_status["formats"]
+    if formats_data:
+        st.markdown("**Supported Formats:**")
+        st.write(", ".join(formats_data.get('supported_formats', [])))
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Max File Size", f"{formats_data.get('max_file_size_mb', 0)} MB")
+        with col2:
+            st.metric("Max Duration", f"{formats_data.get('max_duration_hours', 0)} hours")
+    else:
+        st.error("Could not load supported formats from the API.")
 
 st.markdown("---")
 
@@ -179,8 +263,9 @@ with st.expander("🛠️ Troubleshooting Guide"):
     
     **Celery not processing:**
 ```bash
-    # Start Celery worker
-    python scripts/start_celery.py
+    # Start Celery workers (transcription + I/O fleets)
+    python scripts/start_celery.py gpu
+    python scripts/start_celery.py io
 ```
     
     **Upload fails:**
@@ -198,16 +283,22 @@ with st.expander("🛠️ Troubleshooting Guide"):
 with st.expander("📋 System Logs"):
     if st.button("Refresh Logs"):
         try:
-            # Try to get recent logs
-            log_file = Path("data/logs/app.log")
-            if log_file.exists():
-                with open(log_file, 'r') as f:
-                    logs = f.readlines()[-50:]  # Last 50 lines
-                    st.code("".join(logs), language="log")
+            # Only fetch what was appended since the last refresh
+            text = _refresh_logs()
+            if text:
+                st.code(text, language="log")
             else:
                 st.info("No log file found.")
-        except Exception as e:
-            st.error(f"Error reading logs: {str(e)}")
+        except Exception:
+            # API offline (or not in DEBUG): read the local file instead
+            try:
+                log_file = Path("data/logs/app.log")
+                if log_file.exists():
+                    st.code(_tail_lines(log_file, 50), language="log")  # Last 50 lines
+                else:
+                    st.info("No log file found.")
+            except Exception as e:
+                st.error(f"Error reading logs: {str(e)}")
 
 st.markdown("---")
 
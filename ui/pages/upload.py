@@ -7,33 +7,33 @@ Upload audio files for processing
 
 import streamlit as st
 import requests
+from websockets.sync.client import connect as ws_connect
+from websockets.exceptions import WebSocketException
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+import hashlib
 import time
-from datetime import datetime
+from datetime import date
 import sys
 from pathlib import Path
 
+# blake3 is a SIMD-accelerated, multithreaded hash (falls back to stdlib blake2b)
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from ui.components.api_client import get_session
+
 st.set_page_config(page_title="Upload Meeting", page_icon="📤", layout="wide")
 
-# Custom CSS
-st.markdown("""
+# Custom CSS (re-emitted every run: Streamlit drops elements a rerun
+# doesn't write, so injecting it once per session would lose the styles)
+UPLOAD_CSS = """
 <style>
-    .upload-zone {
-        border: 2px dashed #4CAF50;
-        border-radius: 10px;
-        padding: 3rem;
-        text-align: center;
-        background-color: #f8f9fa;
-        margin: 2rem 0;
-    }
-    
-    .processing-animation {
-        text-align: center;
-        padding: 2rem;
-    }
-    
     .success-box {
         background-color: #d4edda;
         border: 1px solid #c3e6cb;
@@ -42,7 +42,9 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(UPLOAD_CSS, unsafe_allow_html=True)
 
 st.title("📤 Upload Meeting")
 st.markdown("Upload your meeting audio file for AI-powered transcription and analysis.")
@@ -50,10 +52,207 @@ st.markdown("Upload your meeting audio file for AI-powered transcription and ana
 # Check API connection
 API_URL = "http://localhost:8000"
 
+WS_URL = "ws://localhost:8000"
+
+def _stream_status(meeting_id: int, on_update, max_wait: float):
+    """
+    Follow status frames pushed by /meetings/{id}/progress
+    
+    One WebSocket instead of a GET every few seconds; updates arrive as
+    soon as the server sees them.
+    
+    Returns:
+        Final status payload (status "completed"/"failed", plus "result"
+        once completed), or None on timeout
+    
+    Raises:
+        OSError / WebSocketException if the socket can't be used
+        (callers fall back to _poll_status)
+    """
+    deadline = time.monotonic() + max_wait
+    
+    with ws_connect(f"{WS_URL}/api/v1/meetings/{meeting_id}/progress", open_timeout=5) as ws:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            
+            try:
+                status_data = orjson.loads(ws.recv(timeout=remaining))
+            except TimeoutError:
+                return None
+            
+            on_update(status_data)
+            if status_data['status'] in ('completed', 'failed'):
+                return status_data
+
+# Status poll backoff bounds (seconds)
+POLL_MIN_DELAY = 1.0
+POLL_MAX_DELAY = 5.0
+
+def _poll_status(session: requests.Session, meeting_id: int, on_update, max_wait: float):
+    """
+    Poll GET /meetings/{id}/status (fallback when the WebSocket fails)
+    
+    Backs off exponentially (1s -> 1.5s -> ... capped at 5s) while progress
+    is unchanged, and drops back to 1s as soon as it moves, so long
+    processing steps cost few requests without slowing transitions.
+    
+    Returns:
+        Final status payload (as _stream_status), or None on timeout
+    """
+    # Built once and bound to locals: the loop may run hundreds of times
+    status_url = f"{API_URL}/api/v1/meetings/{meeting_id}/status"
+    get, sleep, now, loads = session.get, time.sleep, time.monotonic, orjson.loads
+    
+    deadline = now() + max_wait
+    delay = POLL_MIN_DELAY
+    last_progress = None
+    
+    while now() < deadline:
+        status_response = get(status_url, timeout=5)
+        
+        if status_response.status_code == 200:
+            status_data = loads(status_response.content)
+            on_update(status_data)
+            
+            if status_data['status'] in ('completed', 'failed'):
+                return status_data
+            
+            if status_data['progress'] == last_progress:
+                delay = min(delay * 1.5, POLL_MAX_DELAY)
+            else:
+                delay = POLL_MIN_DELAY
+                last_progress = status_data['progress']
+        
+        sleep(delay)
+    
+    return None
+
+@st.cache_resource
+def _executor() -> ThreadPoolExecutor:
+    """
+    Runs uploads (and the wait for processing) off the script thread
+    
+    Kept apart from the shared API pool: these jobs run for minutes and
+    would otherwise starve the short health/status probes.
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="upload")
+
+# (connect, read) seconds for the upload POST: the server answers as soon
+# as the file is in storage and queued, so the read wait only covers that
+# copy; a down API fails in 5s instead of 60s
+UPLOAD_TIMEOUT = (5, 30)
+
+def _audio_digest(buffer) -> str:
+    """
+    Content digest of an audio file, prefixed with the algorithm
+    
+    Sent to GET /upload/exists before the file itself; the prefix keeps
+    blake3 and blake2b digests from different clients apart.
+    """
+    if blake3 is not None:
+        return "blake3:" + blake3.blake3(buffer, max_threads=blake3.blake3.AUTO).hexdigest()
+    return "blake2b:" + hashlib.blake2b(buffer, digest_size=32).hexdigest()
+
+def _run_upload(session: requests.Session, job: dict, audio_file, data: dict, digests: dict) -> None:
+    """
+    Upload the file, then wait for processing (runs on the executor)
+    
+    Only updates `job` (progress, message, meeting_id, result, error);
+    nothing here touches st.*, the page renders the job on each tick.
+    
+    A file the server already has (same content digest) isn't sent
+    again; `digests` caches digests per uploaded file across submits.
+    """
+    # Zero-copy view of the UploadedFile's buffer: requests passes
+    # bytes-like objects through, so the multipart body is the only copy
+    # (a file object would be read() into another full copy first)
+    with audio_file.getbuffer() as buffer:
+        audio_hash = digests.get(audio_file.file_id)
+        if audio_hash is None:
+            job["message"] = "🔎 Checking for a previous upload..."
+            audio_hash = digests[audio_file.file_id] = _audio_digest(buffer)
+        
+        response = session.get(
+            f"{API_URL}/api/v1/upload/exists",
+            params={'hash': audio_hash},
+            timeout=5
+        )
+        uploaded = response.status_code != 200
+        
+        if uploaded:
+            job["message"] = "📤 Uploading file..."
+            response = session.post(
+                f"{API_URL}/api/v1/upload",
+                files={'file': (audio_file.name, buffer, audio_file.type)},
+                data={**data, 'audio_hash': audio_hash},
+                timeout=UPLOAD_TIMEOUT
+            )
+    
+    if response.status_code not in (200, 202):
+        job["error"] = f"❌ Upload failed: {response.text}"
+        return
+    
+    meeting_id = response.json()['meeting_id']
+    job.update(
+        meeting_id=meeting_id,
+        progress=40,
+        message="✅ File uploaded! Processing started..." if uploaded
+        else f"♻️ Already uploaded as meeting {meeting_id} (its existing details are kept)..."
+    )
+    
+    def show_status(status_data):
+        progress = status_data['progress']
+        
+        if status_data['status'] == 'completed':
+            job.update(progress=100, message="✅ Processing complete!")
+        elif status_data['status'] != 'failed':
+            job.update(
+                progress=min(40 + int(progress * 0.6), 100),
+                message=f"🔄 Processing... ({progress}%)"
+            )
+    
+    # Wait for processing (pushed over a WebSocket)
+    max_wait = 600  # 10 minutes max
+    start_time = time.time()
+    
+    try:
+        final_data = _stream_status(meeting_id, show_status, max_wait)
+    except (OSError, WebSocketException):
+        # API without the progress socket (or connection lost): poll
+        remaining = max_wait - (time.time() - start_time)
+        final_data = _poll_status(session, meeting_id, show_status, remaining)
+    
+    if final_data and final_data['status'] == 'failed':
+        job["error"] = "❌ Processing failed. Please try again."
+        return
+    
+    # The completed status already carries the preview
+    meeting_data = (final_data or {}).get('result')
+    
+    if meeting_data is None:
+        # Timed out waiting: fetch whatever the meeting has so far
+        meeting_response = session.get(f"{API_URL}/api/v1/meetings/{meeting_id}", timeout=10)
+        if meeting_response.status_code == 200:
+            meeting_data = orjson.loads(meeting_response.content)
+    
+    job["result"] = meeting_data
+
+@st.cache_data(ttl=10, show_spinner=False)
+def check_api() -> bool:
+    """
+    Health probe, cached for 10s so typing in the form doesn't hit /health
+    
+    Raises when the API is down, so an offline result is never cached
+    (the page notices a freshly started API on the next rerun).
+    """
+    get_session().get(f"{API_URL}/health", timeout=2).raise_for_status()
+    return True
+
 try:
-    health_response = requests.get(f"{API_URL}/health", timeout=2)
-    api_online = health_response.status_code == 200
-except:
+    api_online = check_api()
+except Exception:
     api_online = False
 
 if not api_online:
@@ -87,9 +286,13 @@ with st.form("upload_form"):
             help="Comma-separated list of participant names"
         )
         
+        # Fixed per session: the default doesn't shift past midnight
+        if '_default_date' not in st.session_state:
+            st.session_state['_default_date'] = date.today()
+        
         meeting_date = st.date_input(
             "Meeting Date",
-            value=datetime.now(),
+            value=st.session_state['_default_date'],
             help="When did this meeting occur?"
         )
     
@@ -103,7 +306,7 @@ with st.form("upload_form"):
     
     # Show file info
     if audio_file:
-        file_size_mb = len(audio_file.getvalue()) / (1024 * 1024)
+        file_size_mb = audio_file.size / (1024 * 1024)  # No copy of the file
         
         col1, col2, col3 = st.columns(3)
         col1.metric("Filename", audio_file.name)
@@ -113,127 +316,121 @@ with st.form("upload_form"):
         if file_size_mb > 500:
             st.error("❌ File too large! Maximum size is 500MB.")
         
-        # Estimated processing time
-        estimated_duration = file_size_mb * 10  # Rough estimate: 10 seconds per MB
-        estimated_processing = estimated_duration * 0.25  # 25% of duration
-        st.info(f"⏱️ Estimated processing time: ~{estimated_processing:.0f} seconds")
+        # Estimated processing time (recomputed only when the file changes,
+        # not on every keystroke in the form)
+        estimate_key = (audio_file.name, audio_file.size)
+        if st.session_state.get('_est_key') != estimate_key:
+            estimated_duration = file_size_mb * 10  # Rough estimate: 10 seconds per MB
+            st.session_state['_est_key'] = estimate_key
+            st.session_state['_est_seconds'] = estimated_duration * 0.25  # 25% of duration
+        st.info(f"⏱️ Estimated processing time: ~{st.session_state['_est_seconds']:.0f} seconds")
     
     submitted = st.form_submit_button("🚀 Upload and Process", type="primary", use_container_width=True)
 
 # Process upload
+# The upload and the wait for processing run on a worker thread; the page
+# only renders the job's latest state, so it never blocks on the network
+upload_job = st.session_state.get("upload_job")
+upload_running = upload_job is not None and not upload_job["future"].done()
+
 if submitted:
     if not title:
         st.error("❌ Please provide a meeting title.")
     elif not audio_file:
         st.error("❌ Please upload an audio file.")
+    elif upload_running:
+        st.warning("⏳ An upload is already in progress.")
     else:
-        # Create progress indicators
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        data = {
+            'title': title,
+            'description': description if description else '',
+            'participants': participants if participants else ''
+        }
         
-        try:
-            # Step 1: Upload file
-            status_text.text("📤 Uploading file...")
-            progress_bar.progress(20)
-            
-            files = {
-                'file': (audio_file.name, audio_file.getvalue(), audio_file.type)
-            }
-            
-            data = {
-                'title': title,
-                'description': description if description else '',
-                'participants': participants if participants else ''
-            }
-            
-            response = requests.post(
-                f"{API_URL}/api/v1/upload",
-                files=files,
-                data=data,
-                timeout=60
-            )
-            
-            if response.status_code != 200:
-                st.error(f"❌ Upload failed: {response.text}")
-                st.stop()
-            
-            result = response.json()
-            meeting_id = result['meeting_id']
-            
-            progress_bar.progress(40)
-            status_text.text("✅ File uploaded! Processing started...")
-            
-            # Step 2: Poll for status
-            max_wait = 600  # 10 minutes max
-            start_time = time.time()
-            
-            while time.time() - start_time < max_wait:
-                status_response = requests.get(
-                    f"{API_URL}/api/v1/meetings/{meeting_id}/status",
-                    timeout=5
-                )
-                
-                if status_response.status_code == 200:
-                    status_data = status_response.json()
-                    current_status = status_data['status']
-                    progress = status_data['progress']
-                    
-                    progress_bar.progress(min(40 + int(progress * 0.6), 100))
-                    
-                    if current_status == 'completed':
-                        status_text.text("✅ Processing complete!")
-                        progress_bar.progress(100)
-                        break
-                    elif current_status == 'failed':
-                        st.error("❌ Processing failed. Please try again.")
-                        st.stop()
-                    else:
-                        status_text.text(f"🔄 Processing... ({progress}%)")
-                
-                time.sleep(2)  # Poll every 2 seconds
-            
-            # Step 3: Show success
-            st.balloons()
-            
-            st.markdown("""
-            <div class="success-box">
-                <h3>✅ Meeting Processed Successfully!</h3>
-                <p>Your meeting has been transcribed and analyzed.</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.metric("Meeting ID", meeting_id)
-                st.metric("Status", "✅ Completed")
+        upload_job = {
+            "progress": 0,
+            "message": "📤 Uploading file...",
+            "meeting_id": None,
+            "result": None,
+            "error": None,
+            "celebrated": False
+        }
+        digests = st.session_state.setdefault("_audio_digests", {})
+        upload_job["future"] = _executor().submit(
+            _run_upload, get_session(), upload_job, audio_file, data, digests
+        )
+        st.session_state["upload_job"] = upload_job
+        upload_running = True
+
+@st.fragment(run_every=1)
+def render_upload_progress(job: dict):
+    """Progress of the running upload job (re-rendered every second)"""
+    if job["future"].done():
+        st.rerun()  # Full rerun shows the result
+    
+    st.progress(job["progress"])
+    st.text(job["message"])
+
+def render_upload_result(job: dict):
+    """Outcome of a finished upload job: error, or success with a preview"""
+    error = job["future"].exception()
+    if isinstance(error, requests.exceptions.Timeout):
+        st.error("❌ Request timeout. The server might be busy.")
+        return
+    if error:
+        st.error(f"❌ Error: {str(error)}")
+        return
+    if job["error"]:
+        st.error(job["error"])
+        return
+    
+    st.progress(100)
+    st.text(job["message"])
+    
+    if not job["celebrated"]:
+        st.balloons()
+        job["celebrated"] = True
+    
+    st.markdown("""
+    <div class="success-box">
+        <h3>✅ Meeting Processed Successfully!</h3>
+        <p>Your meeting has been transcribed and analyzed.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.metric("Meeting ID", job["meeting_id"])
+        st.metric("Status", "✅ Completed")
+    
+    with col2:
+        if st.button("📊 View Meeting Details", type="primary", use_container_width=True):
+            st.switch_page("pages/2_📊_Dashboard.py")
+    
+    # Show quick preview
+    meeting_data = job["result"]
+    
+    with st.expander("👀 Quick Preview", expanded=True):
+        if meeting_data:
+            st.markdown("**📝 Transcript Preview:**")
+            # Sliced once per job, not on every rerun while the result is shown
+            if "preview" not in job:
+                transcript = meeting_data.get('transcript') or ''
+                job["preview"] = transcript[:500] + "..." if len(transcript) > 500 else transcript
+            st.text(job["preview"])
             
-            with col2:
-                if st.button("📊 View Meeting Details", type="primary", use_container_width=True):
-                    st.switch_page("pages/2_📊_Dashboard.py")
+            st.markdown("**📋 Summary:**")
+            st.write(meeting_data.get('summary') or 'No summary available')
             
-            # Show quick preview
-            with st.expander("👀 Quick Preview", expanded=True):
-                meeting_response = requests.get(f"{API_URL}/api/v1/meetings/{meeting_id}")
-                
-                if meeting_response.status_code == 200:
-                    meeting_data = meeting_response.json()
-                    
-                    st.markdown("**📝 Transcript Preview:**")
-                    transcript = meeting_data.get('transcript', '')
-                    st.text(transcript[:500] + "..." if len(transcript) > 500 else transcript)
-                    
-                    st.markdown("**📋 Summary:**")
-                    st.write(meeting_data.get('summary', 'No summary available'))
-                    
-                    if meeting_data.get('key_topics'):
-                        st.markdown("**🔍 Topics:**")
-                        st.write(", ".join(meeting_data['key_topics']))
-        
-        except requests.exceptions.Timeout:
-            st.error("❌ Request timeout. The server might be busy.")
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
+            if meeting_data.get('key_topics'):
+                st.markdown("**🔍 Topics:**")
+                st.write(", ".join(meeting_data['key_topics']))
+
+if upload_running:
+    render_upload_progress(upload_job)
+elif upload_job:
+    render_upload_result(upload_job)
 
 # Sidebar info
 with st.sidebar: